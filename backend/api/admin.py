@@ -1,14 +1,26 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from .models import User, WebsiteSetup, BusinessInfo
+from .models import User, WebsiteSetup, BusinessInfo, Product, Department, Doctor, Order, OrderItem, Appointment, Review, Payment, PaymentEvent
+from .pagination import EstimatedCountPaginator
+
+
+class LargeTableMixin:
+    """
+    Changelist settings for tables with a row per tenant or more: estimated
+    totals instead of COUNT(*) over the whole table, and no second count
+    of the unfiltered table next to search results.
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(User)
-class UserAdmin(BaseUserAdmin):
+class UserAdmin(LargeTableMixin, BaseUserAdmin):
     """Admin interface for User model"""
     list_display = ['email', 'name', 'business_type', 'is_active', 'created_at']
     list_filter = ['business_type', 'is_active', 'created_at']
-    search_fields = ['email', 'name']
+    # Prefix searches, served by the upper(email)/upper(name) indexes
+    search_fields = ['^email', '^name']
     ordering = ['-created_at']
     
     fieldsets = BaseUserAdmin.fieldsets + (
@@ -17,19 +29,124 @@ class UserAdmin(BaseUserAdmin):
 
 
 @admin.register(WebsiteSetup)
-class WebsiteSetupAdmin(admin.ModelAdmin):
+class WebsiteSetupAdmin(LargeTableMixin, admin.ModelAdmin):
     """Admin interface for WebsiteSetup model"""
     list_display = ['user', 'is_paid', 'total_price', 'template_id', 'created_at']
     list_filter = ['is_paid', 'created_at']
+    list_select_related = ['user']
+    raw_id_fields = ['user']
+    ordering = ['-created_at']
     search_fields = ['user__email', 'user__name']
     readonly_fields = ['id', 'created_at', 'updated_at']
 
 
 @admin.register(BusinessInfo)
-class BusinessInfoAdmin(admin.ModelAdmin):
+class BusinessInfoAdmin(LargeTableMixin, admin.ModelAdmin):
     """Admin interface for BusinessInfo model"""
     list_display = ['name', 'website_setup', 'is_published', 'contact_phone', 'created_at']
     list_filter = ['is_published', 'created_at']
+    # WebsiteSetup.__str__ reads the user's name
+    list_select_related = ['website_setup__user']
+    raw_id_fields = ['website_setup']
+    ordering = ['-created_at']
     search_fields = ['name', 'contact_email', 'contact_phone']
     readonly_fields = ['id', 'created_at', 'updated_at']
 
+
+@admin.register(Product)
+class ProductAdmin(LargeTableMixin, admin.ModelAdmin):
+    """Admin interface for Product model"""
+    list_display = ['name', 'sku', 'category', 'price', 'in_stock', 'stock', 'website_setup', 'created_at']
+    list_filter = ['in_stock', 'created_at']
+    list_select_related = ['website_setup__user']
+    raw_id_fields = ['website_setup']
+    search_fields = ['name', 'sku', 'category']
+    readonly_fields = ['id', 'created_at', 'updated_at']
+
+
+@admin.register(Department)
+class DepartmentAdmin(LargeTableMixin, admin.ModelAdmin):
+    """Admin interface for Department model"""
+    list_display = ['name', 'website_setup', 'created_at']
+    list_select_related = ['website_setup__user']
+    raw_id_fields = ['website_setup']
+    search_fields = ['name']
+    readonly_fields = ['id', 'created_at', 'updated_at']
+
+
+@admin.register(Doctor)
+class DoctorAdmin(LargeTableMixin, admin.ModelAdmin):
+    """Admin interface for Doctor model"""
+    list_display = ['name', 'title', 'specialization', 'department', 'created_at']
+    list_select_related = ['department']
+    raw_id_fields = ['department']
+    search_fields = ['name', 'specialization', 'email']
+    readonly_fields = ['id', 'created_at', 'updated_at']
+
+
+class OrderItemInline(admin.TabularInline):
+    model = OrderItem
+    extra = 0
+    raw_id_fields = ['product']
+
+
+@admin.register(Order)
+class OrderAdmin(LargeTableMixin, admin.ModelAdmin):
+    """Admin interface for Order model"""
+    list_display = ['order_number', 'customer_name', 'status', 'total', 'website_setup', 'created_at']
+    list_filter = ['status', 'payment_method', 'created_at']
+    list_select_related = ['website_setup__user']
+    raw_id_fields = ['website_setup']
+    search_fields = ['order_number', 'customer_name', 'customer_email']
+    readonly_fields = ['id', 'idempotency_key', 'created_at', 'updated_at']
+    inlines = [OrderItemInline]
+
+
+@admin.register(Appointment)
+class AppointmentAdmin(LargeTableMixin, admin.ModelAdmin):
+    """Admin interface for Appointment model"""
+    list_display = ['reference', 'patient_name', 'doctor_name', 'date', 'time', 'status', 'created_at']
+    list_filter = ['status', 'date']
+    list_select_related = ['doctor']
+    raw_id_fields = ['website_setup', 'department', 'doctor']
+    search_fields = ['reference', 'patient_name', 'patient_email']
+    readonly_fields = ['id', 'created_at', 'updated_at']
+
+
+@admin.register(Review)
+class ReviewAdmin(LargeTableMixin, admin.ModelAdmin):
+    """Admin interface for Review model"""
+    list_display = ['doctor', 'reviewer_name', 'rating', 'created_at']
+    list_filter = ['rating', 'created_at']
+    list_select_related = ['doctor']
+    search_fields = ['reviewer_name', 'comment']
+    # Summaries are only updated on insert/delete, so ratings can't be edited
+    readonly_fields = ['id', 'website_setup', 'doctor', 'rating', 'created_at']
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(Payment)
+class PaymentAdmin(LargeTableMixin, admin.ModelAdmin):
+    """Admin interface for Payment model"""
+    list_display = ['transaction_id', 'website_setup', 'amount', 'method', 'status', 'created_at']
+    list_filter = ['status', 'method', 'created_at']
+    list_select_related = ['website_setup__user']
+    raw_id_fields = ['website_setup']
+    search_fields = ['transaction_id']
+    readonly_fields = ['id', 'created_at', 'updated_at']
+
+
+@admin.register(PaymentEvent)
+class PaymentEventAdmin(LargeTableMixin, admin.ModelAdmin):
+    """Webhook inbox, read-only: events are appended by gateways and applied by the worker"""
+    list_display = ['transaction_id', 'provider', 'status', 'received_at', 'processed_at', 'error']
+    list_filter = ['provider', 'status', 'received_at']
+    search_fields = ['transaction_id']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,144 @@
+"""
+JWT authentication backed by profile claims carried in the token.
+
+Access tokens embed the user's id, email, name, business_type, creation time
+and ``token_version``. While the version in the token matches the one recorded in
+the shared cache, requests are authenticated with a lightweight ``User``
+instance built from those claims; every other field is deferred and loaded
+from the database only if a view touches it. A stale or unknown version falls
+back to the regular database lookup.
+"""
+import uuid
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .models import User
+
+# User fields copied into the token, keyed by claim name
+USER_CLAIMS = {
+    'email': 'email',
+    'name': 'name',
+    'business_type': 'business_type',
+    'created_at': 'created_at',
+    'ver': 'token_version',
+}
+
+# Saving any of these makes previously issued claims stale
+CLAIM_SOURCE_FIELDS = {'email', 'name', 'business_type', 'is_active'}
+
+
+def _version_key(user_id):
+    return f'user-token-version:{user_id}'
+
+
+def get_cached_user_version(user_id):
+    return cache.get(_version_key(user_id))
+
+
+def cache_user_version(user):
+    cache.set(
+        _version_key(user.pk),
+        user.token_version,
+        timeout=settings.USER_TOKEN_VERSION_CACHE_TIMEOUT
+    )
+
+
+def forget_user_version(user_id):
+    cache.delete(_version_key(user_id))
+
+
+def add_user_claims(token, user):
+    """Stamp the profile claims of ``user`` onto ``token``"""
+    for claim, field in USER_CLAIMS.items():
+        value = getattr(user, field)
+        token[claim] = value.isoformat() if isinstance(value, datetime) else value
+    return token
+
+
+class ClaimsRefreshToken(RefreshToken):
+    """Refresh token whose access tokens carry the user's profile claims"""
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        cache_user_version(user)
+        return add_user_claims(token, user)
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """Re-stamp fresh profile claims whenever an access token is refreshed"""
+    token_class = ClaimsRefreshToken
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+
+        user = User.objects.filter(
+            pk=refresh[api_settings.USER_ID_CLAIM], is_active=True
+        ).first()
+        if user is None:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+        add_user_claims(refresh, user)
+        cache_user_version(user)
+
+        data = {'access': str(refresh.access_token)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                try:
+                    refresh.blacklist()
+                except AttributeError:
+                    # Blacklist app not installed
+                    pass
+
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+
+            data['refresh'] = str(refresh)
+
+        return data
+
+
+def claims_user(validated_token):
+    """Build a ``User`` from token claims, deferring every other field"""
+    values = {
+        'id': uuid.UUID(str(validated_token[api_settings.USER_ID_CLAIM])),
+        'is_active': True,
+    }
+    for claim, field in USER_CLAIMS.items():
+        values[field] = validated_token[claim]
+    values['created_at'] = parse_datetime(values['created_at'])
+
+    field_names = [
+        field.attname for field in User._meta.concrete_fields
+        if field.attname in values
+    ]
+    return User.from_db(
+        DEFAULT_DB_ALIAS, field_names, [values[name] for name in field_names]
+    )
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication that skips the user query while token claims are current"""
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        has_claims = all(claim in validated_token for claim in USER_CLAIMS)
+
+        if user_id is not None and has_claims:
+            if validated_token['ver'] == get_cached_user_version(user_id):
+                return claims_user(validated_token)
+
+        user = super().get_user(validated_token)
+        cache_user_version(user)
+        return user
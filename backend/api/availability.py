@@ -0,0 +1,271 @@
+"""
+Appointment availability for hospital doctors.
+
+Each worker keeps a compiled schedule per doctor: the doctor's weekly slots,
+the hospital's working hours as minute-of-week intervals (see ``api.hours``)
+and a sorted list of booked start times. A booked start is a "minute key"
+(local date ordinal * 1440 + minute of day), so checking a slot against every
+booking is a bisect, and listing free slots over N days never queries the
+database once the schedule is warm.
+
+Schedules are keyed by the site version (working hours) and a per-doctor
+schedule version in the shared cache. Bookings and cancellations update the
+schedule in place in the process that made them; other processes rebuild
+it with two queries the next time it is used.
+
+Booking takes a row lock on the doctor, so only bookings for the same doctor
+wait on each other, and re-checks the day's bookings in the database before
+inserting.
+"""
+import bisect
+import secrets
+import string
+import threading
+import time as time_module
+from datetime import date, time, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .cache import LocalCache, bump_version, get_site_version, get_version
+from .hours import MINUTES_PER_DAY, compile_working_hours, covers
+from .models import Appointment, Doctor
+from .opening import business_timezone
+
+REFERENCE_ALPHABET = string.ascii_lowercase + string.digits
+
+
+class SlotUnavailable(Exception):
+    """Raised when a requested slot is not offered or already booked"""
+
+
+def minute_key(day, clock):
+    return day.toordinal() * MINUTES_PER_DAY + clock.hour * 60 + clock.minute
+
+
+def from_minute_key(key):
+    day, minutes = divmod(key, MINUTES_PER_DAY)
+    return date.fromordinal(day), time(minutes // 60, minutes % 60)
+
+
+class DoctorSchedule:
+    """Compiled weekly slots, working hours and bookings of one doctor"""
+
+    def __init__(self, doctor_id, site_id, slots, working_hours, tz, site_version, version):
+        self.doctor_id = doctor_id
+        self.site_id = site_id
+        # Slots and working hours are both in the hospital's local time
+        self.tz = tz
+        self.site_version = site_version
+        self.version = version
+        self.duration = settings.APPOINTMENT_SLOT_MINUTES
+        # Python weekday (0 = Monday) -> sorted minutes of day
+        self.weekly = {}
+        for slot in slots or []:
+            try:
+                hours, minutes = map(int, slot['time'].split(':'))
+                weekday = (int(slot['dayOfWeek']) - 1) % 7
+            except (KeyError, TypeError, ValueError, AttributeError):
+                continue
+            self.weekly.setdefault(weekday, set()).add(hours * 60 + minutes)
+        self.weekly = {day: sorted(minutes) for day, minutes in self.weekly.items()}
+        # No working hours configured means the doctor's slots are the only constraint
+        self.hours = compile_working_hours(working_hours) if working_hours else None
+        self._starts = []
+        self._bookings = {}
+        self._lock = threading.Lock()
+
+    def add_booking(self, appointment_id, key):
+        with self._lock:
+            self._remove(appointment_id)
+            self._bookings[appointment_id] = key
+            bisect.insort(self._starts, (key, str(appointment_id)))
+
+    def remove_booking(self, appointment_id):
+        with self._lock:
+            self._remove(appointment_id)
+
+    def _remove(self, appointment_id):
+        key = self._bookings.pop(appointment_id, None)
+        if key is not None:
+            del self._starts[bisect.bisect_left(self._starts, (key, str(appointment_id)))]
+
+    def is_booked(self, key):
+        """True if a booking overlaps ``[key, key + duration)``"""
+        with self._lock:
+            index = bisect.bisect_left(self._starts, (key - self.duration + 1,))
+            return index < len(self._starts) and self._starts[index][0] < key + self.duration
+
+    def local_now(self):
+        """Current naive local time of the hospital"""
+        return timezone.localtime(timezone=self.tz).replace(tzinfo=None)
+
+    def offers(self, day, minutes):
+        """True if the doctor has a slot at ``minutes`` on ``day`` within working hours"""
+        if minutes not in self.weekly.get(day.weekday(), ()):
+            return False
+        if self.hours is None:
+            return True
+        start = day.weekday() * MINUTES_PER_DAY + minutes
+        return covers(self.hours, start, start + self.duration)
+
+    def free_slots(self, now, days, limit):
+        """Free slots from ``now`` (local) over the next ``days`` days"""
+        now_key = minute_key(now.date(), now.time())
+        slots = []
+        for offset in range(days):
+            day = now.date() + timedelta(days=offset)
+            for minutes in self.weekly.get(day.weekday(), ()):
+                key = day.toordinal() * MINUTES_PER_DAY + minutes
+                if key <= now_key or not self.offers(day, minutes) or self.is_booked(key):
+                    continue
+                slots.append(from_minute_key(key))
+                if len(slots) >= limit:
+                    return slots
+        return slots
+
+
+def _doctor_key(doctor_id):
+    return f'doctor-schedule:{doctor_id}'
+
+
+_schedules = LocalCache(maxsize=settings.SCHEDULE_CACHE_SIZE)
+
+
+def build_schedule(site_id, doctor_id):
+    """Load a doctor's schedule with two queries, or None if not on this site"""
+    # Versions are read first so changes made while loading trigger a rebuild
+    site_version = get_site_version(site_id)
+    version = get_version(_doctor_key(doctor_id))
+    doctor = (
+        Doctor.objects
+        .filter(pk=doctor_id, department__website_setup_id=site_id)
+        .values(
+            'slots',
+            'department__website_setup__business_info__working_hours',
+            'department__website_setup__business_info__timezone',
+        )
+        .first()
+    )
+    if doctor is None:
+        return None
+
+    schedule = DoctorSchedule(
+        doctor_id, site_id, doctor['slots'],
+        doctor['department__website_setup__business_info__working_hours'],
+        business_timezone(doctor['department__website_setup__business_info__timezone']),
+        site_version, version,
+    )
+    yesterday = schedule.local_now().date() - timedelta(days=1)
+    bookings = (
+        Appointment.objects
+        .filter(doctor_id=doctor_id, date__gte=yesterday)
+        .exclude(status='cancelled')
+        .values_list('id', 'date', 'time')
+    )
+    for appointment_id, day, clock in bookings:
+        schedule.add_booking(appointment_id, minute_key(day, clock))
+    return schedule
+
+
+def get_schedule(site_id, doctor_id):
+    schedule = _schedules.get(doctor_id)
+    if (
+        schedule is not None
+        and schedule.site_id == site_id
+        and schedule.site_version == get_site_version(site_id)
+        and schedule.version == get_version(_doctor_key(doctor_id))
+    ):
+        return schedule
+    schedule = build_schedule(site_id, doctor_id)
+    if schedule is not None:
+        _schedules.set(doctor_id, schedule)
+    return schedule
+
+
+def available_slots(schedule, days, limit):
+    return schedule.free_slots(schedule.local_now(), days, limit)
+
+
+def new_reference():
+    # Same shape as the references the browser generated (APT-<ms>-<random>)
+    suffix = ''.join(secrets.choice(REFERENCE_ALPHABET) for _ in range(6))
+    return f'APT-{int(time_module.time() * 1000)}-{suffix}'
+
+
+def book_appointment(schedule, data):
+    """
+    Book ``data['date']`` at ``data['time']`` with the schedule's doctor.
+    Raises ``SlotUnavailable`` when the slot isn't offered or is taken.
+    """
+    day, clock = data['date'], data['time']
+    key = minute_key(day, clock)
+    now = schedule.local_now()
+    horizon = now.date() + timedelta(days=settings.APPOINTMENT_MAX_DAYS_AHEAD)
+    if key <= minute_key(now.date(), now.time()) or day > horizon:
+        raise SlotUnavailable('This slot is in the past or too far ahead.')
+    if not schedule.offers(day, clock.hour * 60 + clock.minute):
+        raise SlotUnavailable('The doctor does not offer this slot.')
+    # Fast path: most conflicts are caught here without touching the database
+    if schedule.is_booked(key):
+        raise SlotUnavailable('This slot is already booked.')
+
+    with transaction.atomic():
+        doctor = (
+            Doctor.objects
+            .select_for_update()
+            .select_related('department')
+            .get(pk=schedule.doctor_id)
+        )
+        taken = (
+            Appointment.objects
+            .filter(doctor=doctor, date=day)
+            .exclude(status='cancelled')
+            .values_list('time', flat=True)
+        )
+        if any(abs(minute_key(day, other) - key) < schedule.duration for other in taken):
+            raise SlotUnavailable('This slot is already booked.')
+        return Appointment.objects.create(
+            website_setup_id=schedule.site_id,
+            reference=new_reference(),
+            department=doctor.department,
+            doctor=doctor,
+            department_name=doctor.department.name,
+            doctor_name=doctor.name,
+            patient_name=data['patient_name'],
+            patient_email=data.get('patient_email', ''),
+            patient_phone=data.get('patient_phone', ''),
+            date=day,
+            time=clock,
+            reason=data.get('reason', ''),
+        )
+
+
+def appointment_changed(doctor_id, appointment_id, key=None):
+    """
+    Record a booking (``key``) or its removal once the transaction commits,
+    updating this process's schedule in place when it is otherwise current.
+    """
+    if doctor_id is None:
+        return
+
+    def apply(version):
+        schedule = _schedules.get(doctor_id)
+        if schedule is None:
+            return
+        if schedule.version != version - 1:
+            _schedules.delete(doctor_id)
+            return
+        if key is None:
+            schedule.remove_booking(appointment_id)
+        else:
+            schedule.add_booking(appointment_id, key)
+        schedule.version = version
+
+    bump_version(_doctor_key(doctor_id), on_bumped=apply)
+
+
+def schedule_changed(doctor_id):
+    """Invalidate a doctor's compiled schedule everywhere, e.g. after editing slots"""
+    bump_version(_doctor_key(doctor_id))
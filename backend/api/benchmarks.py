@@ -0,0 +1,430 @@
+"""
+Latency benchmark of every API endpoint.
+
+Endpoints are discovered from ``api.urls`` (router viewsets included), so new
+ones are covered without edits, and driven through the Django test client
+against tenants made by ``manage.py generate_tenants``: a published pharmacy
+for the catalog and order endpoints, a published hospital with reviews on
+for the directory, booking and review endpoints. Path arguments are filled
+in from those tenants; detail routes (``<pk>``) use the first row their list
+route returns.
+
+Every endpoint that answers GET is timed. State-changing requests are timed
+only where ``SCENARIOS`` knows how to repeat them (logins, signups, checkouts,
+bookings, reviews, webhooks, syncs); the rest would consume or corrupt the
+fixtures (deletes, cancellations, publishing) and are reported as skipped.
+
+For each endpoint the report has p50/p95/p99 and mean latency, throughput of
+back-to-back requests, database queries per request and the status codes
+seen. Run with ``manage.py benchmark_endpoints``.
+"""
+import json
+import logging
+import math
+import subprocess
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLResolver, reverse
+from django.utils import timezone
+
+from .authentication import ClaimsRefreshToken
+from .models import Doctor, Payment, Product, WebsiteSetup
+from .payments import FakeGateway, start_payment
+
+# Accounts made by ``generate_tenants`` share this domain and password
+BENCHMARK_EMAIL_DOMAIN = 'bench.medify.test'
+BENCHMARK_PASSWORD = 'benchmark-password'
+
+PERCENTILES = (50, 95, 99)
+
+# Endpoints benchmarked as the hospital tenant; everything else uses the pharmacy
+HOSPITAL_ENDPOINTS = (
+    'department-', 'doctor-', 'appointment-', 'review-',
+    'site_directory', 'doctor_availability', 'doctor_reviews', 'book_appointment',
+)
+
+QUERY_PARAMS = {
+    'nearby_businesses': {'lat': '30.0444', 'lng': '31.2357'},
+    'public_product_search': {'q': 'vitamins'},
+    'pricing_quote': {'features': 'review_system,ai_chatbot'},
+    'doctor_availability': {'days': '14'},
+}
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+@dataclass
+class Endpoint:
+    name: str
+    method: str
+    route: str
+    path: str = ''
+    prepare: object = None
+    skipped: str = ''
+    timings: list = field(default_factory=list)
+    queries: list = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+
+    @property
+    def key(self):
+        return f'{self.method.upper()} {self.name}'
+
+    def summary(self):
+        ordered = sorted(self.timings)
+        total = sum(ordered)
+        result = {
+            'name': self.name,
+            'method': self.method.upper(),
+            'route': self.route,
+            'requests': len(ordered),
+            'status_codes': {str(code): count for code, count in sorted(self.statuses.items())},
+            'mean_ms': round(total / len(ordered) * 1000, 3),
+            'rps': round(len(ordered) / total, 1) if total else None,
+            'queries_mean': round(sum(self.queries) / len(self.queries), 2),
+            'queries_max': max(self.queries),
+        }
+        for percentile in PERCENTILES:
+            # Nearest-rank percentile
+            rank = max(math.ceil(percentile / 100 * len(ordered)) - 1, 0)
+            result[f'p{percentile}_ms'] = round(ordered[rank] * 1000, 3)
+        return result
+
+
+def iter_patterns(patterns, prefix=''):
+    """``(route, URLPattern)`` of every leaf pattern, includes resolved"""
+    for entry in patterns:
+        if isinstance(entry, URLResolver):
+            yield from iter_patterns(entry.url_patterns, prefix + str(entry.pattern))
+        else:
+            yield prefix + str(entry.pattern), entry
+
+
+def allowed_methods(callback):
+    """HTTP methods a view callback answers, in the order they are benchmarked"""
+    actions = getattr(callback, 'actions', None)
+    if actions is not None:
+        methods = set(actions)
+    else:
+        view_class = getattr(callback, 'cls', None) or getattr(callback, 'view_class', None)
+        if view_class is None:
+            return ['get']
+        methods = {
+            method for method in view_class.http_method_names
+            if method not in ('head', 'options', 'trace') and hasattr(view_class, method)
+        }
+    return [method for method in ('post', 'get', 'put', 'patch', 'delete') if method in methods]
+
+
+def requires_auth(callback):
+    view_class = getattr(callback, 'cls', None)
+    return bool(view_class and view_class.authentication_classes)
+
+
+class Fixtures:
+    """The generated tenants and the rows the scenarios need"""
+
+    def __init__(self):
+        generated = (
+            WebsiteSetup.objects
+            .filter(user__email__endswith=f'@{BENCHMARK_EMAIL_DOMAIN}', business_info__is_published=True)
+            .select_related('user')
+            .order_by('id')
+        )
+        self.pharmacy = generated.filter(user__business_type='pharmacy').first()
+        self.hospital = generated.filter(user__business_type='hospital', review_system=True).first()
+        if self.pharmacy is None or self.hospital is None:
+            raise BenchmarkError(
+                'No generated tenants found; run manage.py generate_tenants first.'
+            )
+        self.doctors = list(
+            Doctor.objects.filter(department__website_setup=self.hospital).order_by('id').values_list('id', flat=True)
+        )
+        self.doctor = self.doctors[0] if self.doctors else None
+        self.product = (
+            Product.objects.filter(website_setup=self.pharmacy, stock__isnull=True).order_by('id')
+            .values_list('id', flat=True).first()
+        )
+        self.run = int(time.time())
+        self._headers = {}
+        self._free_slots = []
+
+    def tenant(self, name):
+        return self.hospital if name.startswith(HOSPITAL_ENDPOINTS) else self.pharmacy
+
+    def auth_headers(self, setup):
+        if setup.pk not in self._headers:
+            token = ClaimsRefreshToken.for_user(setup.user).access_token
+            self._headers[setup.pk] = {'Authorization': f'Bearer {token}'}
+        return self._headers[setup.pk]
+
+    def payment(self):
+        """A payment of the pharmacy to send webhooks about"""
+        payment = Payment.objects.filter(website_setup=self.pharmacy).order_by('-created_at').first()
+        return payment or start_payment(self.pharmacy, 'visa')
+
+    def free_slot(self, client):
+        """Next free slot of any of the hospital's doctors, via the availability endpoint"""
+        while not self._free_slots and self.doctors:
+            doctor_id = self.doctors.pop(0)
+            path = reverse('doctor_availability', kwargs={'site_id': self.hospital.pk, 'doctor_id': doctor_id})
+            response = client.get(path, {'days': settings.APPOINTMENT_MAX_DAYS_AHEAD})
+            self._free_slots = [(doctor_id, slot) for slot in response.json().get('slots', [])]
+        if not self._free_slots:
+            raise BenchmarkError('The hospital has no free slots left.')
+        return self._free_slots.pop(0)
+
+
+def _login(fixtures, client, iteration):
+    return {'data': {'email': fixtures.pharmacy.user.email, 'password': BENCHMARK_PASSWORD},
+            'content_type': 'application/json'}
+
+
+def _signup(fixtures, client, iteration):
+    return {'data': {
+        'email': f'signup-{fixtures.run}-{iteration}@{BENCHMARK_EMAIL_DOMAIN}',
+        'password': BENCHMARK_PASSWORD,
+        'password_confirm': BENCHMARK_PASSWORD,
+        'name': 'Benchmark Signup',
+        'business_type': 'pharmacy',
+    }, 'content_type': 'application/json'}
+
+
+def _token_refresh(fixtures, client, iteration):
+    # Refresh tokens are blacklisted once rotated, so every request needs a new one
+    return {'data': {'refresh': str(ClaimsRefreshToken.for_user(fixtures.pharmacy.user))},
+            'content_type': 'application/json'}
+
+
+def _checkout(fixtures, client, iteration):
+    if fixtures.product is None:
+        raise BenchmarkError('The pharmacy has no untracked products to order.')
+    return {'data': {
+        'customer_name': 'Benchmark Customer',
+        'customer_email': f'customer@{BENCHMARK_EMAIL_DOMAIN}',
+        'items': [{'product': str(fixtures.product), 'quantity': 1}],
+    }, 'content_type': 'application/json'}
+
+
+def _book_appointment(fixtures, client, iteration):
+    doctor_id, slot = fixtures.free_slot(client)
+    return {
+        'path': reverse('book_appointment', kwargs={'site_id': fixtures.hospital.pk, 'doctor_id': doctor_id}),
+        'data': {'patient_name': 'Benchmark Patient', **slot},
+        'content_type': 'application/json',
+    }
+
+
+def _review(fixtures, client, iteration):
+    return {'data': {'reviewer_name': 'Benchmark Patient', 'rating': iteration % 5 + 1, 'comment': 'Benchmark'},
+            'content_type': 'application/json'}
+
+
+def _payment_webhook(fixtures, client, iteration):
+    payment = fixtures.payment()
+    body, signature = FakeGateway('visa').webhook(payment.transaction_id, 'completed', payment.amount)
+    return {'data': body, 'content_type': 'application/json', 'headers': {'X-Signature': signature}}
+
+
+def _order_sync(fixtures, client, iteration):
+    # Fixed keys: the first request creates the orders, the rest update them
+    records = [
+        {'orderNumber': f'BENCH-{number}', 'customerName': 'Benchmark Customer', 'total': '25.00',
+         'status': 'completed', 'createdAt': timezone.now().isoformat(), 'items': []}
+        for number in range(10)
+    ]
+    return {'data': '\n'.join(map(json.dumps, records)), 'content_type': 'application/x-ndjson',
+            'headers': fixtures.auth_headers(fixtures.pharmacy)}
+
+
+def _appointment_sync(fixtures, client, iteration):
+    records = [
+        {'id': f'BENCH-APT-{number}', 'patientName': 'Benchmark Patient', 'status': 'completed',
+         'preferredDate': timezone.localdate().isoformat(), 'preferredTime': '10:00',
+         'createdAt': timezone.now().isoformat()}
+        for number in range(10)
+    ]
+    return {'data': '\n'.join(map(json.dumps, records)), 'content_type': 'application/x-ndjson',
+            'headers': fixtures.auth_headers(fixtures.hospital)}
+
+
+# Repeatable state-changing requests by url name; they run before the GETs,
+# so the orders, appointments and reviews they create have detail routes to read
+SCENARIOS = {
+    ('post', 'login'): _login,
+    ('post', 'signup'): _signup,
+    ('post', 'token_refresh'): _token_refresh,
+    ('post', 'checkout'): _checkout,
+    ('post', 'book_appointment'): _book_appointment,
+    ('post', 'doctor_reviews'): _review,
+    ('post', 'payment_webhook'): _payment_webhook,
+    ('post', 'order-sync'): _order_sync,
+    ('post', 'appointment-sync'): _appointment_sync,
+}
+
+
+def _path_kwargs(fixtures, client, name, pattern):
+    setup = fixtures.tenant(name)
+    kwargs = {}
+    for argument in pattern.pattern.regex.groupindex:
+        if argument == 'site_id':
+            kwargs[argument] = setup.pk
+        elif argument == 'doctor_id':
+            kwargs[argument] = fixtures.doctor
+        elif argument == 'provider':
+            kwargs[argument] = 'visa'
+        elif argument == 'pk':
+            basename = name.rsplit('-', 1)[0]
+            response = client.get(reverse(f'{basename}-list'), headers=fixtures.auth_headers(setup))
+            payload = response.json() if response.status_code == 200 else []
+            if isinstance(payload, dict):
+                # Paginated, or the one row of a per-user resource
+                payload = payload['results'] if 'results' in payload else [payload]
+            kwargs[argument] = payload[0].get('id') if payload else None
+        else:
+            kwargs[argument] = None
+        if kwargs[argument] is None:
+            raise BenchmarkError(f'Nothing to fill in for <{argument}>.')
+    return kwargs
+
+
+def _get(fixtures, name, auth):
+    setup = fixtures.tenant(name)
+
+    def prepare(fixtures, client, iteration):
+        request = {'data': QUERY_PARAMS.get(name, {})}
+        if auth:
+            request['headers'] = fixtures.auth_headers(setup)
+        return request
+    return prepare
+
+
+def discover(fixtures, client, only=None):
+    """Every endpoint/method of ``api.urls``: scenarios first, then GETs"""
+    from . import urls
+
+    scenarios, reads = [], []
+    for route, pattern in iter_patterns(urls.urlpatterns, 'api/'):
+        if not pattern.name or 'format' in pattern.pattern.regex.groupindex:
+            continue
+        for method in allowed_methods(pattern.callback):
+            endpoint = Endpoint(pattern.name, method, route)
+            if only and not any(text in endpoint.key or text in route for text in only):
+                continue
+            if method == 'get':
+                endpoint.prepare = _get(fixtures, pattern.name, requires_auth(pattern.callback))
+                reads.append((endpoint, pattern))
+            elif (method, pattern.name) in SCENARIOS:
+                endpoint.prepare = SCENARIOS[method, pattern.name]
+                scenarios.append((endpoint, pattern))
+            else:
+                endpoint.skipped = 'changes the fixtures and has no scenario'
+                scenarios.append((endpoint, pattern))
+    order = {key: position for position, key in enumerate(SCENARIOS)}
+    scenarios.sort(key=lambda item: order.get((item[0].method, item[0].name), len(order)))
+    return scenarios + reads
+
+
+def measure(endpoint, fixtures, client, iterations, warmup):
+    for iteration in range(warmup + iterations):
+        request = endpoint.prepare(fixtures, client, iteration)
+        path = request.pop('path', endpoint.path)
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            response = getattr(client, endpoint.method)(path, **request)
+            elapsed = time.perf_counter() - started
+        if iteration >= warmup:
+            endpoint.timings.append(elapsed)
+            endpoint.queries.append(len(captured))
+            endpoint.statuses[response.status_code] += 1
+
+
+def benchmark_settings(throttle=False):
+    """Settings overrides for running the benchmark in-process"""
+    overrides = {
+        'ALLOWED_HOSTS': [*settings.ALLOWED_HOSTS, 'testserver'],
+        # Webhook events stay in the inbox; applying them from a thread of
+        # this process would contend with the requests being timed
+        'PAYMENT_EVENTS_IN_PROCESS': False,
+        # The webhook scenario signs its own deliveries (FakeGateway)
+        'PAYMENT_WEBHOOK_SECRETS': {
+            provider: secret or 'benchmark-webhook-secret'
+            for provider, secret in settings.PAYMENT_WEBHOOK_SECRETS.items()
+        },
+    }
+    if not throttle:
+        rates = settings.REST_FRAMEWORK.get('DEFAULT_THROTTLE_RATES', {})
+        overrides['REST_FRAMEWORK'] = {
+            **settings.REST_FRAMEWORK,
+            'DEFAULT_THROTTLE_RATES': dict.fromkeys(rates, '1000000/min'),
+        }
+    return override_settings(**overrides)
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(iterations=50, warmup=5, only=None, throttle=False, progress=None):
+    """The report as a JSON-ready dict; see the module docstring"""
+    # 4xx answers are part of the results, not worth a warning each
+    request_logger = logging.getLogger('django.request')
+    level = request_logger.level
+    request_logger.setLevel(logging.ERROR)
+    try:
+        with benchmark_settings(throttle):
+            return _run(iterations, warmup, only, throttle, progress)
+    finally:
+        request_logger.setLevel(level)
+
+
+def _run(iterations, warmup, only, throttle, progress):
+    fixtures = Fixtures()
+    client = Client(raise_request_exception=False)
+    endpoints, skipped = [], []
+    for endpoint, pattern in discover(fixtures, client, only):
+        if not endpoint.skipped:
+            try:
+                endpoint.path = reverse(pattern.name, kwargs=_path_kwargs(fixtures, client, endpoint.name, pattern))
+                measure(endpoint, fixtures, client, iterations, warmup)
+            except BenchmarkError as exc:
+                endpoint.skipped = str(exc)
+        if endpoint.skipped:
+            skipped.append({'name': endpoint.name, 'method': endpoint.method.upper(), 'reason': endpoint.skipped})
+        else:
+            endpoints.append(endpoint.summary())
+        if progress:
+            progress(endpoint)
+
+    return {
+        'revision': git_revision(),
+        'vendor': connection.vendor,
+        'created_at': timezone.now().isoformat(),
+        'iterations': iterations,
+        'warmup': warmup,
+        'throttled': throttle,
+        'endpoints': endpoints,
+        'skipped': skipped,
+    }
+
+
+def compare(old, new):
+    """``(key, old summary, new summary)`` of endpoints in both reports"""
+    before = {f'{row["method"]} {row["name"]}': row for row in old['endpoints']}
+    for row in new['endpoints']:
+        key = f'{row["method"]} {row["name"]}'
+        if key in before:
+            yield key, before[key], row
@@ -0,0 +1,76 @@
+"""
+Denormalized, publicly cacheable "site bundle" for published websites.
+"""
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.db.models import Count
+
+from .cache import get_versioned, site_bundle_cache
+from .models import BusinessInfo, Product, WebsiteSetup
+from .serializers import PublicBusinessInfoSerializer, PublicWebsiteSetupSerializer
+
+
+class PublicOrigin:
+    """Stands in for the request when serializing, so absolute URLs use ``PUBLIC_ORIGIN``"""
+
+    def __init__(self, origin):
+        self.origin = origin.rstrip('/') + '/'
+
+    def build_absolute_uri(self, location='/'):
+        return urljoin(self.origin, location)
+
+
+def public_request(request):
+    """
+    ``(request, variant)`` to build and key a cached public payload with. The
+    Host header is client supplied, so it is only used without a configured
+    ``PUBLIC_ORIGIN``, as part of the cache key.
+    """
+    if settings.PUBLIC_ORIGIN:
+        return PublicOrigin(settings.PUBLIC_ORIGIN), ''
+    if request is None:
+        return None, ''
+    return request, request.build_absolute_uri('/')
+
+
+def build_site_bundle(site_id, request=None):
+    """Load everything a public template needs for one site, or None if unpublished"""
+    try:
+        setup = (
+            WebsiteSetup.objects
+            .select_related('user', 'business_info', 'rating')
+            .get(pk=site_id)
+        )
+        business_info = setup.business_info
+    except (WebsiteSetup.DoesNotExist, BusinessInfo.DoesNotExist):
+        return None
+
+    if not business_info.is_published:
+        return None
+
+    context = {'request': request}
+    return {
+        'site': dict(PublicWebsiteSetupSerializer(setup, context=context).data),
+        'business_info': dict(PublicBusinessInfoSerializer(business_info, context=context).data),
+        # The catalog itself is paginated at /api/public/sites/<id>/products/
+        'product_categories': list(
+            Product.objects
+            .filter(website_setup=setup)
+            .values('category')
+            .annotate(count=Count('id'))
+            .order_by('category')
+        ),
+    }
+
+
+def get_site_bundle(site_id, request=None):
+    """Return ``(bundle, version)`` for a site, served from cache when possible"""
+    request, variant = public_request(request)
+    return get_versioned(
+        'site-bundle',
+        site_id,
+        lambda: build_site_bundle(site_id, request),
+        variant=variant,
+        local=site_bundle_cache,
+    )
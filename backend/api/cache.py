@@ -0,0 +1,146 @@
+"""
+Two-level caching helpers for public site data.
+
+Every published site has a version token stored in the shared Django cache.
+Cached payloads are keyed by that version, so bumping it on save invalidates
+every process at once without having to delete anything. A small in-process
+LRU sits in front of the shared cache so hot sites are served from memory.
+"""
+import random
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.base import BaseCache
+from django.db import transaction
+
+
+class LocalCache:
+    """Thread-safe, size-bounded LRU cache living in the worker process"""
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+def _version_key(site_id):
+    return f'site-version:{site_id}'
+
+
+def _new_version():
+    # Time based so a version lost to eviction never collides with an old one,
+    # plus random digits so two made in the same millisecond differ
+    return int(time.time() * 1000) * 1000 + random.randrange(1000)
+
+
+def get_version(key):
+    """Return the version token stored under ``key``, creating one if missing"""
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _new_version(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(key, on_bumped=None):
+    """
+    Increment the version under ``key`` once the current transaction commits.
+    ``on_bumped(new_version)`` is called right after the increment. Without an
+    atomic incr the new version is a fresh one instead, so ``on_bumped``
+    can't rely on it being one more than the last.
+    """
+    # Bump only once the change is visible to other connections, otherwise a
+    # concurrent reader could cache pre-commit data under the new version.
+    def bump():
+        version = _incr_version(key)
+        if on_bumped is not None:
+            on_bumped(version)
+
+    transaction.on_commit(bump)
+
+
+def _incr_version(key):
+    # BaseCache.incr() is a get followed by a set (file and database caches),
+    # so two concurrent bumps could land on the same version; LocMem, Redis and
+    # Memcached override it with an atomic increment
+    if type(caches['default']).incr is not BaseCache.incr:
+        try:
+            return cache.incr(key)
+        except ValueError:
+            pass
+    version = _new_version()
+    cache.set(key, version, timeout=None)
+    return version
+
+
+def get_site_version(site_id):
+    """Return the current cache version token for a site"""
+    return get_version(_version_key(site_id))
+
+
+def bump_site_version(site_id):
+    """Invalidate every cached payload for a site"""
+    bump_version(_version_key(site_id))
+
+
+# Sentinel stored for sites that do not exist or are not published, so hot
+# 404s are cached just like bundles are.
+MISSING = '__missing__'
+
+site_bundle_cache = LocalCache(
+    maxsize=settings.SITE_BUNDLE_LOCAL_CACHE_SIZE
+)
+
+
+def get_versioned(namespace, site_id, builder, *, variant='', local=None):
+    """
+    Fetch a per-site payload from the local cache, then the shared cache,
+    and finally from ``builder()``. Returns ``(payload, version)``.
+    """
+    version = get_site_version(site_id)
+    key = f'{namespace}:{site_id}:{version}:{variant}'
+
+    if local is not None:
+        payload = local.get(key)
+        if payload is not None:
+            return payload, version
+
+    payload = cache.get(key)
+    if payload is None:
+        payload = builder()
+        if payload is None:
+            payload = MISSING
+        cache.set(key, payload, timeout=settings.SITE_BUNDLE_CACHE_TIMEOUT)
+
+    if local is not None:
+        local.set(key, payload)
+    return payload, version
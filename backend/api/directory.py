@@ -0,0 +1,84 @@
+"""
+Cached public directory of a hospital's departments and doctors.
+
+The whole directory is serialized once per site version (two queries: the
+departments and their prefetched doctors, joined to their rating summaries) and kept in the same two-level
+cache as the site bundle. Filters are applied to the cached payload, so
+searching the directory never touches the database.
+"""
+from django.db.models import Prefetch
+
+from .bundles import public_request
+from .cache import get_versioned, site_bundle_cache
+from .models import Department, Doctor
+from .search import normalize
+from .serializers import PublicDepartmentSerializer
+
+# Doctor fields matched by the ``q`` filter, besides the department name
+SEARCH_FIELDS = ('name', 'specialization', 'title')
+
+
+def build_directory(site_id, request=None):
+    departments = (
+        Department.objects
+        .filter(website_setup_id=site_id)
+        .order_by('name', 'id')
+        .prefetch_related(
+            Prefetch('doctors', queryset=Doctor.objects.select_related('rating').order_by('name', 'id'))
+        )
+    )
+    data = PublicDepartmentSerializer(departments, many=True, context={'request': request}).data
+    return {
+        'departments': [dict(department) for department in data],
+        'specializations': sorted({
+            doctor['specialization'].strip()
+            for department in data
+            for doctor in department['doctors']
+            if doctor['specialization'].strip()
+        }),
+    }
+
+
+def get_directory(site_id, request=None):
+    """Return ``(directory, version)`` for a site, served from cache when possible"""
+    request, variant = public_request(request)
+    return get_versioned(
+        'site-directory',
+        site_id,
+        lambda: build_directory(site_id, request),
+        variant=variant,
+        local=site_bundle_cache,
+    )
+
+
+def filter_directory(directory, specialization=None, department=None, query=None):
+    """
+    Narrow a directory to doctors with the given specialization
+    (case-insensitive), in the given department (by id) and matching every
+    word of ``query`` in their name, specialization, title or department.
+    Departments left without doctors are dropped.
+    """
+    if not (specialization or department or query):
+        return directory
+
+    specialization = normalize(specialization).strip() if specialization else None
+    terms = normalize(query).split() if query else []
+
+    departments = []
+    for entry in directory['departments']:
+        if department and str(entry['id']) != str(department):
+            continue
+        department_name = normalize(entry['name'])
+        doctors = [
+            doctor for doctor in entry['doctors']
+            if (not specialization or normalize(doctor['specialization']).strip() == specialization)
+            and all(
+                term in department_name
+                or any(term in normalize(doctor[field]) for field in SEARCH_FIELDS)
+                for term in terms
+            )
+        ]
+        if doctors:
+            departments.append({**entry, 'doctors': doctors})
+
+    return {**directory, 'departments': departments}
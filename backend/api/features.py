@@ -0,0 +1,45 @@
+"""
+Feature checks for public requests without loading the site.
+
+``WebsiteSetup.features`` packs a site's flags into one integer (see
+``FEATURE_BITS``). Public views only need that integer, so it is cached
+per site in-process, keyed by the site version: saving the setup or its
+business info bumps the version and every process picks up the new mask
+on its next lookup. A request fetches the mask once and then tests any
+number of flags with bit operations.
+"""
+from .cache import MISSING, LocalCache, get_versioned
+from .models import WebsiteSetup
+from .models.website import feature_bit, unpack_features
+
+_masks = LocalCache(maxsize=4096)
+
+
+class SiteFeatures:
+    """The feature mask of one site"""
+
+    __slots__ = ('mask',)
+
+    def __init__(self, mask):
+        self.mask = mask
+
+    def has(self, feature):
+        return bool(self.mask & feature_bit(feature))
+
+    def __iter__(self):
+        return iter(unpack_features(self.mask))
+
+
+def _load_mask(site_id):
+    return (
+        WebsiteSetup.objects
+        .filter(pk=site_id, business_info__is_published=True)
+        .values_list('features', flat=True)
+        .first()
+    )
+
+
+def site_features(site_id):
+    """``SiteFeatures`` of a published site, or None if there is no such site"""
+    mask, version = get_versioned('site-features', site_id, lambda: _load_mask(site_id), local=_masks)
+    return None if mask == MISSING else SiteFeatures(mask)
@@ -0,0 +1,139 @@
+"""
+Nearest-business search over ``BusinessInfo.latitude``/``longitude``.
+
+Each business stores the geohash of its location, an indexed string where
+every extra character narrows the cell and nearby places share prefixes.
+A search looks at the 3x3 block of cells around the point: each cell is one
+index range scan (``geohash >= prefix AND geohash < prefix + '~'``), so only
+rows in those nine cells are read. The block is guaranteed to contain
+everything within one cell size of the point; when that isn't enough to
+answer "k nearest within r km", the search retries one precision coarser.
+Distances are exact (haversine) and computed only for those candidates.
+
+Works on SQLite and Postgres alike; no PostGIS needed.
+"""
+import heapq
+import math
+
+from django.db.models import Q
+
+from .models import BusinessInfo
+
+BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+GEOHASH_LENGTH = 9
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.32
+
+# Finest precision tried first; 6 characters is a cell of about 1.2 x 0.6 km
+START_PRECISION = 6
+
+
+def encode(latitude, longitude, precision=GEOHASH_LENGTH):
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars = []
+    bits = 0
+    value = 0
+    even = True
+    while len(chars) < precision:
+        interval, coordinate = (lon_range, longitude) if even else (lat_range, latitude)
+        middle = (interval[0] + interval[1]) / 2
+        value <<= 1
+        if coordinate >= middle:
+            value |= 1
+            interval[0] = middle
+        else:
+            interval[1] = middle
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(BASE32[value])
+            bits = value = 0
+    return ''.join(chars)
+
+
+def cell_size(precision):
+    """``(height, width)`` of a cell in degrees"""
+    lon_bits = (5 * precision + 1) // 2
+    lat_bits = 5 * precision // 2
+    return 180.0 / 2 ** lat_bits, 360.0 / 2 ** lon_bits
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    """Great-circle distance in km"""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
+
+
+def block(latitude, longitude, precision):
+    """
+    Geohashes of the cell containing the point and its neighbours, and the
+    radius in km that the block is guaranteed to cover around the point.
+    """
+    height, width = cell_size(precision)
+    cells = set()
+    for dlat in (-height, 0, height):
+        lat = latitude + dlat
+        if not -90 <= lat <= 90:
+            continue
+        for dlon in (-width, 0, width):
+            lon = (longitude + dlon + 180) % 360 - 180
+            cells.add(encode(lat, lon, precision))
+    covered = min(height, width * math.cos(math.radians(latitude))) * KM_PER_DEGREE
+    return sorted(cells), covered
+
+
+def _candidates(cells, business_type=None):
+    ranges = Q()
+    for cell in cells:
+        # '~' sorts after every geohash character: one index range per cell
+        ranges |= Q(geohash__gte=cell, geohash__lt=cell + '~')
+    businesses = BusinessInfo.objects.filter(ranges, is_published=True)
+    if business_type:
+        businesses = businesses.filter(website_setup__user__business_type=business_type)
+    return businesses.values(
+        'website_setup_id', 'name', 'address', 'latitude', 'longitude',
+        'contact_phone', 'website_setup__user__business_type',
+    )
+
+
+def nearby_businesses(latitude, longitude, radius, limit, business_type=None, site_ids=None):
+    """
+    Up to ``limit`` published businesses within ``radius`` km, nearest first.
+    ``site_ids`` (a set of string ids) restricts the search, e.g. to the
+    businesses open now.
+    """
+    precision = START_PRECISION
+    while True:
+        cells, covered = block(latitude, longitude, precision)
+        nearest = []
+        for row in _candidates(cells, business_type):
+            if site_ids is not None and str(row['website_setup_id']) not in site_ids:
+                continue
+            distance = haversine(latitude, longitude, row['latitude'], row['longitude'])
+            if distance <= radius:
+                nearest.append((distance, row))
+        nearest = heapq.nsmallest(limit, nearest, key=lambda item: (item[0], item[1]['name']))
+        # Everything closer than ``covered`` was seen; past that only if the
+        # block already reaches the radius or is as coarse as it gets
+        complete = covered >= radius or precision == 1
+        if complete or (len(nearest) == limit and nearest[-1][0] <= covered):
+            break
+        precision -= 1
+
+    return [
+        {
+            'site_id': str(row['website_setup_id']),
+            'name': row['name'],
+            'business_type': row['website_setup__user__business_type'],
+            'address': row['address'],
+            'latitude': row['latitude'],
+            'longitude': row['longitude'],
+            'contact_phone': row['contact_phone'],
+            'distance_km': round(distance, 3),
+        }
+        for distance, row in nearest
+    ]
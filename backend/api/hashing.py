@@ -0,0 +1,85 @@
+"""
+Bounded thread pool for password hashing.
+
+PBKDF2 releases the GIL, so hashing in a small pool keeps the event loop (or
+the worker thread) free for other requests. The pool also caps how much work
+can queue up: once ``workers + queue_depth`` hashes are in flight, new
+requests are rejected with ``HashQueueFull`` so a login storm degrades only
+the auth endpoints instead of starving the whole process.
+"""
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    check_password, get_hasher, identify_hasher, make_password
+)
+
+
+class HashQueueFull(Exception):
+    """Raised when the password hashing queue has no free slots"""
+
+
+class PasswordHashPool:
+    """Runs password hashing in a bounded executor with a bounded queue"""
+
+    def __init__(self, workers, queue_depth):
+        self.workers = workers
+        self.queue_depth = queue_depth
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix='password-hash'
+        )
+        self._slots = threading.BoundedSemaphore(workers + queue_depth)
+
+    async def run(self, func, *args):
+        if not self._slots.acquire(blocking=False):
+            raise HashQueueFull()
+        try:
+            future = self._executor.submit(func, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # Release on completion rather than on await, so a cancelled request
+        # still holds its slot until the hash it started has finished.
+        future.add_done_callback(lambda _: self._slots.release())
+        return await asyncio.wrap_future(future)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_hash_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = PasswordHashPool(
+                    workers=settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1,
+                    queue_depth=settings.PASSWORD_HASH_QUEUE_DEPTH,
+                )
+    return _pool
+
+
+async def hash_password(password):
+    """Hash ``password`` with the configured hasher off the calling thread"""
+    return await get_hash_pool().run(make_password, password)
+
+
+async def verify_password(user, password):
+    """
+    Async equivalent of ``user.check_password``, including upgrading the
+    stored hash when the hasher settings have changed.
+    """
+    pool = get_hash_pool()
+    if not await pool.run(check_password, password, user.password):
+        return False
+
+    hasher = identify_hasher(user.password)
+    if hasher.algorithm != get_hasher().algorithm or hasher.must_update(user.password):
+        user.password = await pool.run(make_password, password)
+        await sync_to_async(user.save)(update_fields=['password'])
+    return True
@@ -0,0 +1,124 @@
+"""
+Working hours as minute-of-week intervals.
+
+``BusinessInfo.working_hours`` is stored as the dashboard edits it::
+
+    {"monday": {"open": "09:00", "close": "17:00", "closed": false}, ...}
+
+and compiled here into a sorted list of non-overlapping ``(start, end)``
+ranges in minutes since Monday 00:00 local time, so "is this open at T"
+is a bisect instead of parsing JSON. A day whose closing time is not after
+its opening time runs past midnight into the next day.
+"""
+import bisect
+
+DAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+
+def parse_clock(value):
+    """``'HH:MM'`` -> minutes since midnight; ``'24:00'`` is allowed as a closing time"""
+    hours, sep, minutes = str(value).strip().partition(':')
+    if not sep or not hours.isdigit() or not minutes[:2].isdigit():
+        raise ValueError(f'Invalid time {value!r}')
+    hours, minutes = int(hours), int(minutes[:2])
+    if minutes > 59 or hours > 24 or (hours == 24 and minutes):
+        raise ValueError(f'Invalid time {value!r}')
+    return hours * 60 + minutes
+
+
+def validate_working_hours(working_hours):
+    """
+    Normalized copy of a ``working_hours`` dict; raises ``ValueError`` with
+    ``{day: message}`` for unknown days or open days with invalid times.
+    """
+    if not isinstance(working_hours, dict):
+        raise ValueError({'non_field_errors': 'Expected an object keyed by day.'})
+    errors = {}
+    cleaned = {}
+    for day, hours in working_hours.items():
+        if day not in DAYS:
+            errors[day] = f"Unknown day; expected one of: {', '.join(DAYS)}."
+            continue
+        if not isinstance(hours, dict):
+            errors[day] = 'Expected {open, close, closed}.'
+            continue
+        closed = bool(hours.get('closed'))
+        opens, closes = hours.get('open') or '', hours.get('close') or ''
+        if not closed:
+            try:
+                if parse_clock(opens) == MINUTES_PER_DAY:
+                    raise ValueError
+                parse_clock(closes)
+            except ValueError:
+                errors[day] = 'Open days need open and close times as HH:MM.'
+                continue
+        cleaned[day] = {'open': opens, 'close': closes, 'closed': closed}
+    if errors:
+        raise ValueError(errors)
+    return cleaned
+
+
+def merge_intervals(intervals):
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [tuple(interval) for interval in merged]
+
+
+def compile_working_hours(working_hours):
+    """
+    Sorted, merged minute-of-week intervals for a ``working_hours`` dict.
+    Days that are closed, missing or malformed contribute nothing.
+    """
+    intervals = []
+    for index, day in enumerate(DAYS):
+        hours = (working_hours or {}).get(day)
+        if not isinstance(hours, dict) or hours.get('closed'):
+            continue
+        try:
+            opens, closes = parse_clock(hours.get('open')), parse_clock(hours.get('close'))
+        except ValueError:
+            continue
+        if opens == MINUTES_PER_DAY:
+            continue
+        start = index * MINUTES_PER_DAY + opens
+        end = index * MINUTES_PER_DAY + closes
+        if end <= start:
+            # Open past midnight
+            end += MINUTES_PER_DAY
+        if end > MINUTES_PER_WEEK:
+            # Sunday night runs into Monday morning
+            intervals.append((0, end - MINUTES_PER_WEEK))
+            end = MINUTES_PER_WEEK
+        intervals.append((start, end))
+    return merge_intervals(intervals)
+
+
+def opening_ranges(working_hours):
+    """
+    ``compile_working_hours`` for storage: when Sunday night runs into Monday
+    the Sunday range keeps its real end (past ``MINUTES_PER_WEEK``), so the
+    range matching a moment also tells when the business closes.
+    """
+    intervals = compile_working_hours(working_hours)
+    if len(intervals) > 1 and intervals[0][0] == 0 and intervals[-1][1] == MINUTES_PER_WEEK:
+        intervals[-1] = (intervals[-1][0], MINUTES_PER_WEEK + intervals[0][1])
+    return intervals
+
+
+def minute_of_week(moment):
+    """Minute of the week of a (local) datetime"""
+    return moment.weekday() * MINUTES_PER_DAY + moment.hour * 60 + moment.minute
+
+
+def covers(intervals, start, end):
+    """True if ``[start, end)`` (minutes of week) lies inside the compiled intervals"""
+    if end > MINUTES_PER_WEEK:
+        return covers(intervals, start, MINUTES_PER_WEEK) and covers(intervals, 0, end - MINUTES_PER_WEEK)
+    index = bisect.bisect_right(intervals, (start, MINUTES_PER_WEEK)) - 1
+    return index >= 0 and intervals[index][0] <= start and end <= intervals[index][1]
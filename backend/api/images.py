@@ -0,0 +1,175 @@
+"""
+Background pipeline producing resized, WebP and content-hashed variants of
+uploaded images (business logos, doctor photos).
+
+Variants are written next to the upload as ``<dir>/variants/<hash>-<width>.<ext>``
+where ``hash`` is derived from the original file's bytes, so a variant URL
+never changes meaning and can be cached forever. The variant map is stored in
+a JSON field on the model:
+
+    {
+        "source": "logos/clinic.png",
+        "hash": "3f1c...",
+        "formats": ["webp", "png"],
+        "sizes": {"64": {"webp": "logos/variants/3f1c...-64.webp", "png": ...}, ...}
+    }
+
+Processing runs in a thread pool after the upload's transaction commits, so
+the request that uploaded the file never waits for Pillow.
+"""
+import hashlib
+import logging
+import posixpath
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import close_old_connections, connections, transaction
+from django.utils import timezone
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+logger = logging.getLogger(__name__)
+
+WEBP_OPTIONS = {'quality': 80, 'method': 4}
+FALLBACK_OPTIONS = {
+    'png': {'optimize': True},
+    'jpeg': {'quality': 85, 'optimize': True, 'progressive': True},
+}
+
+
+def build_variants(storage, name):
+    """Generate every variant for the stored image ``name``; returns the variant map"""
+    with storage.open(name, 'rb') as source:
+        data = source.read()
+    digest = hashlib.sha256(data).hexdigest()[:20]
+
+    image = Image.open(BytesIO(data))
+    image = ImageOps.exif_transpose(image)
+    has_alpha = image.mode in ('RGBA', 'LA') or (
+        image.mode == 'P' and 'transparency' in image.info
+    )
+    image = image.convert('RGBA' if has_alpha else 'RGB')
+    fallback = 'png' if has_alpha else 'jpeg'
+
+    widths = [width for width in settings.IMAGE_VARIANT_WIDTHS if width < image.width]
+    widths.append(min(image.width, max(settings.IMAGE_VARIANT_WIDTHS)))
+
+    directory = posixpath.join(posixpath.dirname(name), 'variants')
+    sizes = {}
+    for width in sorted(set(widths)):
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        sizes[str(width)] = {
+            'webp': _save(storage, directory, digest, width, resized, 'webp', WEBP_OPTIONS),
+            fallback: _save(storage, directory, digest, width, resized, fallback,
+                            FALLBACK_OPTIONS[fallback]),
+        }
+
+    return {
+        'source': name,
+        'hash': digest,
+        'formats': ['webp', fallback],
+        'sizes': sizes,
+    }
+
+
+def _save(storage, directory, digest, width, image, fmt, options):
+    ext = 'jpg' if fmt == 'jpeg' else fmt
+    path = posixpath.join(directory, f'{digest}-{width}.{ext}')
+    # Content addressed: an existing file already holds exactly these bytes
+    if storage.exists(path):
+        return path
+    buffer = BytesIO()
+    image.save(buffer, fmt.upper(), **options)
+    return storage.save(path, ContentFile(buffer.getvalue()))
+
+
+def variant_srcsets(variants, storage, name, build_url=None):
+    """
+    ``{format: "url 64w, url 128w, ..."}`` for a variant map, or None when the
+    map does not belong to the current file ``name``.
+    """
+    if not name or not variants or variants.get('source') != name:
+        return None
+    build_url = build_url or (lambda url: url)
+    srcsets = {}
+    for fmt in variants['formats']:
+        srcsets[fmt] = ', '.join(
+            f"{build_url(storage.url(paths[fmt]))} {width}w"
+            for width, paths in sorted(variants['sizes'].items(), key=lambda item: int(item[0]))
+        )
+    return srcsets
+
+
+def process_image_field(model, pk, field_name, variants_field, on_processed=None):
+    """Build variants for one row's image and store the map"""
+    instance = model.objects.filter(pk=pk).first()
+    if instance is None:
+        return
+    file = getattr(instance, field_name)
+    if not file:
+        return
+    try:
+        variants = build_variants(file.storage, file.name)
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError):
+        logger.warning('Could not build variants for %s', file.name, exc_info=True)
+        return
+    # Only store the map if the row still points at the file we processed.
+    # update() skips auto_now, and validators such as the dashboard ETag are
+    # built from updated_at, so it is bumped here.
+    updated = model.objects.filter(pk=pk, **{field_name: file.name}).update(
+        **{variants_field: variants}, updated_at=timezone.now()
+    )
+    if updated and on_processed is not None:
+        on_processed(instance)
+
+
+def _worker_job(*args):
+    close_old_connections()
+    try:
+        process_image_field(*args)
+    except Exception:
+        logger.exception('Image variant job failed')
+    finally:
+        # Worker threads must not keep database connections open
+        connections.close_all()
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.IMAGE_WORKERS, thread_name_prefix='image-variants'
+                )
+    return _executor
+
+
+def schedule_variants(instance, field_name, variants_field, on_processed=None):
+    """
+    Queue variant generation for ``instance.<field_name>`` if its variant map
+    is missing or belongs to a previous file. Call from post_save.
+    """
+    file = getattr(instance, field_name)
+    variants = getattr(instance, variants_field) or {}
+    model = type(instance)
+
+    if not file:
+        if variants:
+            model.objects.filter(pk=instance.pk).update(**{variants_field: {}})
+        return
+    if variants.get('source') == file.name:
+        return
+
+    args = (model, instance.pk, field_name, variants_field, on_processed)
+    if settings.IMAGE_PIPELINE_ASYNC:
+        transaction.on_commit(lambda: get_executor().submit(_worker_job, *args))
+    else:
+        transaction.on_commit(lambda: process_image_field(*args))
@@ -0,0 +1,180 @@
+"""
+Streaming bulk import helpers.
+
+Records are read one line at a time from the request (or an uploaded file)
+and written in fixed-size batches, so memory use stays constant no matter how
+large the upload is.
+"""
+import codecs
+import csv
+import json
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+
+from django.conf import settings
+from django.db import transaction
+from rest_framework.exceptions import ParseError
+
+from .cache import bump_site_version
+from .models import Product
+from .search import catalog_replaced
+
+CSV_TYPES = {'text/csv', 'application/csv'}
+NDJSON_TYPES = {'application/x-ndjson', 'application/ndjson', 'application/jsonl'}
+
+# Only the first errors are reported back; the rest are just counted
+MAX_REPORTED_ERRORS = 100
+
+# Columns overwritten when a SKU already exists
+IMPORT_UPDATE_FIELDS = ['name', 'category', 'description', 'price', 'in_stock', 'updated_at']
+
+TRUE_VALUES = {'1', 'true', 'yes', 'y', 't'}
+FALSE_VALUES = {'0', 'false', 'no', 'n', 'f'}
+
+
+def detect_format(content_type, filename=''):
+    """Return 'csv' or 'ndjson' for an upload, or None when unsupported"""
+    content_type = (content_type or '').split(';')[0].strip().lower()
+    if content_type in CSV_TYPES or filename.endswith('.csv'):
+        return 'csv'
+    if content_type in NDJSON_TYPES or filename.endswith(('.ndjson', '.jsonl')):
+        return 'ndjson'
+    return None
+
+
+def iter_csv(stream):
+    """Yield ``(line_number, row_dict)`` from a binary CSV stream with a header row"""
+    reader = csv.DictReader(codecs.iterdecode(stream, 'utf-8-sig'))
+    try:
+        for row in reader:
+            yield reader.line_num, row
+    except (csv.Error, UnicodeDecodeError) as exc:
+        raise ParseError(f'Invalid CSV near line {reader.line_num}: {exc}')
+
+
+def iter_ndjson(stream):
+    """Yield ``(line_number, object)`` from a binary newline-delimited JSON stream"""
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except (ValueError, UnicodeDecodeError) as exc:
+            raise ParseError(f'Invalid JSON on line {line_number}: {exc}')
+
+
+def iter_records(stream, fmt):
+    return iter_csv(stream) if fmt == 'csv' else iter_ndjson(stream)
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def parse_bool(value, default):
+    if value is None or value == '':
+        return default
+    if isinstance(value, bool):
+        return value
+    value = str(value).strip().lower()
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+    raise ValueError
+
+
+def _text(row, errors, name, max_length, required=True):
+    value = row.get(name)
+    value = '' if value is None else str(value).strip()
+    if required and not value:
+        errors[name] = 'This field is required.'
+    elif max_length and len(value) > max_length:
+        errors[name] = f'Ensure this field has no more than {max_length} characters.'
+    return value
+
+
+def clean_product_row(row):
+    """Validate one import record; returns ``(values, errors)``"""
+    if not isinstance(row, dict):
+        return None, {'non_field_errors': 'Expected an object.'}
+
+    errors = {}
+    values = {
+        'sku': _text(row, errors, 'sku', 64),
+        'name': _text(row, errors, 'name', 255),
+        'category': _text(row, errors, 'category', 100),
+        'description': _text(row, errors, 'description', None, required=False),
+    }
+
+    try:
+        price = Decimal(str(row.get('price', '')).strip()).quantize(Decimal('0.01'))
+        if price < 0 or price >= Decimal('1e8'):
+            raise InvalidOperation
+        values['price'] = price
+    except (InvalidOperation, ValueError):
+        errors['price'] = 'A valid non-negative number is required.'
+
+    try:
+        values['in_stock'] = parse_bool(row.get('in_stock'), default=True)
+    except ValueError:
+        errors['in_stock'] = 'Must be a boolean.'
+
+    # Only touch stock levels when the column is present and filled in
+    stock = row.get('stock')
+    if stock is not None and str(stock).strip() != '':
+        try:
+            values['stock'] = int(str(stock).strip())
+            if values['stock'] < 0:
+                raise ValueError
+        except ValueError:
+            errors['stock'] = 'A valid non-negative integer is required.'
+
+    return values, errors
+
+
+def import_products(website_setup, records, batch_size=None):
+    """
+    Upsert products keyed by ``(website_setup, sku)`` from ``(line, record)``
+    pairs. Invalid records are skipped and reported; everything else is
+    written in one transaction, ``batch_size`` rows per statement.
+    """
+    batch_size = batch_size or settings.PRODUCT_IMPORT_BATCH_SIZE
+    result = {'imported': 0, 'error_count': 0, 'errors': []}
+
+    with transaction.atomic():
+        for batch in batched(records, batch_size):
+            products = {}
+            for line, record in batch:
+                values, errors = clean_product_row(record)
+                if errors:
+                    result['error_count'] += 1
+                    if len(result['errors']) < MAX_REPORTED_ERRORS:
+                        result['errors'].append({'line': line, 'errors': errors})
+                    continue
+                # Last occurrence of a SKU wins, as if rows were applied in order
+                products[values['sku']] = Product(website_setup=website_setup, **values)
+
+            with_stock = [product for product in products.values() if product.stock is not None]
+            without_stock = [product for product in products.values() if product.stock is None]
+            for rows, update_fields in (
+                (with_stock, IMPORT_UPDATE_FIELDS + ['stock']),
+                (without_stock, IMPORT_UPDATE_FIELDS),
+            ):
+                if rows:
+                    Product.objects.bulk_create(
+                        rows,
+                        update_conflicts=True,
+                        unique_fields=['website_setup', 'sku'],
+                        update_fields=update_fields,
+                    )
+            result['imported'] += len(products)
+
+        # bulk_create sends no signals, so invalidate the site and rebuild its
+        # search index once here
+        bump_site_version(website_setup.pk)
+        catalog_replaced(website_setup.pk)
+
+    return result
@@ -0,0 +1,82 @@
+import json
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.benchmarks import BenchmarkError, compare, run_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        'Time every API endpoint through the test client against tenants made by '
+        'generate_tenants and save p50/p95/p99 latency, throughput and query counts as JSON'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=50, help='Timed requests per endpoint (default 50)')
+        parser.add_argument('--warmup', type=int, default=5, help='Untimed requests first (default 5)')
+        parser.add_argument(
+            '--only', action='append',
+            help='Only endpoints whose "METHOD name" or route contains this text (repeatable)'
+        )
+        parser.add_argument('--throttle', action='store_true', help='Keep the configured throttle rates')
+        parser.add_argument(
+            '--output',
+            help='Where to write the JSON report (default benchmark-results/<time>-<revision>.json)'
+        )
+        parser.add_argument('--compare', metavar='REPORT', help='Print the changes against an earlier report')
+
+    def handle(self, *args, **options):
+        def progress(endpoint):
+            if endpoint.skipped:
+                self.stdout.write(f'skip  {endpoint.key}: {endpoint.skipped}')
+            else:
+                summary = endpoint.summary()
+                self.stdout.write(
+                    f'{summary["p50_ms"]:>8.2f} {summary["p95_ms"]:>8.2f} {summary["p99_ms"]:>8.2f} ms '
+                    f'{summary["queries_mean"]:>6.1f} q  {endpoint.key}  {summary["status_codes"]}'
+                )
+
+        if options['iterations'] < 1:
+            raise CommandError('--iterations must be at least 1')
+        self.stdout.write('     p50      p95      p99    queries')
+        try:
+            report = run_benchmark(
+                iterations=options['iterations'],
+                warmup=options['warmup'],
+                only=options['only'],
+                throttle=options['throttle'],
+                progress=progress,
+            )
+        except BenchmarkError as exc:
+            raise CommandError(str(exc))
+
+        output = options['output']
+        if not output:
+            stamp = report['created_at'][:19].replace(':', '').replace('-', '')
+            output = os.path.join(
+                settings.BASE_DIR, 'benchmark-results', f'{stamp}-{report["revision"] or "unknown"}.json'
+            )
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        with open(output, 'w') as handle:
+            json.dump(report, handle, indent=2)
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(report["endpoints"])} endpoints timed, {len(report["skipped"])} skipped; report in {output}'
+        ))
+
+        if options['compare']:
+            with open(options['compare']) as handle:
+                old = json.load(handle)
+            self.stdout.write(f'\nChanges since {old.get("revision") or options["compare"]}:')
+            for key, before, after in compare(old, report):
+                self.stdout.write(
+                    f'{key}: p50 {before["p50_ms"]:.2f} -> {after["p50_ms"]:.2f} ms '
+                    f'({_change(before["p50_ms"], after["p50_ms"])}), p95 {before["p95_ms"]:.2f} -> '
+                    f'{after["p95_ms"]:.2f} ms ({_change(before["p95_ms"], after["p95_ms"])}), '
+                    f'queries {before["queries_mean"]} -> {after["queries_mean"]}'
+                )
+
+
+def _change(before, after):
+    return f'{(after - before) / before:+.0%}' if before else 'n/a'
@@ -0,0 +1,89 @@
+import json
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection, models, transaction
+
+from api.models.fields import uuid7
+
+GENERATORS = {'uuid4': uuid.uuid4, 'uuid7': uuid7}
+
+
+def index_stats(table):
+    """``(bytes, fill)`` of a table's primary key index, where the backend can tell"""
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            # Needs SQLite built with the dbstat virtual table (the default in CPython)
+            cursor.execute(
+                'SELECT SUM(pgsize), SUM(unused) FROM dbstat WHERE name = %s',
+                [f'sqlite_autoindex_{table}_1'],
+            )
+            size, unused = cursor.fetchone()
+            return size, round(1 - unused / size, 3) if size else None
+        if connection.vendor == 'postgresql':
+            cursor.execute('SELECT pg_relation_size(%s)', [f'{table}_pkey'])
+            return cursor.fetchone()[0], None
+    return None, None
+
+
+class Command(BaseCommand):
+    help = (
+        'Insert the same rows into scratch tables keyed by uuid4 and by uuid7 and compare '
+        'insert throughput and primary key index size (tables are dropped afterwards)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100000)
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help='Rows per transaction, like a bulk sync request (default 500)'
+        )
+        parser.add_argument('--json', action='store_true', help='Print the results as JSON')
+
+    def handle(self, *args, **options):
+        id_field = models.UUIDField()
+        id_type = id_field.db_type(connection)
+        qn = connection.ops.quote_name
+        results = {}
+
+        for name, generate in GENERATORS.items():
+            table = f'benchmark_pk_{name}'
+            with connection.cursor() as cursor:
+                cursor.execute(f'DROP TABLE IF EXISTS {qn(table)}')
+                cursor.execute(
+                    f'CREATE TABLE {qn(table)} (id {id_type} NOT NULL PRIMARY KEY, payload varchar(64) NOT NULL)'
+                )
+            try:
+                insert = f'INSERT INTO {qn(table)} (id, payload) VALUES (%s, %s)'
+                started = time.perf_counter()
+                for offset in range(0, options['rows'], options['batch_size']):
+                    rows = [
+                        (id_field.get_db_prep_value(generate(), connection), f'row {offset + position}')
+                        for position in range(min(options['batch_size'], options['rows'] - offset))
+                    ]
+                    with transaction.atomic(), connection.cursor() as cursor:
+                        cursor.executemany(insert, rows)
+                elapsed = time.perf_counter() - started
+                size, fill = index_stats(table)
+                results[name] = {
+                    'rows': options['rows'],
+                    'seconds': round(elapsed, 3),
+                    'rows_per_second': round(options['rows'] / elapsed),
+                    'index_bytes': size,
+                    'index_fill': fill,
+                }
+            finally:
+                with connection.cursor() as cursor:
+                    cursor.execute(f'DROP TABLE IF EXISTS {qn(table)}')
+
+        if options['json']:
+            self.stdout.write(json.dumps({'vendor': connection.vendor, 'results': results}, indent=2))
+            return
+        self.stdout.write(f'{connection.vendor}, {options["rows"]} rows in batches of {options["batch_size"]}')
+        for name, result in results.items():
+            self.stdout.write(
+                f'{name}: {result["rows_per_second"]} rows/s, primary key index '
+                f'{result["index_bytes"] if result["index_bytes"] is not None else "?"} bytes'
+                + (f', {result["index_fill"]:.0%} full' if result['index_fill'] is not None else '')
+            )
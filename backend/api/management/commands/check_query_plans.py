@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from api.query_plans import run_checks
+
+
+class Command(BaseCommand):
+    help = (
+        'EXPLAIN the querysets behind the API and the admin and fail if any reads '
+        'a whole table (run against a migrated SQLite or Postgres database)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--show-plans', action='store_true', help='Print every plan, not only failing ones')
+
+    def handle(self, *args, **options):
+        checks = run_checks()
+        failed = [check for check in checks if not check.ok]
+        for check in checks:
+            if check.ok:
+                self.stdout.write(f'ok    {check.name}')
+            else:
+                self.stdout.write(self.style.ERROR(f'SCAN  {check.name}: {", ".join(check.full_scans)}'))
+            if options['show_plans'] or not check.ok:
+                self.stdout.write(f'{check.queryset.query}\n{check.plan}\n')
+
+        if failed:
+            raise CommandError(f'{len(failed)} of {len(checks)} querysets scan whole tables')
+        self.stdout.write(self.style.SUCCESS(f'All {len(checks)} querysets use indexes'))
@@ -0,0 +1,158 @@
+import random
+import time
+import uuid
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from api.benchmarks import BENCHMARK_EMAIL_DOMAIN, BENCHMARK_PASSWORD
+from api.geo import GEOHASH_LENGTH, encode
+from api.hours import DAYS, opening_ranges
+from api.models import (
+    BusinessInfo, Department, Doctor, OpeningInterval, Product, User, WebsiteSetup
+)
+from api.models.website import FEATURE_FIELDS, pack_features
+from api.opening import opening_hours_changed
+from api.pricing import TEMPLATE_PRICES, feature_mask, setup_price
+
+CATEGORIES = ['Pain Relief', 'Vitamins', 'Cold & Flu', 'Skin Care', 'Baby Care', 'First Aid', 'Diabetes']
+DEPARTMENTS = ['Cardiology', 'Pediatrics', 'Dermatology', 'Orthopedics', 'Neurology', 'Dentistry']
+SPECIALIZATIONS = ['Consultant', 'Specialist', 'Surgeon', 'Resident']
+WORKING_HOURS = {
+    day: {'open': '09:00', 'close': '21:00', 'closed': day == 'friday'} for day in DAYS
+}
+# Cairo and the area around it, where most tenants are
+CENTER = (30.0444, 31.2357)
+
+
+class Command(BaseCommand):
+    help = (
+        'Create N synthetic published tenants (user, website setup, business info and a '
+        'pharmacy catalog or hospital directory) with bulk inserts, for benchmarking'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('count', type=int)
+        parser.add_argument('--products', type=int, default=50, help='Products per pharmacy (default 50)')
+        parser.add_argument('--departments', type=int, default=3, help='Departments per hospital (default 3)')
+        parser.add_argument('--doctors', type=int, default=4, help='Doctors per department (default 4)')
+        parser.add_argument('--batch-size', type=int, default=500, help='Tenants per transaction (default 500)')
+        parser.add_argument('--seed', type=int, default=None)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        # Hashing is deliberately slow; every tenant shares one hash
+        password = make_password(BENCHMARK_PASSWORD)
+        run = uuid.uuid4().hex[:8]
+        started = time.perf_counter()
+        totals = dict.fromkeys(['tenants', 'products', 'doctors'], 0)
+
+        for offset in range(0, options['count'], options['batch_size']):
+            size = min(options['batch_size'], options['count'] - offset)
+            with transaction.atomic():
+                created = self.create_batch(rng, run, offset, size, password, options)
+            for key, value in created.items():
+                totals[key] += value
+            self.stdout.write(f'{offset + size}/{options["count"]} tenants')
+
+        opening_hours_changed()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {totals["tenants"]} tenants, {totals["products"]} products and '
+            f'{totals["doctors"]} doctors in {elapsed:.1f}s. Accounts: '
+            f'bench-{run}-<n>@{BENCHMARK_EMAIL_DOMAIN}, password "{BENCHMARK_PASSWORD}"'
+        ))
+
+    def create_batch(self, rng, run, offset, size, password, options):
+        users, setups, businesses, intervals = [], [], [], []
+        products, departments, doctors = [], [], []
+
+        for number in range(offset, offset + size):
+            business_type = 'hospital' if number % 2 else 'pharmacy'
+            user = User(
+                username=f'bench-{run}-{number}',
+                email=f'bench-{run}-{number}@{BENCHMARK_EMAIL_DOMAIN}',
+                name=f'Bench {business_type.title()} {number}',
+                business_type=business_type,
+                password=password,
+            )
+            users.append(user)
+
+            flags = {name: rng.random() < 0.5 for name in FEATURE_FIELDS}
+            template_id = rng.choice(sorted(TEMPLATE_PRICES[business_type])) if business_type == 'pharmacy' else None
+            setup = WebsiteSetup(user=user, template_id=template_id, is_paid=True, **flags)
+            # bulk_create skips save(), which keeps these two in step
+            setup.features = pack_features(setup)
+            setup.total_price = setup_price(
+                business_type, feature_mask(name for name, on in flags.items() if on), template_id
+            )
+            setups.append(setup)
+
+            latitude = CENTER[0] + rng.uniform(-0.5, 0.5)
+            longitude = CENTER[1] + rng.uniform(-0.5, 0.5)
+            business = BusinessInfo(
+                website_setup=setup,
+                name=f'Bench {business_type.title()} {number}',
+                about='Synthetic tenant for benchmarks',
+                address=f'{number} Benchmark Street, Cairo',
+                latitude=latitude,
+                longitude=longitude,
+                geohash=encode(latitude, longitude, GEOHASH_LENGTH),
+                contact_phone=f'+20{number:09d}'[-13:],
+                contact_email=user.email,
+                working_hours=WORKING_HOURS,
+                timezone='Africa/Cairo',
+                is_published=True,
+            )
+            businesses.append(business)
+            intervals.extend(
+                OpeningInterval(business=business, start=start, end=end)
+                for start, end in opening_ranges(WORKING_HOURS)
+            )
+
+            if business_type == 'pharmacy':
+                products.extend(
+                    Product(
+                        website_setup=setup,
+                        sku=f'SKU-{index:05d}',
+                        name=f'{rng.choice(CATEGORIES)} item {index}',
+                        category=rng.choice(CATEGORIES),
+                        description='Synthetic product',
+                        price=Decimal(rng.randint(100, 50000)) / 100,
+                        stock=None if index % 3 else rng.randint(0, 200),
+                    )
+                    for index in range(options['products'])
+                )
+            else:
+                for name in rng.sample(DEPARTMENTS, min(options['departments'], len(DEPARTMENTS))):
+                    department = Department(website_setup=setup, name=name)
+                    departments.append(department)
+                    first = len(doctors)
+                    doctors.extend(
+                        Doctor(
+                            department=department,
+                            name=f'Doctor {number}-{first + index}',
+                            title='Dr.',
+                            specialization=f'{name} {rng.choice(SPECIALIZATIONS)}',
+                            email=f'doctor-{number}-{first + index}@{BENCHMARK_EMAIL_DOMAIN}',
+                            experience=f'{rng.randint(1, 30)} years',
+                            slots=[
+                                {'dayOfWeek': day, 'time': f'{hour:02d}:00'}
+                                for day in (0, 1, 2, 3, 4, 6) for hour in (10, 12, 14, 16)
+                            ],
+                        )
+                        for index in range(options['doctors'])
+                    )
+
+        # Signals don't fire for bulk inserts: geohashes, feature masks and
+        # opening intervals are filled in above instead
+        User.objects.bulk_create(users)
+        WebsiteSetup.objects.bulk_create(setups)
+        BusinessInfo.objects.bulk_create(businesses)
+        OpeningInterval.objects.bulk_create(intervals, batch_size=2000)
+        Product.objects.bulk_create(products, batch_size=2000)
+        Department.objects.bulk_create(departments)
+        Doctor.objects.bulk_create(doctors, batch_size=2000)
+        return {'tenants': len(users), 'products': len(products), 'doctors': len(doctors)}
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from api.cache import bump_site_version
+from api.images import process_image_field
+from api.models import BusinessInfo, Doctor
+from api.signals import bump_doctor_site_version
+
+# (model, image field, variants field, invalidation after processing an instance)
+IMAGE_FIELDS = [
+    (BusinessInfo, 'logo', 'logo_variants', lambda info: bump_site_version(info.website_setup_id)),
+    (Doctor, 'photo', 'photo_variants', bump_doctor_site_version),
+]
+
+
+class Command(BaseCommand):
+    help = 'Generate missing or outdated resized/WebP variants for uploaded images'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force', action='store_true',
+            help='Rebuild variants even when they are up to date'
+        )
+
+    def handle(self, *args, **options):
+        for model, field_name, variants_field, on_processed in IMAGE_FIELDS:
+            processed = 0
+            rows = model.objects.exclude(**{field_name: ''}).exclude(**{f'{field_name}__isnull': True})
+            for obj in rows.only('pk', field_name, variants_field).iterator():
+                file = getattr(obj, field_name)
+                if not options['force'] and getattr(obj, variants_field).get('source') == file.name:
+                    continue
+                process_image_field(model, obj.pk, field_name, variants_field, on_processed=on_processed)
+                processed += 1
+            self.stdout.write(self.style.SUCCESS(
+                f'Processed {processed} {model._meta.verbose_name} {field_name}(s)'
+            ))
@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from api.payments import process_pending
+
+
+class Command(BaseCommand):
+    help = 'Apply payment webhook events waiting in the inbox to payments and websites'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop', action='store_true',
+            help='Keep polling for new events instead of exiting once the inbox is empty'
+        )
+        parser.add_argument(
+            '--interval', type=float, default=1.0,
+            help='Seconds to wait between polls with --loop (default 1)'
+        )
+        parser.add_argument('--batch-size', type=int, default=None)
+
+    def handle(self, *args, **options):
+        while True:
+            processed = process_pending(options['batch_size'])
+            if processed or not options['loop']:
+                self.stdout.write(self.style.SUCCESS(f'Processed {processed} payment event(s)'))
+            if not options['loop']:
+                return
+            close_old_connections()
+            time.sleep(options['interval'])
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from api.models import WebsiteSetup
+from api.stats import rebuild_appointment_stats, rebuild_order_stats
+
+
+class Command(BaseCommand):
+    help = 'Recompute the daily order/appointment rollups behind /api/dashboard/stats/'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--site', action='append', dest='sites', metavar='WEBSITE_SETUP_ID',
+            help='Only rebuild this site (repeatable); defaults to every site'
+        )
+
+    def handle(self, *args, **options):
+        sites = WebsiteSetup.objects.order_by('pk')
+        if options['sites']:
+            sites = sites.filter(pk__in=options['sites'])
+
+        rebuilt = 0
+        for site_id in sites.values_list('pk', flat=True).iterator():
+            rebuild_order_stats(site_id)
+            rebuild_appointment_stats(site_id)
+            rebuilt += 1
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt statistics of {rebuilt} site(s)'))
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from api.models import Payment
+from api.payments import FakeGateway, InvalidWebhook, process_pending
+
+
+class Command(BaseCommand):
+    help = 'Deliver a signed fake gateway webhook for a payment (development only)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('transaction_id')
+        parser.add_argument('--status', choices=['pending', 'completed', 'failed'], default='completed')
+
+    def handle(self, *args, **options):
+        payment = Payment.objects.filter(transaction_id=options['transaction_id']).first()
+        if payment is None:
+            raise CommandError(f"No payment with transaction id {options['transaction_id']}")
+        try:
+            FakeGateway(payment.method).deliver(payment, options['status'])
+        except InvalidWebhook as exc:
+            raise CommandError(str(exc))
+        process_pending()
+        payment.refresh_from_db()
+        self.stdout.write(self.style.SUCCESS(f'{payment.transaction_id} is now {payment.status}'))
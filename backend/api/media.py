@@ -0,0 +1,169 @@
+"""
+Production-grade serving of user uploads (MEDIA_ROOT).
+
+* Conditional GET: ETag and Last-Modified derived from the file's stat,
+  answered with 304 before the file is opened.
+* Byte ranges: a single ``Range: bytes=...`` is answered with 206, honouring
+  ``If-Range``.
+* Offload: with ``MEDIA_ACCEL_REDIRECT_PREFIX`` (nginx) or
+  ``MEDIA_SENDFILE_HEADER = 'X-Sendfile'`` (Apache/lighttpd) the front proxy
+  sends the bytes and Django only emits headers. This is the production path.
+* Otherwise the file is streamed in chunks: asynchronously under ASGI, which
+  has no ``sendfile()``, and as a FileResponse under WSGI.
+
+Content-hashed image variants (``*/variants/*``) never change, so they are
+marked immutable for a year.
+"""
+import mimetypes
+import os
+import re
+import stat
+from urllib.parse import quote
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, parse_http_date_safe
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+CHUNK_SIZE = 64 * 1024
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+
+def parse_range(header, size):
+    """
+    ``(start, end)`` inclusive for a single satisfiable byte range, ``None``
+    to serve the whole file, or ``False`` when the range is unsatisfiable.
+    """
+    match = RANGE_RE.match(header.strip())
+    if not match:
+        # Multiple or malformed ranges: serving the full file is always allowed
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        length = int(last)
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+def _file_range(path, start, end):
+    with open(path, 'rb') as file:
+        file.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = file.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+async def _afile_range(path, start, end):
+    """``_file_range`` for ASGI, which would otherwise read a sync iterator into memory whole"""
+    file = await sync_to_async(open, thread_sensitive=False)(path, 'rb')
+    read = sync_to_async(file.read, thread_sensitive=False)
+    try:
+        file.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = await read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        file.close()
+
+
+def _stream(request, full_path, start, end, **kwargs):
+    chunks = _afile_range if isinstance(request, ASGIRequest) else _file_range
+    return StreamingHttpResponse(chunks(full_path, start, end), **kwargs)
+
+
+def serve_media(request, path):
+    """Serve ``path`` from MEDIA_ROOT with caching, range and offload support"""
+    if request.method not in ('GET', 'HEAD'):
+        return HttpResponse(status=405, headers={'Allow': 'GET, HEAD'})
+
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+        st = os.stat(full_path)
+    except OSError:
+        raise Http404('File not found')
+    if not stat.S_ISREG(st.st_mode):
+        raise Http404('File not found')
+
+    etag = '"%x-%x"' % (st.st_mtime_ns, st.st_size)
+    last_modified = int(st.st_mtime)
+    content_type = mimetypes.guess_type(full_path)[0] or 'application/octet-stream'
+
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        response = not_modified
+    elif settings.MEDIA_ACCEL_REDIRECT_PREFIX:
+        response = HttpResponse(content_type=content_type)
+        # nginx decodes the URI; unquoted spaces or non-ASCII would be MIME-encoded by Django
+        response['X-Accel-Redirect'] = settings.MEDIA_ACCEL_REDIRECT_PREFIX.rstrip('/') + '/' + quote(path)
+    elif settings.MEDIA_SENDFILE_HEADER:
+        response = HttpResponse(content_type=content_type)
+        response[settings.MEDIA_SENDFILE_HEADER] = full_path
+    else:
+        response = _file_response(request, full_path, st.st_size, content_type, etag, last_modified)
+
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    if '/variants/' in '/' + path:
+        patch_cache_control(response, public=True, max_age=IMMUTABLE_MAX_AGE, immutable=True)
+    else:
+        patch_cache_control(response, public=True, max_age=settings.MEDIA_MAX_AGE)
+    return response
+
+
+def _file_response(request, full_path, size, content_type, etag, last_modified):
+    byte_range = None
+    range_header = request.META.get('HTTP_RANGE')
+    if range_header and _if_range_matches(request, etag, last_modified):
+        byte_range = parse_range(range_header, size)
+
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+    elif byte_range is not None:
+        start, end = byte_range
+        if request.method == 'HEAD':
+            response = HttpResponse(status=206, content_type=content_type)
+        else:
+            response = _stream(request, full_path, start, end, status=206, content_type=content_type)
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = str(end - start + 1)
+    elif request.method == 'HEAD':
+        response = HttpResponse(content_type=content_type)
+        response['Content-Length'] = str(size)
+    elif isinstance(request, ASGIRequest):
+        response = _stream(request, full_path, 0, size - 1, content_type=content_type)
+        response['Content-Length'] = str(size)
+    else:
+        response = FileResponse(open(full_path, 'rb'), content_type=content_type)
+
+    response['Accept-Ranges'] = 'bytes'
+    return response
+
+
+def _if_range_matches(request, etag, last_modified):
+    if_range = request.META.get('HTTP_IF_RANGE')
+    if not if_range:
+        return True
+    if if_range.startswith(('"', 'W/')):
+        return if_range == etag
+    return parse_http_date_safe(if_range) == last_modified
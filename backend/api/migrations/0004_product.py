@@ -0,0 +1,38 @@
+# Generated by Django 4.2.7 on 2026-10-18 01:42
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_businessinfo_logo_variants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Product',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('sku', models.CharField(max_length=64)),
+                ('name', models.CharField(max_length=255)),
+                ('category', models.CharField(max_length=100)),
+                ('description', models.TextField(blank=True)),
+                ('price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('in_stock', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('website_setup', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='products', to='api.websitesetup')),
+            ],
+            options={
+                'db_table': 'products',
+                'indexes': [models.Index(fields=['website_setup', 'name', 'id'], name='products_site_name_idx'), models.Index(fields=['website_setup', 'category', 'name', 'id'], name='products_site_cat_name_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='product',
+            constraint=models.UniqueConstraint(fields=('website_setup', 'sku'), name='products_site_sku_uniq'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 4.2.7 on 2026-10-18 01:47
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_product'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Department',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('website_setup', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='departments', to='api.websitesetup')),
+            ],
+            options={
+                'db_table': 'departments',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Doctor',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('title', models.CharField(max_length=100)),
+                ('specialization', models.CharField(max_length=255)),
+                ('email', models.EmailField(max_length=254)),
+                ('experience', models.CharField(max_length=100)),
+                ('photo', models.ImageField(blank=True, null=True, upload_to='doctors/')),
+                ('photo_variants', models.JSONField(blank=True, default=dict, editable=False)),
+                ('certificates', models.JSONField(default=list)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('department', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='doctors', to='api.department')),
+            ],
+            options={
+                'db_table': 'doctors',
+                'ordering': ['name'],
+                'indexes': [models.Index(fields=['department', 'name'], name='doctors_department_name_idx')],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='department',
+            index=models.Index(fields=['website_setup', 'name'], name='departments_site_name_idx'),
+        ),
+    ]
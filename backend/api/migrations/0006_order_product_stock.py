@@ -0,0 +1,70 @@
+# Generated by Django 4.2.7 on 2026-10-18 01:49
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_department_doctor'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Order',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('order_number', models.CharField(max_length=32)),
+                ('idempotency_key', models.CharField(blank=True, max_length=64, null=True)),
+                ('request_hash', models.CharField(blank=True, editable=False, max_length=64)),
+                ('customer_name', models.CharField(max_length=255)),
+                ('customer_email', models.EmailField(blank=True, max_length=254)),
+                ('customer_phone', models.CharField(blank=True, max_length=20)),
+                ('delivery_address', models.TextField(blank=True)),
+                ('payment_method', models.CharField(choices=[('card', 'Card'), ('cash', 'Cash on delivery')], default='cash', max_length=10)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], default='pending', max_length=20)),
+                ('total', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('website_setup', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='orders', to='api.websitesetup')),
+            ],
+            options={
+                'db_table': 'orders',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='stock',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='OrderItem',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('sku', models.CharField(blank=True, max_length=64)),
+                ('name', models.CharField(max_length=255)),
+                ('unit_price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('quantity', models.PositiveIntegerField()),
+                ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='api.order')),
+                ('product', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='order_items', to='api.product')),
+            ],
+            options={
+                'db_table': 'order_items',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['website_setup', '-created_at'], name='orders_site_created_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='order',
+            constraint=models.UniqueConstraint(fields=('website_setup', 'order_number'), name='orders_site_number_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='order',
+            constraint=models.UniqueConstraint(fields=('website_setup', 'idempotency_key'), name='orders_site_idempotency_uniq'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.7 on 2026-10-18 01:52
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_order_product_stock'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='order',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.CreateModel(
+            name='Appointment',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('reference', models.CharField(max_length=64)),
+                ('department_name', models.CharField(blank=True, max_length=255)),
+                ('doctor_name', models.CharField(blank=True, max_length=255)),
+                ('patient_name', models.CharField(max_length=255)),
+                ('patient_email', models.EmailField(blank=True, max_length=254)),
+                ('patient_phone', models.CharField(blank=True, max_length=20)),
+                ('date', models.DateField()),
+                ('time', models.TimeField()),
+                ('reason', models.TextField(blank=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], default='pending', max_length=20)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('department', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='appointments', to='api.department')),
+                ('doctor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='appointments', to='api.doctor')),
+                ('website_setup', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='appointments', to='api.websitesetup')),
+            ],
+            options={
+                'db_table': 'appointments',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['website_setup', '-created_at'], name='appointments_site_created_idx'), models.Index(fields=['doctor', 'date'], name='appointments_doctor_date_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='appointment',
+            constraint=models.UniqueConstraint(fields=('website_setup', 'reference'), name='appointments_site_reference_uniq'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-18 01:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_appointment'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='doctor',
+            name='slots',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
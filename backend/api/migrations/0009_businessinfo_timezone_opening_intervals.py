@@ -0,0 +1,49 @@
+# Generated by Django 4.2.7 on 2026-10-18 01:59
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+from api.hours import opening_ranges
+
+
+def compile_opening_hours(apps, schema_editor):
+    BusinessInfo = apps.get_model('api', 'BusinessInfo')
+    OpeningInterval = apps.get_model('api', 'OpeningInterval')
+    intervals = []
+    for business_id, working_hours in BusinessInfo.objects.values_list('id', 'working_hours').iterator():
+        intervals.extend(
+            OpeningInterval(business_id=business_id, start=start, end=end)
+            for start, end in opening_ranges(working_hours)
+        )
+    OpeningInterval.objects.bulk_create(intervals, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_doctor_slots'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='businessinfo',
+            name='timezone',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.CreateModel(
+            name='OpeningInterval',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('start', models.PositiveSmallIntegerField()),
+                ('end', models.PositiveSmallIntegerField()),
+                ('business', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='opening_intervals', to='api.businessinfo')),
+            ],
+            options={
+                'db_table': 'opening_intervals',
+                'ordering': ['start'],
+                'indexes': [models.Index(fields=['start', 'end'], name='opening_intervals_range_idx')],
+            },
+        ),
+        migrations.RunPython(compile_opening_hours, migrations.RunPython.noop),
+    ]
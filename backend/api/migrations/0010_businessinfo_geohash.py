@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-10-18 02:01
+
+from django.db import migrations, models
+
+from api.geo import GEOHASH_LENGTH, encode
+
+
+def locate_businesses(apps, schema_editor):
+    BusinessInfo = apps.get_model('api', 'BusinessInfo')
+    located = BusinessInfo.objects.filter(latitude__isnull=False, longitude__isnull=False)
+    businesses = []
+    for business in located.only('id', 'latitude', 'longitude').iterator():
+        business.geohash = encode(business.latitude, business.longitude, GEOHASH_LENGTH)
+        businesses.append(business)
+    BusinessInfo.objects.bulk_update(businesses, ['geohash'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_businessinfo_timezone_opening_intervals'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='businessinfo',
+            name='geohash',
+            field=models.CharField(blank=True, editable=False, max_length=12),
+        ),
+        migrations.AddIndex(
+            model_name='businessinfo',
+            index=models.Index(fields=['is_published', 'geohash'], name='business_info_geohash_idx'),
+        ),
+        migrations.RunPython(locate_businesses, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 4.2.7 on 2026-10-18 02:03
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_businessinfo_geohash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DoctorRating',
+            fields=[
+                ('count', models.PositiveIntegerField(default=0)),
+                ('total', models.PositiveIntegerField(default=0)),
+                ('stars_1', models.PositiveIntegerField(default=0)),
+                ('stars_2', models.PositiveIntegerField(default=0)),
+                ('stars_3', models.PositiveIntegerField(default=0)),
+                ('stars_4', models.PositiveIntegerField(default=0)),
+                ('stars_5', models.PositiveIntegerField(default=0)),
+                ('doctor', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='rating', serialize=False, to='api.doctor')),
+            ],
+            options={
+                'db_table': 'doctor_ratings',
+            },
+        ),
+        migrations.CreateModel(
+            name='SiteRating',
+            fields=[
+                ('count', models.PositiveIntegerField(default=0)),
+                ('total', models.PositiveIntegerField(default=0)),
+                ('stars_1', models.PositiveIntegerField(default=0)),
+                ('stars_2', models.PositiveIntegerField(default=0)),
+                ('stars_3', models.PositiveIntegerField(default=0)),
+                ('stars_4', models.PositiveIntegerField(default=0)),
+                ('stars_5', models.PositiveIntegerField(default=0)),
+                ('website_setup', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='rating', serialize=False, to='api.websitesetup')),
+            ],
+            options={
+                'db_table': 'site_ratings',
+            },
+        ),
+        migrations.CreateModel(
+            name='Review',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('reviewer_name', models.CharField(max_length=255)),
+                ('rating', models.PositiveSmallIntegerField()),
+                ('comment', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('doctor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='api.doctor')),
+                ('website_setup', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='api.websitesetup')),
+            ],
+            options={
+                'db_table': 'reviews',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['doctor', '-created_at'], name='reviews_doctor_created_idx'), models.Index(fields=['website_setup', '-created_at'], name='reviews_site_created_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='review',
+            constraint=models.CheckConstraint(check=models.Q(('rating__gte', 1), ('rating__lte', 5)), name='reviews_rating_range'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.7 on 2026-10-18 02:06
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_review'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyOrderStats',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('date', models.DateField()),
+                ('status', models.CharField(max_length=20)),
+                ('count', models.IntegerField(default=0)),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('website_setup', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_order_stats', to='api.websitesetup')),
+            ],
+            options={
+                'db_table': 'daily_order_stats',
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyAppointmentStats',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('date', models.DateField()),
+                ('department_name', models.CharField(blank=True, max_length=255)),
+                ('status', models.CharField(max_length=20)),
+                ('count', models.IntegerField(default=0)),
+                ('website_setup', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_appointment_stats', to='api.websitesetup')),
+            ],
+            options={
+                'db_table': 'daily_appointment_stats',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='dailyorderstats',
+            constraint=models.UniqueConstraint(fields=('website_setup', 'date', 'status'), name='daily_order_stats_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailyappointmentstats',
+            constraint=models.UniqueConstraint(fields=('website_setup', 'date', 'department_name', 'status'), name='daily_appointment_stats_uniq'),
+        ),
+    ]
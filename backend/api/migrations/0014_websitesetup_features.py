@@ -0,0 +1,30 @@
+# Generated by Django 4.2.7 on 2026-10-18 02:11
+
+from django.db import migrations, models
+
+from api.models.website import pack_features
+
+
+def pack_site_features(apps, schema_editor):
+    WebsiteSetup = apps.get_model('api', 'WebsiteSetup')
+    setups = []
+    for setup in WebsiteSetup.objects.iterator():
+        setup.features = pack_features(setup)
+        setups.append(setup)
+    WebsiteSetup.objects.bulk_update(setups, ['features'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_payment'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='websitesetup',
+            name='features',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(pack_site_features, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.7 on 2026-10-18 02:15
+
+from django.db import migrations, models
+
+# The admin searches users by email/name prefix (``istartswith``), which
+# Postgres runs as ``UPPER(col::text) LIKE UPPER('term%')``. Only an index on
+# that expression with pattern ops serves it, and Django can't declare one
+# portably, so these are Postgres only. SQLite's LIKE can't use an index here.
+PREFIX_INDEXES = {
+    'users_email_prefix_idx': 'email',
+    'users_name_prefix_idx': 'name',
+}
+
+
+def create_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    table = schema_editor.quote_name(apps.get_model('api', 'User')._meta.db_table)
+    for name, column in PREFIX_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {schema_editor.quote_name(name)} '
+            f'ON {table} (UPPER({schema_editor.quote_name(column)}::text) text_pattern_ops)'
+        )
+
+
+def drop_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name in PREFIX_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {schema_editor.quote_name(name)}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_websitesetup_features'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['-created_at'], name='users_created_idx'),
+        ),
+        migrations.RunPython(create_prefix_indexes, drop_prefix_indexes),
+    ]
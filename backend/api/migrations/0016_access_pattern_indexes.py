@@ -0,0 +1,65 @@
+# Generated by Django 4.2.7 on 2026-10-18 02:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_user_admin_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['-created_at'], name='appointments_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='businessinfo',
+            index=models.Index(fields=['-created_at'], name='business_info_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='businessinfo',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['timezone'], name='business_info_published_tz_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='businessinfo',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-created_at'], name='business_info_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='department',
+            index=models.Index(fields=['name'], name='departments_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='doctor',
+            index=models.Index(fields=['name'], name='doctors_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['-created_at'], name='orders_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['-created_at'], name='payments_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='paymentevent',
+            index=models.Index(fields=['received_at'], name='payment_events_received_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['-created_at'], name='reviews_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['business_type', '-created_at'], name='users_type_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='websitesetup',
+            index=models.Index(fields=['-created_at'], name='website_setups_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='websitesetup',
+            index=models.Index(fields=['is_paid', '-created_at'], name='website_setups_paid_idx'),
+        ),
+    ]
@@ -0,0 +1,95 @@
+# Generated by Django 4.2.7 on 2026-10-18 02:22
+
+import api.models.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_access_pattern_indexes'),
+    ]
+
+    # Only the Python-side default changes: there is nothing to do in the
+    # database (SQLite would otherwise rebuild every table). Existing rows keep
+    # their uuid4 ids, which stay valid and are referenced from outside (site
+    # URLs, tokens); new rows get time-ordered ids.
+    operations = [
+        migrations.SeparateDatabaseAndState(state_operations=[
+            migrations.AlterField(
+                model_name='appointment',
+                name='id',
+                field=models.UUIDField(default=api.models.fields.uuid7, editable=False, primary_key=True, serialize=False),
+            ),
+            migrations.AlterField(
+                model_name='businessinfo',
+                name='id',
+                field=models.UUIDField(default=api.models.fields.uuid7, editable=False, primary_key=True, serialize=False),
+            ),
+            migrations.AlterField(
+                model_name='dailyappointmentstats',
+                name='id',
+                field=models.UUIDField(default=api.models.fields.uuid7, editable=False, primary_key=True, serialize=False),
+            ),
+            migrations.AlterField(
+                model_name='dailyorderstats',
+                name='id',
+                field=models.UUIDField(default=api.models.fields.uuid7, editable=False, primary_key=True, serialize=False),
+            ),
+            migrations.AlterField(
+                model_name='department',
+                name='id',
+                field=models.UUIDField(default=api.models.fields.uuid7, editable=False, primary_key=True, serialize=False),
+            ),
+            migrations.AlterField(
+                model_name='doctor',
+                name='id',
+                field=models.UUIDField(default=api.models.fields.uuid7, editable=False, primary_key=True, serialize=False),
+            ),
+            migrations.AlterField(
+                model_name='openinginterval',
+                name='id',
+                field=models.UUIDField(default=api.models.fields.uuid7, editable=False, primary_key=True, serialize=False),
+            ),
+            migrations.AlterField(
+                model_name='order',
+                name='id',
+                field=models.UUIDField(default=api.models.fields.uuid7, editable=False, primary_key=True, serialize=False),
+            ),
+            migrations.AlterField(
+                model_name='orderitem',
+                name='id',
+                field=models.UUIDField(default=api.models.fields.uuid7, editable=False, primary_key=True, serialize=False),
+            ),
+            migrations.AlterField(
+                model_name='payment',
+                name='id',
+                field=models.UUIDField(default=api.models.fields.uuid7, editable=False, primary_key=True, serialize=False),
+            ),
+            migrations.AlterField(
+                model_name='paymentevent',
+                name='id',
+                field=models.UUIDField(default=api.models.fields.uuid7, editable=False, primary_key=True, serialize=False),
+            ),
+            migrations.AlterField(
+                model_name='product',
+                name='id',
+                field=models.UUIDField(default=api.models.fields.uuid7, editable=False, primary_key=True, serialize=False),
+            ),
+            migrations.AlterField(
+                model_name='review',
+                name='id',
+                field=models.UUIDField(default=api.models.fields.uuid7, editable=False, primary_key=True, serialize=False),
+            ),
+            migrations.AlterField(
+                model_name='user',
+                name='id',
+                field=models.UUIDField(default=api.models.fields.uuid7, editable=False, primary_key=True, serialize=False),
+            ),
+            migrations.AlterField(
+                model_name='websitesetup',
+                name='id',
+                field=models.UUIDField(default=api.models.fields.uuid7, editable=False, primary_key=True, serialize=False),
+            ),
+        ]),
+    ]
@@ -1,3 +1,11 @@
 from .user import User
 from .website import WebsiteSetup
-from .business import BusinessInfo
\ No newline at end of file
+from .business import BusinessInfo, OpeningInterval
+from .product import Product
+from .department import Department
+from .doctor import Doctor
+from .order import Order, OrderItem
+from .appointment import Appointment
+from .review import Review, DoctorRating, SiteRating
+from .stats import DailyOrderStats, DailyAppointmentStats
+from .payment import Payment, PaymentEvent
\ No newline at end of file
@@ -0,0 +1,53 @@
+from django.db import models
+from django.utils import timezone
+from .fields import UUIDv7Field
+from .department import Department
+from .doctor import Doctor
+from .website import WebsiteSetup
+
+
+class Appointment(models.Model):
+    """Appointment booked by a patient on a hospital site"""
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('completed', 'Completed'),
+        ('cancelled', 'Cancelled'),
+    ]
+
+    id = UUIDv7Field()
+    website_setup = models.ForeignKey(WebsiteSetup, on_delete=models.CASCADE, related_name='appointments')
+    # Reference shown to the patient, e.g. APT-1718035200000-k3j9x2
+    reference = models.CharField(max_length=64)
+    department = models.ForeignKey(Department, on_delete=models.SET_NULL, null=True, blank=True, related_name='appointments')
+    doctor = models.ForeignKey(Doctor, on_delete=models.SET_NULL, null=True, blank=True, related_name='appointments')
+    # Names as booked, kept when the department or doctor is renamed or removed
+    department_name = models.CharField(max_length=255, blank=True)
+    doctor_name = models.CharField(max_length=255, blank=True)
+
+    patient_name = models.CharField(max_length=255)
+    patient_email = models.EmailField(blank=True)
+    patient_phone = models.CharField(max_length=20, blank=True)
+    date = models.DateField()
+    time = models.TimeField()
+    reason = models.TextField(blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+
+    # Not auto_now_add: appointments synced from the browser keep their original time
+    created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.reference} - {self.patient_name}"
+
+    class Meta:
+        db_table = 'appointments'
+        ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(fields=['website_setup', 'reference'], name='appointments_site_reference_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['website_setup', '-created_at'], name='appointments_site_created_idx'),
+            models.Index(fields=['-created_at'], name='appointments_created_idx'),
+            # Booked slots of a doctor over a date range
+            models.Index(fields=['doctor', 'date'], name='appointments_doctor_date_idx'),
+        ]
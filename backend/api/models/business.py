@@ -1,10 +1,10 @@
 from django.db import models
+from .fields import UUIDv7Field
 from .website import WebsiteSetup
-import uuid
 
 class BusinessInfo(models.Model):
     """Business information for the website"""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = UUIDv7Field()
     website_setup = models.OneToOneField(
         WebsiteSetup,
         on_delete=models.CASCADE,
@@ -13,10 +13,14 @@ class BusinessInfo(models.Model):
     
     name = models.CharField(max_length=255)
     logo = models.ImageField(upload_to='logos/', null=True, blank=True)
+    # Resized/WebP variants of the logo, filled in by api/images.py
+    logo_variants = models.JSONField(default=dict, blank=True, editable=False)
     about = models.TextField(blank=True)
     address = models.TextField(blank=True)
     latitude = models.FloatField(null=True, blank=True)
     longitude = models.FloatField(null=True, blank=True)
+    # Geohash of latitude/longitude for nearby searches, see api/geo.py
+    geohash = models.CharField(max_length=12, blank=True, editable=False)
     contact_phone = models.CharField(max_length=20, blank=True)
     contact_email = models.EmailField(blank=True)
     website = models.URLField(blank=True)
@@ -24,6 +28,8 @@ class BusinessInfo(models.Model):
         default=dict,
         help_text="Store working hours as JSON: {monday: {open, close, closed}, ...}"
     )
+    # IANA name the working hours are in; empty means settings.TIME_ZONE
+    timezone = models.CharField(max_length=64, blank=True)
     is_published = models.BooleanField(default=False)
     
     created_at = models.DateTimeField(auto_now_add=True)
@@ -34,4 +40,43 @@ class BusinessInfo(models.Model):
 
     class Meta:
         db_table = 'business_info'
+        indexes = [
+            models.Index(fields=['is_published', 'geohash'], name='business_info_geohash_idx'),
+            models.Index(fields=['-created_at'], name='business_info_created_idx'),
+            # Published businesses only: "open now" reads their time zones,
+            # public listings show the newest first
+            models.Index(
+                fields=['timezone'], condition=models.Q(is_published=True),
+                name='business_info_published_tz_idx'
+            ),
+            models.Index(
+                fields=['-created_at'], condition=models.Q(is_published=True),
+                name='business_info_published_idx'
+            ),
+        ]
 
+
+
+class OpeningInterval(models.Model):
+    """
+    One compiled opening range of a business, in minutes since Monday 00:00
+    local time. Rebuilt from ``working_hours`` whenever BusinessInfo is saved.
+    """
+    id = UUIDv7Field()
+    business = models.ForeignKey(
+        BusinessInfo,
+        on_delete=models.CASCADE,
+        related_name='opening_intervals'
+    )
+    start = models.PositiveSmallIntegerField()
+    end = models.PositiveSmallIntegerField()
+
+    def __str__(self):
+        return f"{self.business_id}: {self.start}-{self.end}"
+
+    class Meta:
+        db_table = 'opening_intervals'
+        ordering = ['start']
+        indexes = [
+            models.Index(fields=['start', 'end'], name='opening_intervals_range_idx'),
+        ]
@@ -1,12 +1,23 @@
 from django.db import models
-from website import WebsiteSetup
-import uuid
+from .fields import UUIDv7Field
+from .website import WebsiteSetup
 
 
 class Department(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    """Hospital department grouping a site's doctors"""
+    id = UUIDv7Field()
     website_setup = models.ForeignKey(WebsiteSetup, on_delete=models.CASCADE, related_name='departments')
     name = models.CharField(max_length=255)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    def __str__(self):
+        return self.name
+
+    class Meta:
+        db_table = 'departments'
+        ordering = ['name']
+        indexes = [
+            models.Index(fields=['website_setup', 'name'], name='departments_site_name_idx'),
+            models.Index(fields=['name'], name='departments_name_idx'),
+        ]
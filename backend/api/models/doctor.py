@@ -1,9 +1,10 @@
 from django.db import models
-from department import Department
-import uuid
+from .fields import UUIDv7Field
+from .department import Department
 
 class Doctor(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    """Doctor listed in a hospital's directory"""
+    id = UUIDv7Field()
     department = models.ForeignKey(Department, on_delete=models.CASCADE, related_name='doctors')
     name = models.CharField(max_length=255)
     title = models.CharField(max_length=100)
@@ -11,7 +12,22 @@ class Doctor(models.Model):
     email = models.EmailField()
     experience = models.CharField(max_length=100)
     photo = models.ImageField(upload_to='doctors/', null=True, blank=True)
+    # Resized/WebP variants of the photo, filled in by api/images.py
+    photo_variants = models.JSONField(default=dict, blank=True, editable=False)
     certificates = models.JSONField(default=list)
+    # Weekly consultation slots: [{"dayOfWeek": 1, "time": "09:00"}, ...], dayOfWeek 0 = Sunday
+    slots = models.JSONField(default=list, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    def __str__(self):
+        return f"{self.title} {self.name}".strip()
+
+    class Meta:
+        db_table = 'doctors'
+        ordering = ['name']
+        indexes = [
+            # Prefetching a department's doctors in directory order
+            models.Index(fields=['department', 'name'], name='doctors_department_name_idx'),
+            models.Index(fields=['name'], name='doctors_name_idx'),
+        ]
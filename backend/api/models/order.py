@@ -0,0 +1,72 @@
+from django.db import models
+from django.utils import timezone
+from .fields import UUIDv7Field
+from .product import Product
+from .website import WebsiteSetup
+
+
+class Order(models.Model):
+    """Pharmacy order placed through a published site's checkout"""
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('completed', 'Completed'),
+        ('cancelled', 'Cancelled'),
+    ]
+    PAYMENT_CHOICES = [
+        ('card', 'Card'),
+        ('cash', 'Cash on delivery'),
+    ]
+
+    id = UUIDv7Field()
+    website_setup = models.ForeignKey(WebsiteSetup, on_delete=models.CASCADE, related_name='orders')
+    # Number shown to the customer, e.g. ORD-4F7K2Q9M
+    order_number = models.CharField(max_length=32)
+    # Client supplied Idempotency-Key; retries with the same key return the same order
+    idempotency_key = models.CharField(max_length=64, null=True, blank=True)
+    # Fingerprint of the checkout request, to reject a key reused for another cart
+    request_hash = models.CharField(max_length=64, blank=True, editable=False)
+
+    customer_name = models.CharField(max_length=255)
+    customer_email = models.EmailField(blank=True)
+    customer_phone = models.CharField(max_length=20, blank=True)
+    delivery_address = models.TextField(blank=True)
+    payment_method = models.CharField(max_length=10, choices=PAYMENT_CHOICES, default='cash')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    total = models.DecimalField(max_digits=10, decimal_places=2)
+
+    # Not auto_now_add: orders synced from the browser keep their original time
+    created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.order_number
+
+    class Meta:
+        db_table = 'orders'
+        ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(fields=['website_setup', 'order_number'], name='orders_site_number_uniq'),
+            models.UniqueConstraint(fields=['website_setup', 'idempotency_key'], name='orders_site_idempotency_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['website_setup', '-created_at'], name='orders_site_created_idx'),
+            # Cross-tenant listings (admin)
+            models.Index(fields=['-created_at'], name='orders_created_idx'),
+        ]
+
+
+class OrderItem(models.Model):
+    """Line of an order; name and price are copied so later catalog edits don't rewrite history"""
+    id = UUIDv7Field()
+    order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name='items')
+    product = models.ForeignKey(Product, on_delete=models.SET_NULL, null=True, blank=True, related_name='order_items')
+    sku = models.CharField(max_length=64, blank=True)
+    name = models.CharField(max_length=255)
+    unit_price = models.DecimalField(max_digits=10, decimal_places=2)
+    quantity = models.PositiveIntegerField()
+
+    def __str__(self):
+        return f"{self.name} x {self.quantity}"
+
+    class Meta:
+        db_table = 'order_items'
@@ -1,13 +1,75 @@
 from django.db import models
-from website import WebsiteSetup
-import uuid
+from .fields import UUIDv7Field
+from .website import WebsiteSetup
 
-class Payment:
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+PAYMENT_METHODS = [('visa', 'Visa/Mastercard'), ('fawry', 'Fawry')]
+PAYMENT_STATUSES = [('pending', 'Pending'), ('completed', 'Completed'), ('failed', 'Failed')]
+
+
+class Payment(models.Model):
+    """Payment for a website (template and features), confirmed by gateway webhooks"""
+    id = UUIDv7Field()
     website_setup = models.ForeignKey(WebsiteSetup, on_delete=models.CASCADE, related_name='payments')
     amount = models.DecimalField(max_digits=10, decimal_places=2)
-    method = models.CharField(max_length=20, choices= [('visa', 'Visa/Mastercard'),('fawry','Fawry')])
-    status = models.CharField(max_length=20, choices=[('pending','Pending'),('completed','Completed'),('failed','Failed')], default='pending')
-    transaction_id = models.CharField(max_length=255,blank=True)
-    created_at= models.DateTimeField(auto_now_add=True)
-    updated_at= models.DateTimeField(auto_now=True)
+    method = models.CharField(max_length=20, choices=PAYMENT_METHODS)
+    status = models.CharField(max_length=20, choices=PAYMENT_STATUSES, default='pending')
+    # Reference shared with the gateway; webhooks are matched on it
+    transaction_id = models.CharField(max_length=255, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.transaction_id} ({self.status})"
+
+    class Meta:
+        db_table = 'payments'
+        ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['method', 'transaction_id'],
+                condition=~models.Q(transaction_id=''),
+                name='payments_transaction_uniq'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['website_setup', '-created_at'], name='payments_site_created_idx'),
+            models.Index(fields=['-created_at'], name='payments_created_idx'),
+        ]
+
+
+class PaymentEvent(models.Model):
+    """
+    Append-only inbox of gateway webhook deliveries. Retries of the same
+    event are dropped by the unique constraint; ``processed_at`` is set once
+    the event has been applied (see api/payments.py).
+    """
+    id = UUIDv7Field()
+    provider = models.CharField(max_length=20, choices=PAYMENT_METHODS)
+    transaction_id = models.CharField(max_length=255)
+    status = models.CharField(max_length=20, choices=PAYMENT_STATUSES)
+    amount = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    payload = models.JSONField(default=dict)
+    received_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    # Why the event was not applied, e.g. an unknown transaction
+    error = models.CharField(max_length=255, blank=True)
+
+    def __str__(self):
+        return f"{self.provider}:{self.transaction_id} {self.status}"
+
+    class Meta:
+        db_table = 'payment_events'
+        ordering = ['received_at']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['provider', 'transaction_id', 'status'], name='payment_events_dedup_uniq'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['received_at'], name='payment_events_received_idx'),
+            # The worker's queue: only unprocessed events are indexed
+            models.Index(
+                fields=['received_at'], condition=models.Q(processed_at__isnull=True),
+                name='payment_events_pending_idx'
+            ),
+        ]
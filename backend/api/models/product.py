@@ -1,15 +1,34 @@
 from django.db import models
-from website import WebsiteSetup
-import uuid
+from .fields import UUIDv7Field
+from .website import WebsiteSetup
 
 
 class Product(models.Model):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    """Catalog item of a pharmacy website"""
+    id = UUIDv7Field()
     website_setup = models.ForeignKey(WebsiteSetup, on_delete=models.CASCADE, related_name='products')
+    # Pharmacy's own stock keeping unit; the key used when re-importing a catalog
+    sku = models.CharField(max_length=64)
     name = models.CharField(max_length=255)
     category = models.CharField(max_length=100)
     description = models.TextField(blank=True)
     price = models.DecimalField(max_digits=10, decimal_places=2)
     in_stock = models.BooleanField(default=True)
+    # Units available for checkout; null when the pharmacy doesn't track stock
+    stock = models.PositiveIntegerField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} ({self.sku})"
+
+    class Meta:
+        db_table = 'products'
+        constraints = [
+            models.UniqueConstraint(fields=['website_setup', 'sku'], name='products_site_sku_uniq'),
+        ]
+        indexes = [
+            # Keyset pagination of a site's catalog, optionally per category
+            models.Index(fields=['website_setup', 'name', 'id'], name='products_site_name_idx'),
+            models.Index(fields=['website_setup', 'category', 'name', 'id'], name='products_site_cat_name_idx'),
+        ]
@@ -0,0 +1,76 @@
+from django.db import models
+from .fields import UUIDv7Field
+from .website import WebsiteSetup
+from .doctor import Doctor
+
+STARS = range(1, 6)
+
+
+class Review(models.Model):
+    """Patient review of a doctor, shown when the site has the review system on"""
+    id = UUIDv7Field()
+    website_setup = models.ForeignKey(WebsiteSetup, on_delete=models.CASCADE, related_name='reviews')
+    doctor = models.ForeignKey(Doctor, on_delete=models.CASCADE, related_name='reviews')
+    reviewer_name = models.CharField(max_length=255)
+    rating = models.PositiveSmallIntegerField()
+    comment = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.rating}★ for {self.doctor_id} by {self.reviewer_name}"
+
+    class Meta:
+        db_table = 'reviews'
+        ordering = ['-created_at']
+        constraints = [
+            models.CheckConstraint(check=models.Q(rating__gte=1, rating__lte=5), name='reviews_rating_range'),
+        ]
+        indexes = [
+            # A doctor's reviews, newest first
+            models.Index(fields=['doctor', '-created_at'], name='reviews_doctor_created_idx'),
+            models.Index(fields=['website_setup', '-created_at'], name='reviews_site_created_idx'),
+            models.Index(fields=['-created_at'], name='reviews_created_idx'),
+        ]
+
+
+class RatingSummary(models.Model):
+    """
+    Running count, sum and histogram of ratings, updated with ``F()``
+    increments in the same transaction as each review insert/delete
+    (see api/reviews.py). Kept apart from Doctor/WebsiteSetup so saving
+    those from a form can't write back stale totals.
+    """
+    count = models.PositiveIntegerField(default=0)
+    total = models.PositiveIntegerField(default=0)
+    stars_1 = models.PositiveIntegerField(default=0)
+    stars_2 = models.PositiveIntegerField(default=0)
+    stars_3 = models.PositiveIntegerField(default=0)
+    stars_4 = models.PositiveIntegerField(default=0)
+    stars_5 = models.PositiveIntegerField(default=0)
+
+    @property
+    def average(self):
+        return round(self.total / self.count, 2) if self.count else None
+
+    @property
+    def histogram(self):
+        return {str(stars): getattr(self, f'stars_{stars}') for stars in STARS}
+
+    class Meta:
+        abstract = True
+
+
+class DoctorRating(RatingSummary):
+    doctor = models.OneToOneField(Doctor, on_delete=models.CASCADE, primary_key=True, related_name='rating')
+
+    class Meta:
+        db_table = 'doctor_ratings'
+
+
+class SiteRating(RatingSummary):
+    website_setup = models.OneToOneField(
+        WebsiteSetup, on_delete=models.CASCADE, primary_key=True, related_name='rating'
+    )
+
+    class Meta:
+        db_table = 'site_ratings'
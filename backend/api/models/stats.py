@@ -0,0 +1,41 @@
+from django.db import models
+from .fields import UUIDv7Field
+from .website import WebsiteSetup
+
+
+class DailyOrderStats(models.Model):
+    """Orders and revenue of one site per day (local date of ``created_at``) and status"""
+    id = UUIDv7Field()
+    website_setup = models.ForeignKey(WebsiteSetup, on_delete=models.CASCADE, related_name='daily_order_stats')
+    date = models.DateField()
+    status = models.CharField(max_length=20)
+    count = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        db_table = 'daily_order_stats'
+        constraints = [
+            # Also the index stats ranges are read through
+            models.UniqueConstraint(fields=['website_setup', 'date', 'status'], name='daily_order_stats_uniq'),
+        ]
+
+
+class DailyAppointmentStats(models.Model):
+    """Appointments of one site per day (local date of ``created_at``), department and status"""
+    id = UUIDv7Field()
+    website_setup = models.ForeignKey(
+        WebsiteSetup, on_delete=models.CASCADE, related_name='daily_appointment_stats'
+    )
+    date = models.DateField()
+    department_name = models.CharField(max_length=255, blank=True)
+    status = models.CharField(max_length=20)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'daily_appointment_stats'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['website_setup', 'date', 'department_name', 'status'],
+                name='daily_appointment_stats_uniq'
+            ),
+        ]
@@ -1,10 +1,10 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
-import  uuid
+from .fields import UUIDv7Field
 
 class User(AbstractUser):
     """Custom User model extending Django's AbstractUser"""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = UUIDv7Field()
     email = models.EmailField(unique=True)
     name = models.CharField(max_length=255)
     business_type = models.CharField(
@@ -14,6 +14,8 @@ class User(AbstractUser):
             ('pharmacy', 'Pharmacy'),
         ]
     )
+    # Bumped whenever a field carried in JWT claims changes, see api/authentication.py
+    token_version = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -22,3 +24,10 @@ class User(AbstractUser):
 
     def __str__(self):
         return f"{self.name} ({self.email})"
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Admin changelist order; prefix search indexes are in 0015_user_admin_indexes
+            models.Index(fields=['-created_at'], name='users_created_idx'),
+            models.Index(fields=['business_type', '-created_at'], name='users_type_created_idx'),
+        ]
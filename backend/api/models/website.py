@@ -1,9 +1,39 @@
 from django.db import models
+from .fields import UUIDv7Field
 from .user import User
-import uuid
+
+# Boolean feature columns on WebsiteSetup, in bit order: append new features,
+# never reorder, since stored masks depend on the positions
+FEATURE_FIELDS = [
+    'review_system', 'ai_chatbot', 'ambulance_ordering',
+    'patient_portal', 'prescription_refill',
+]
+FEATURE_BITS = {name: 1 << position for position, name in enumerate(FEATURE_FIELDS)}
+
+
+def feature_bit(name):
+    try:
+        return FEATURE_BITS[name]
+    except KeyError:
+        raise ValueError(f'Unknown feature: {name}')
+
+
+def pack_features(setup):
+    """Bitmask of the feature flags set on ``setup``"""
+    mask = 0
+    for name, bit in FEATURE_BITS.items():
+        if getattr(setup, name):
+            mask |= bit
+    return mask
+
+
+def unpack_features(mask):
+    return [name for name, bit in FEATURE_BITS.items() if mask & bit]
+
+
 class WebsiteSetup(models.Model):
     """Main website configuration for each user"""
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = UUIDv7Field()
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='website_setup')
     
     # Hospital features
@@ -12,6 +42,8 @@ class WebsiteSetup(models.Model):
     ambulance_ordering = models.BooleanField(default=False)
     patient_portal = models.BooleanField(default=False)
     prescription_refill = models.BooleanField(default=False)
+    # The flags above packed by FEATURE_BITS, kept in step on save
+    features = models.PositiveIntegerField(default=0, editable=False)
     
     # Pharmacy template
     template_id = models.IntegerField(null=True, blank=True)
@@ -26,5 +58,25 @@ class WebsiteSetup(models.Model):
     def __str__(self):
         return f"Website Setup for {self.user.name}"
 
+    def save(self, *args, **kwargs):
+        self.features = pack_features(self)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'features' not in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'features'}
+        super().save(*args, **kwargs)
+
+    def has(self, feature):
+        """Whether ``feature`` (a FEATURE_FIELDS name) is switched on"""
+        return bool(self.features & feature_bit(feature))
+
+    @property
+    def enabled_features(self):
+        """Names of the features switched on for this site"""
+        return unpack_features(self.features)
+
     class Meta:
-        db_table = 'website_setups'
\ No newline at end of file
+        db_table = 'website_setups'
+        indexes = [
+            models.Index(fields=['-created_at'], name='website_setups_created_idx'),
+            models.Index(fields=['is_paid', '-created_at'], name='website_setups_paid_idx'),
+        ]
\ No newline at end of file
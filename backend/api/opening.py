@@ -0,0 +1,128 @@
+"""
+"Open now" across every published business.
+
+Working hours are compiled on save into ``OpeningInterval`` rows (minutes of
+the week, local time; see ``api.hours``). Answering "who is open at T" is
+then one indexed query: for each time zone in use (a tiny distinct lookup),
+T is converted to a local minute of the week ``m`` and matched with
+``start <= m < end``. Intervals of
+a business never overlap, so each open business matches exactly one row and
+the interval's ``end`` gives its closing time.
+
+Results are cached per minute under a version that any BusinessInfo change
+bumps, so a listing polled by many visitors costs one query a minute.
+"""
+from datetime import timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .cache import LocalCache, bump_version, get_version
+from .hours import MINUTES_PER_WEEK, minute_of_week, opening_ranges
+from .models import BusinessInfo, OpeningInterval
+
+OPENING_HOURS_KEY = 'opening-hours-version'
+
+_results = LocalCache(maxsize=64)
+
+
+def business_timezone(name):
+    """``ZoneInfo`` for a BusinessInfo.timezone value, falling back to settings"""
+    try:
+        return ZoneInfo(name or settings.TIME_ZONE)
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo(settings.TIME_ZONE)
+
+
+def store_opening_intervals(business):
+    """Replace a business's compiled intervals with its current working hours"""
+    intervals = opening_ranges(business.working_hours)
+    with transaction.atomic():
+        OpeningInterval.objects.filter(business=business).delete()
+        OpeningInterval.objects.bulk_create([
+            OpeningInterval(business=business, start=start, end=end)
+            for start, end in intervals
+        ])
+    opening_hours_changed()
+
+
+def opening_hours_changed():
+    """Invalidate cached "open now" results everywhere once the transaction commits"""
+    bump_version(OPENING_HOURS_KEY)
+
+
+def _closing_time(moment, minute, end):
+    closes = moment + timedelta(minutes=end - minute)
+    return closes.replace(second=0, microsecond=0)
+
+
+def find_open_businesses(moment, business_type=None):
+    """Published businesses open at the aware datetime ``moment``"""
+    zones = (
+        BusinessInfo.objects
+        .filter(is_published=True)
+        .order_by()
+        .values_list('timezone', flat=True)
+        .distinct()
+    )
+    minutes = {}
+    condition = Q()
+    for name in zones:
+        minute = minute_of_week(moment.astimezone(business_timezone(name)))
+        minutes[name] = minute
+        condition |= Q(
+            timezone=name,
+            opening_intervals__start__lte=minute,
+            opening_intervals__end__gt=minute,
+        )
+    if not minutes:
+        return []
+
+    businesses = BusinessInfo.objects.filter(condition, is_published=True)
+    if business_type:
+        businesses = businesses.filter(website_setup__user__business_type=business_type)
+    rows = businesses.order_by('name').values(
+        'website_setup_id', 'name', 'address', 'latitude', 'longitude',
+        'contact_phone', 'timezone', 'website_setup__user__business_type',
+        'opening_intervals__start', 'opening_intervals__end',
+    )
+
+    results = []
+    for row in rows:
+        start, end = row['opening_intervals__start'], row['opening_intervals__end']
+        local = moment.astimezone(business_timezone(row['timezone']))
+        results.append({
+            'site_id': str(row['website_setup_id']),
+            'name': row['name'],
+            'business_type': row['website_setup__user__business_type'],
+            'address': row['address'],
+            'latitude': row['latitude'],
+            'longitude': row['longitude'],
+            'contact_phone': row['contact_phone'],
+            # None for businesses open round the clock
+            'closes_at': None if (start, end) == (0, MINUTES_PER_WEEK) else (
+                _closing_time(local, minutes[row['timezone']], end).isoformat()
+            ),
+        })
+    return results
+
+
+def open_businesses(moment=None, business_type=None):
+    """Cached ``find_open_businesses`` for the minute containing ``moment`` (default now)"""
+    moment = (moment or timezone.now()).replace(second=0, microsecond=0)
+    version = get_version(OPENING_HOURS_KEY)
+    key = f'open-now:{version}:{moment.timestamp():.0f}:{business_type or ""}'
+
+    payload = _results.get(key)
+    if payload is None:
+        payload = cache.get(key)
+        if payload is None:
+            payload = find_open_businesses(moment, business_type)
+            # Keys change every minute, so entries only need to outlive theirs
+            cache.set(key, payload, timeout=120)
+        _results.set(key, payload)
+    return payload
@@ -0,0 +1,203 @@
+"""
+Server-side checkout for pharmacy sites.
+
+Stock is reserved with one conditional ``UPDATE ... SET stock = stock - n
+WHERE id = ? AND stock >= n`` per line, never by reading a quantity and
+writing it back, so concurrent checkouts of the same product cannot
+oversell. Everything that only reads (validating the cart, pricing it) runs
+before the transaction opens; inside it a checkout does just the order
+insert, one update per product (in primary key order, so two carts can't
+deadlock) and one bulk insert of the lines. Row locks on a hot product are
+therefore held for a few milliseconds and a flash sale on one medication
+doesn't hold up checkouts of anything else.
+
+Checkouts are idempotent per client ``Idempotency-Key``: the key is claimed
+by the order insert (unique per site), so a retried or duplicated request
+returns the original order instead of reserving stock twice.
+"""
+import hashlib
+import json
+import secrets
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Order, OrderItem, Product
+from .stats import order_status_changed
+
+ORDER_NUMBER_ALPHABET = '23456789ABCDEFGHJKLMNPQRSTUVWXYZ'
+
+
+class CheckoutError(Exception):
+    """Raised when a cart can't be checked out; ``detail`` is returned to the client"""
+
+    def __init__(self, detail):
+        super().__init__(detail)
+        self.detail = detail
+
+
+class OutOfStock(CheckoutError):
+    """Raised when there are not enough units left of some products"""
+
+    def __init__(self, product_ids):
+        super().__init__({
+            'error': 'Some products are out of stock.',
+            'products': [str(product_id) for product_id in product_ids],
+        })
+
+
+class IdempotencyConflict(CheckoutError):
+    """Raised when an Idempotency-Key is reused for a different checkout"""
+
+    def __init__(self):
+        super().__init__({'error': 'Idempotency-Key was already used for a different order.'})
+
+
+def new_order_number():
+    return 'ORD-' + ''.join(secrets.choice(ORDER_NUMBER_ALPHABET) for _ in range(8))
+
+
+def request_fingerprint(data):
+    return hashlib.sha256(
+        json.dumps(data, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def merge_lines(items):
+    """``{product_id: quantity}`` with repeated products added up"""
+    quantities = {}
+    for item in items:
+        quantities[item['product']] = quantities.get(item['product'], 0) + item['quantity']
+    return quantities
+
+
+def reserve_stock(product_id, quantity):
+    """
+    Take ``quantity`` units of a product in one conditional update. Products
+    without tracked stock always succeed. Must run inside a transaction.
+    """
+    reserved = (
+        Product.objects
+        .filter(pk=product_id, stock__gte=quantity)
+        .update(stock=F('stock') - quantity)
+    )
+    if reserved:
+        return True
+    return Product.objects.filter(pk=product_id, stock__isnull=True).exists()
+
+
+def release_stock(product_id, quantity):
+    Product.objects.filter(pk=product_id, stock__isnull=False).update(stock=F('stock') + quantity)
+
+
+def place_order(website_setup_id, data, idempotency_key=None):
+    """
+    Create an order for validated checkout ``data`` (customer fields,
+    ``payment_method`` and ``items`` of ``{product, quantity}``).
+
+    Returns ``(order, created)``; ``created`` is False when the
+    ``idempotency_key`` was already used for this same checkout.
+    """
+    fingerprint = request_fingerprint(data)
+    if idempotency_key:
+        existing = _existing_order(website_setup_id, idempotency_key, fingerprint)
+        if existing is not None:
+            return existing, False
+
+    quantities = merge_lines(data['items'])
+    products = {
+        product.pk: product
+        for product in Product.objects.filter(
+            website_setup_id=website_setup_id, pk__in=quantities
+        ).only('id', 'sku', 'name', 'price', 'in_stock')
+    }
+    unavailable = [
+        product_id for product_id in quantities
+        if product_id not in products or not products[product_id].in_stock
+    ]
+    if unavailable:
+        raise OutOfStock(unavailable)
+
+    lines = [
+        OrderItem(
+            product_id=product_id,
+            sku=products[product_id].sku,
+            name=products[product_id].name,
+            unit_price=products[product_id].price,
+            quantity=quantity,
+        )
+        for product_id, quantity in sorted(quantities.items())
+    ]
+
+    try:
+        with transaction.atomic():
+            order = Order.objects.create(
+                website_setup_id=website_setup_id,
+                order_number=new_order_number(),
+                idempotency_key=idempotency_key or None,
+                request_hash=fingerprint,
+                customer_name=data['customer_name'],
+                customer_email=data.get('customer_email', ''),
+                customer_phone=data.get('customer_phone', ''),
+                delivery_address=data.get('delivery_address', ''),
+                payment_method=data['payment_method'],
+                total=sum(line.unit_price * line.quantity for line in lines),
+            )
+            sold_out = [line.product_id for line in lines if not reserve_stock(line.product_id, line.quantity)]
+            if sold_out:
+                raise OutOfStock(sold_out)
+            for line in lines:
+                line.order = order
+            OrderItem.objects.bulk_create(lines)
+    except IntegrityError:
+        # A concurrent request claimed the same key first
+        existing = idempotency_key and _existing_order(website_setup_id, idempotency_key, fingerprint)
+        if not existing:
+            raise
+        return existing, False
+
+    return order, True
+
+
+def _existing_order(website_setup_id, idempotency_key, fingerprint):
+    order = (
+        Order.objects
+        .filter(website_setup_id=website_setup_id, idempotency_key=idempotency_key)
+        .prefetch_related('items')
+        .first()
+    )
+    if order is not None and order.request_hash != fingerprint:
+        raise IdempotencyConflict()
+    return order
+
+
+def cancel_order(order):
+    """Cancel a pending order and put its units back in stock; False if it wasn't pending"""
+    with transaction.atomic():
+        # Conditional, so two cancels can't both restock
+        cancelled = Order.objects.filter(pk=order.pk, status='pending').update(
+            status='cancelled', updated_at=timezone.now()
+        )
+        if not cancelled:
+            return False
+        for product_id, quantity in sorted(
+            order.items.filter(product__isnull=False).values_list('product_id', 'quantity')
+        ):
+            release_stock(product_id, quantity)
+        order.status = 'cancelled'
+        order_status_changed(order, 'pending')
+    return True
+
+
+def complete_order(order):
+    """Mark a pending order as completed; False if it wasn't pending"""
+    with transaction.atomic():
+        completed = Order.objects.filter(pk=order.pk, status='pending').update(
+            status='completed', updated_at=timezone.now()
+        )
+        if not completed:
+            return False
+        order.status = 'completed'
+        order_status_changed(order, 'pending')
+    return True
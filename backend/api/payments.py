@@ -0,0 +1,250 @@
+"""
+Website payments and gateway webhook ingestion.
+
+Webhooks only verify the signature and append the event to the
+``PaymentEvent`` inbox with a single ``INSERT ... ON CONFLICT DO NOTHING``:
+retries of an event the gateway already delivered are dropped by the
+``(provider, transaction_id, status)`` constraint, and the request is
+acknowledged without touching ``Payment`` rows. Bursts therefore cost one
+insert per delivery.
+
+A worker applies unprocessed events in batches: one query for the batch,
+one for the payments it mentions, then bulk updates of the payments, the
+sites they paid for and the events themselves. Status only moves forward
+(``pending`` -> ``failed``/``completed``, ``failed`` -> ``completed``), so
+out-of-order deliveries can't undo a completed payment. The worker runs in
+a background thread of the web process, woken after each delivery, or as
+``manage.py process_payment_events --loop`` when ``PAYMENT_EVENTS_IN_PROCESS``
+is off.
+"""
+import hashlib
+import hmac
+import json
+import logging
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.db import close_old_connections, connections, transaction
+from django.utils import timezone
+
+from .cache import bump_site_version
+from .models import Payment, PaymentEvent, WebsiteSetup
+from .models.payment import PAYMENT_METHODS, PAYMENT_STATUSES
+
+logger = logging.getLogger(__name__)
+
+PROVIDERS = {method for method, label in PAYMENT_METHODS}
+STATUSES = {status for status, label in PAYMENT_STATUSES}
+
+# Status changes an event may apply; anything else is recorded and ignored
+TRANSITIONS = {
+    'pending': {'completed', 'failed'},
+    # A failed attempt can still be paid on retry
+    'failed': {'completed'},
+    'completed': set(),
+}
+
+
+class InvalidWebhook(Exception):
+    """Raised for deliveries with a bad signature or payload"""
+
+
+def new_transaction_id():
+    return 'PAY-' + secrets.token_hex(8).upper()
+
+
+def start_payment(website_setup, method):
+    """Pending payment of the site's ``total_price`` to hand over to the gateway"""
+    return Payment.objects.create(
+        website_setup=website_setup,
+        amount=website_setup.total_price,
+        method=method,
+        transaction_id=new_transaction_id(),
+    )
+
+
+def sign(provider, body):
+    """Hex HMAC-SHA256 of a webhook body with the provider's shared secret"""
+    secret = settings.PAYMENT_WEBHOOK_SECRETS.get(provider) or ''
+    return hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def parse_event(provider, body, signature):
+    """Verify and parse a webhook delivery into PaymentEvent fields"""
+    if provider not in PROVIDERS:
+        raise InvalidWebhook('Unknown payment provider.')
+    if not settings.PAYMENT_WEBHOOK_SECRETS.get(provider):
+        raise InvalidWebhook('Webhooks are not configured for this provider.')
+    if not signature or not hmac.compare_digest(sign(provider, body), signature):
+        raise InvalidWebhook('Invalid signature.')
+
+    try:
+        payload = json.loads(body)
+        transaction_id = str(payload['transaction_id']).strip()
+        status = str(payload['status']).strip().lower()
+        amount = payload.get('amount')
+        amount = None if amount is None else Decimal(str(amount)).quantize(Decimal('0.01'))
+    except (ValueError, KeyError, TypeError, InvalidOperation):
+        raise InvalidWebhook('Expected JSON with transaction_id, status and optional amount.')
+    if not transaction_id or len(transaction_id) > 255 or status not in STATUSES:
+        raise InvalidWebhook('Expected JSON with transaction_id, status and optional amount.')
+
+    return {
+        'provider': provider,
+        'transaction_id': transaction_id,
+        'status': status,
+        'amount': amount,
+        'payload': payload,
+    }
+
+
+def receive_event(provider, body, signature):
+    """Append a verified delivery to the inbox; duplicates are silently dropped"""
+    event = parse_event(provider, body, signature)
+    PaymentEvent.objects.bulk_create([PaymentEvent(**event)], ignore_conflicts=True)
+    if settings.PAYMENT_EVENTS_IN_PROCESS:
+        transaction.on_commit(wake_worker)
+
+
+def payments_for(events):
+    """
+    Payments the events may refer to, looked up on the unique
+    (method, transaction_id) index; callers match them up by both fields.
+    """
+    return (
+        Payment.objects
+        .filter(
+            method__in={event.provider for event in events},
+            transaction_id__in={event.transaction_id for event in events},
+        )
+        # Repeating the unique constraint's condition lets the planner use it
+        .exclude(transaction_id='')
+        .order_by()
+    )
+
+
+def process_events(batch_size=None):
+    """Apply one batch of unprocessed events; returns how many were processed"""
+    now = timezone.now()
+    with transaction.atomic():
+        events = list(
+            PaymentEvent.objects
+            .filter(processed_at__isnull=True)
+            .order_by('received_at')
+            # Several workers can drain the inbox without waiting on each other
+            .select_for_update(skip_locked=True)
+            [:batch_size or settings.PAYMENT_EVENT_BATCH_SIZE]
+        )
+        if not events:
+            return 0
+
+        payments = {
+            (payment.method, payment.transaction_id): payment
+            for payment in payments_for(events).select_for_update()
+        }
+        changed = {}
+        paid_sites = set()
+        for event in events:
+            event.processed_at = now
+            payment = payments.get((event.provider, event.transaction_id))
+            if payment is None:
+                event.error = 'Unknown transaction.'
+            elif event.amount is not None and event.amount != payment.amount:
+                event.error = f'Amount {event.amount} does not match {payment.amount}.'
+            elif event.status == payment.status:
+                continue
+            elif event.status not in TRANSITIONS[payment.status]:
+                event.error = f'Ignored {payment.status} -> {event.status}.'
+            else:
+                payment.status = event.status
+                payment.updated_at = now
+                changed[payment.pk] = payment
+                if payment.status == 'completed':
+                    paid_sites.add(payment.website_setup_id)
+
+        Payment.objects.bulk_update(changed.values(), ['status', 'updated_at'])
+        # updated_at too, so the dashboard's ETag changes
+        WebsiteSetup.objects.filter(pk__in=paid_sites).update(is_paid=True, updated_at=now)
+        # update() skips the post_save receiver that invalidates cached site data
+        for site_id in paid_sites:
+            bump_site_version(site_id)
+        PaymentEvent.objects.bulk_update(events, ['processed_at', 'error'])
+    return len(events)
+
+
+def process_pending(batch_size=None):
+    """Apply events until the inbox is empty; returns how many were processed"""
+    processed = 0
+    while True:
+        count = process_events(batch_size)
+        if not count:
+            return processed
+        processed += count
+
+
+_executor = None
+_executor_lock = threading.Lock()
+_wakeup = threading.Lock()
+_state = {'running': False, 'pending': False}
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='payment-events')
+    return _executor
+
+
+def _worker_job():
+    close_old_connections()
+    try:
+        while True:
+            with _wakeup:
+                if not _state['pending']:
+                    _state['running'] = False
+                    return
+                _state['pending'] = False
+            try:
+                process_pending()
+            except Exception:
+                logger.exception('Applying payment events failed')
+    finally:
+        # Worker threads must not keep database connections open
+        connections.close_all()
+
+
+def wake_worker():
+    """Make the background worker drain the inbox; a burst starts at most one run"""
+    with _wakeup:
+        _state['pending'] = True
+        if _state['running']:
+            return
+        _state['running'] = True
+    get_executor().submit(_worker_job)
+
+
+class FakeGateway:
+    """
+    Stand-in for a payment gateway in development and tests: produces signed
+    webhook deliveries for a payment, as the real gateway would send them.
+    """
+
+    def __init__(self, provider='visa'):
+        self.provider = provider
+
+    def webhook(self, transaction_id, status, amount=None):
+        """``(body, signature)`` of a delivery reporting ``status``"""
+        payload = {'transaction_id': transaction_id, 'status': status}
+        if amount is not None:
+            payload['amount'] = str(amount)
+        body = json.dumps(payload).encode()
+        return body, sign(self.provider, body)
+
+    def deliver(self, payment, status):
+        """Deliver a webhook for ``payment`` straight to the inbox"""
+        receive_event(self.provider, *self.webhook(payment.transaction_id, status, payment.amount))
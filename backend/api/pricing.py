@@ -0,0 +1,100 @@
+"""
+Server-side pricing of a website setup.
+
+The price of a site depends only on its business type, the features it
+switches on and its template. The feature part is compiled at import into
+one total per feature mask (see ``FEATURE_BITS``), so pricing any
+combination is a list lookup; quotes are memoized per combination and never
+touch the database, which lets the setup wizards ask for one on every
+toggle. ``WebsiteSetupSerializer`` stores the quoted total, so clients can
+no longer choose what they pay.
+"""
+from decimal import Decimal
+from functools import lru_cache
+
+from .models.website import FEATURE_BITS, FEATURE_FIELDS, unpack_features
+
+# Price of each paid feature by business type; unlisted features are free
+FEATURE_PRICES = {
+    'hospital': {
+        'review_system': Decimal('19.00'),
+        'ai_chatbot': Decimal('29.00'),
+        'ambulance_ordering': Decimal('29.00'),
+    },
+    'pharmacy': {},
+}
+
+# Site templates by business type and ``template_id``
+TEMPLATE_PRICES = {
+    'hospital': {},
+    'pharmacy': {
+        1: Decimal('25.00'),
+        2: Decimal('20.00'),
+        3: Decimal('15.00'),
+    },
+}
+
+
+def _compile(prices):
+    """Total price of every feature mask, indexed by mask"""
+    totals = [Decimal('0.00')] * (1 << len(FEATURE_FIELDS))
+    for mask in range(1, len(totals)):
+        lowest = mask & -mask
+        name = FEATURE_FIELDS[lowest.bit_length() - 1]
+        totals[mask] = totals[mask ^ lowest] + prices.get(name, Decimal('0.00'))
+    return totals
+
+
+FEATURE_TOTALS = {business_type: _compile(prices) for business_type, prices in FEATURE_PRICES.items()}
+
+
+def feature_mask(features):
+    """Mask of an iterable of feature names; raises ValueError for unknown ones"""
+    mask = 0
+    for name in features:
+        if name not in FEATURE_BITS:
+            raise ValueError(f'Unknown feature: {name}')
+        mask |= FEATURE_BITS[name]
+    return mask
+
+
+def validate_template(business_type, template_id):
+    if template_id is not None and template_id not in TEMPLATE_PRICES[business_type]:
+        raise ValueError(f'Unknown template: {template_id}')
+
+
+@lru_cache(maxsize=1024)
+def _quote(business_type, mask, template_id):
+    prices = FEATURE_PRICES[business_type]
+    items = [
+        {'item': name, 'price': str(prices[name])}
+        for name in unpack_features(mask) if name in prices
+    ]
+    total = FEATURE_TOTALS[business_type][mask]
+    if template_id is not None:
+        price = TEMPLATE_PRICES[business_type][template_id]
+        items.append({'item': f'template_{template_id}', 'price': str(price)})
+        total += price
+    return {
+        'business_type': business_type,
+        'features': unpack_features(mask),
+        'template_id': template_id,
+        'items': items,
+        'total': str(total),
+    }
+
+
+def quote(business_type, mask, template_id=None):
+    """
+    Itemized price of a setup as a JSON-ready dict. Results are shared
+    between callers and must not be modified.
+    """
+    if business_type not in FEATURE_PRICES:
+        raise ValueError(f'Unknown business type: {business_type}')
+    validate_template(business_type, template_id)
+    return _quote(business_type, mask, template_id)
+
+
+def setup_price(business_type, mask, template_id=None):
+    """Total of ``quote`` as a Decimal, for storing in ``total_price``"""
+    return Decimal(quote(business_type, mask, template_id)['total'])
@@ -0,0 +1,280 @@
+"""
+EXPLAIN checks for the querysets the API and the admin run.
+
+Each check builds a queryset the way the code under test does and asks the
+database for its plan. A check fails when the plan reads a whole table:
+
+- SQLite: a ``SCAN <table>`` step that doesn't use an index, or walks a
+  whole index: without a LIMIT, or only to sort the rows afterwards
+  (``USE TEMP B-TREE FOR ORDER BY``).
+- Postgres: a ``Seq Scan``, or an index scan without an index condition
+  whose output isn't cut short by a LIMIT (a full index walk). Plans are
+  taken with ``enable_seqscan`` off so that the planner's preference for
+  sequential scans on small development tables doesn't hide missing indexes.
+
+Walking a partial index is fine either way, it only holds the wanted rows.
+
+Querysets come from three places, so new code is covered without edits:
+every viewset registered on the API router (with each of its
+``filterset_fields``), every admin changelist (with each simple
+``list_filter``), and the explicit ``PATH_CHECKS`` below for function-based
+public endpoints and background work. Text searches (``icontains``) are not
+checked, they scan by design.
+
+Run with ``manage.py check_query_plans``.
+"""
+import json
+import re
+import uuid
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib import admin
+from django.db import connections, models, transaction
+from django.test import RequestFactory
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from .geo import START_PRECISION, block, _candidates
+from .models import (
+    Appointment, BusinessInfo, DailyAppointmentStats, DailyOrderStats, Department, Doctor,
+    Order, PaymentEvent, Product, Review, User, WebsiteSetup,
+)
+from .payments import payments_for
+
+SQLITE_SCAN = re.compile(r'\bSCAN (\S+)(?: USING (?:COVERING )?INDEX (\S+))?')
+
+# Postgres nodes that read all of their input before returning a row
+BLOCKING_NODES = {'Sort', 'Hash', 'Aggregate', 'Materialize', 'SetOp', 'WindowAgg'}
+
+
+@dataclass
+class PlanCheck:
+    name: str
+    queryset: object
+    full_scans: list = field(default_factory=list)
+    plan: str = ''
+
+    @property
+    def ok(self):
+        return not self.full_scans
+
+
+def _sample_value(model, name):
+    """A value of the right type for an exact filter on ``name``"""
+    model_field = model._meta.get_field(name)
+    if model_field.choices:
+        return model_field.choices[0][0]
+    if isinstance(model_field, models.BooleanField):
+        return True
+    if isinstance(model_field, models.ForeignKey):
+        return uuid.uuid4()
+    if isinstance(model_field, models.DateTimeField):
+        return timezone.now()
+    if isinstance(model_field, models.DateField):
+        return timezone.localdate()
+    if isinstance(model_field, (models.IntegerField, models.DecimalField)):
+        return 1
+    return 'x'
+
+
+def _sample_user():
+    return User(pk=uuid.uuid4(), email='explain@example.com', business_type='pharmacy')
+
+
+def viewset_checks():
+    """List querysets of every router viewset, plus one per filterset field"""
+    from .urls import router
+
+    user = _sample_user()
+    factory = APIRequestFactory()
+    for prefix, viewset, basename in router.registry:
+        request = factory.get(f'/api/{prefix}/')
+        force_authenticate(request, user=user)
+        view = viewset(action_map={'get': 'list'}, basename=basename)
+        view.args, view.kwargs, view.format_kwarg = (), {}, None
+        view.request = view.initialize_request(request)
+        view.action = 'list'
+
+        queryset = view.get_queryset()
+        paginator = view.paginator
+        if getattr(paginator, 'ordering', None):
+            queryset = queryset.order_by(*paginator.ordering)
+        page_size = getattr(paginator, 'page_size', None) or settings.REST_FRAMEWORK['PAGE_SIZE']
+
+        yield f'api {prefix}', queryset[:page_size]
+        for name in getattr(view, 'filterset_fields', None) or []:
+            value = _sample_value(queryset.model, name)
+            yield f'api {prefix}?{name}=', queryset.filter(**{name: value})[:page_size]
+
+
+def _filter_params(model, list_filter):
+    if not isinstance(list_filter, str):
+        return None
+    model_field = model._meta.get_field(list_filter)
+    if isinstance(model_field, (models.DateField, models.DateTimeField)):
+        # As DateFieldListFilter links them: dates, or aware midnights
+        today = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+        if not isinstance(model_field, models.DateTimeField):
+            today = today.date()
+        return {
+            f'{list_filter}__gte': str(today),
+            f'{list_filter}__lt': str(today + timedelta(days=1)),
+        }
+    if isinstance(model_field, models.BooleanField):
+        return {f'{list_filter}__exact': '1'}
+    if model_field.choices:
+        return {f'{list_filter}__exact': model_field.choices[0][0]}
+    return None
+
+
+def admin_checks():
+    """The page querysets of every admin changelist, unfiltered and per list filter"""
+    superuser = User(pk=uuid.uuid4(), is_active=True, is_staff=True, is_superuser=True)
+    factory = RequestFactory()
+    for model, model_admin in admin.site._registry.items():
+        label = f'admin {model._meta.model_name}'
+        variants = [('', {})]
+        for list_filter in model_admin.get_list_filter(None):
+            params = _filter_params(model, list_filter)
+            if params:
+                variants.append((f'?{list_filter}', params))
+        for suffix, params in variants:
+            request = factory.get('/admin/', params)
+            request.user = superuser
+            changelist = model_admin.get_changelist_instance(request)
+            yield label + suffix, changelist.queryset[:changelist.list_per_page]
+
+
+def _nearby():
+    cells, covered = block(30.0444, 31.2357, START_PRECISION)
+    return _candidates(cells, 'pharmacy')
+
+
+# Function-based views and background jobs, built the way the code builds them
+PATH_CHECKS = {
+    'public bundle products': lambda site, other: (
+        Product.objects.filter(website_setup_id=site)
+        .values('category').annotate(count=models.Count('id')).order_by('category')
+    ),
+    'public products': lambda site, other: (
+        Product.objects.filter(website_setup_id=site).order_by('name', 'id')[:50]
+    ),
+    'public directory': lambda site, other: (
+        Department.objects.filter(website_setup_id=site).order_by('name', 'id')
+    ),
+    'public directory doctors': lambda site, other: (
+        Doctor.objects.filter(department_id__in=[other]).order_by('name', 'id')
+    ),
+    'public reviews': lambda site, other: (
+        Review.objects.filter(doctor_id=other).order_by('-created_at', '-id')[:20]
+    ),
+    'public availability bookings': lambda site, other: (
+        Appointment.objects.filter(doctor_id=other, date__gte=timezone.localdate())
+        .exclude(status='cancelled').values_list('id', 'date', 'time')
+    ),
+    'public open now timezones': lambda site, other: (
+        BusinessInfo.objects.filter(is_published=True).order_by()
+        .values_list('timezone', flat=True).distinct()
+    ),
+    'public open now': lambda site, other: (
+        BusinessInfo.objects.filter(
+            timezone='', is_published=True,
+            opening_intervals__start__lte=600, opening_intervals__end__gt=600,
+        )
+    ),
+    'public nearby': lambda site, other: _nearby(),
+    'dashboard stats orders': lambda site, other: (
+        DailyOrderStats.objects.filter(
+            website_setup_id=site, date__range=(timezone.localdate() - timedelta(days=30), timezone.localdate())
+        )
+    ),
+    'dashboard stats appointments': lambda site, other: (
+        DailyAppointmentStats.objects.filter(
+            website_setup_id=site, date__range=(timezone.localdate() - timedelta(days=30), timezone.localdate())
+        )
+    ),
+    'order sync stats rebuild': lambda site, other: (
+        Order.objects.filter(website_setup_id=site, created_at__gte=timezone.now() - timedelta(days=1))
+    ),
+    'payment events pending': lambda site, other: (
+        PaymentEvent.objects.filter(processed_at__isnull=True).order_by('received_at')[:200]
+    ),
+    'payment events payments': lambda site, other: payments_for([
+        PaymentEvent(provider='visa', transaction_id='PAY-1'),
+        PaymentEvent(provider='fawry', transaction_id='PAY-2'),
+    ]),
+    'signup email lookup': lambda site, other: User.objects.filter(email='explain@example.com'),
+    'website setup by user': lambda site, other: WebsiteSetup.objects.filter(user_id=other),
+}
+
+
+def path_checks():
+    site, other = uuid.uuid4(), uuid.uuid4()
+    for name, build in PATH_CHECKS.items():
+        yield name, build(site, other)
+
+
+def partial_indexes():
+    return {
+        index.name
+        for model in apps.get_app_config('api').get_models()
+        for index in model._meta.indexes
+        if index.condition is not None
+    }
+
+
+def _postgres_full_scans(node, partial, limited=False):
+    scans = []
+    node_type = node.get('Node Type', '')
+    if node_type == 'Limit':
+        limited = True
+    elif node_type in BLOCKING_NODES:
+        limited = False
+    if node_type == 'Seq Scan':
+        scans.append(node.get('Relation Name', '?'))
+    elif (
+        node_type in ('Index Scan', 'Index Only Scan') and 'Index Cond' not in node
+        and not limited and node.get('Index Name') not in partial
+    ):
+        scans.append(f"{node.get('Relation Name', '?')} (full walk of {node.get('Index Name')})")
+    for child in node.get('Plans', []):
+        scans.extend(_postgres_full_scans(child, partial, limited))
+    return scans
+
+
+def explain(queryset):
+    """``(full_scans, plan_text)`` for a queryset on its database"""
+    connection = connections[queryset.db]
+    partial = partial_indexes()
+    if connection.vendor == 'postgresql':
+        with transaction.atomic(using=queryset.db):
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+            plan = queryset.explain(format='json')
+        parsed = json.loads(plan) if isinstance(plan, str) else plan
+        return _postgres_full_scans(parsed[0]['Plan'], partial), json.dumps(parsed, indent=2)
+    plan = queryset.explain()
+    if connection.vendor == 'sqlite':
+        # A walk is cut short by a LIMIT, unless its rows are sorted afterwards
+        walk_ok = queryset.query.high_mark is not None and 'TEMP B-TREE FOR ORDER BY' not in plan
+        full_scans = []
+        for table, index in SQLITE_SCAN.findall(plan):
+            if not index:
+                full_scans.append(table)
+            elif not walk_ok and index not in partial:
+                full_scans.append(f'{table} (full walk of {index})')
+        return full_scans, plan
+    return [], plan
+
+
+def run_checks():
+    """Every check with its plan; see the module docstring"""
+    results = []
+    for source in (viewset_checks, admin_checks, path_checks):
+        for name, queryset in source():
+            full_scans, plan = explain(queryset)
+            results.append(PlanCheck(name, queryset, full_scans, plan))
+    return results
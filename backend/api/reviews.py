@@ -0,0 +1,68 @@
+"""
+Doctor reviews and their running rating summaries.
+
+Each doctor and each site has one summary row (count, sum and a 1-5 star
+histogram). Adding or removing a review applies ``F()`` increments to both
+rows in the same transaction as the insert/delete, so listing doctors with
+their ratings is a join on the primary key instead of an ``AVG()`` over
+every review, and concurrent reviews never lose an update.
+"""
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.db.models import F
+
+from .cache import bump_site_version
+from .models import DoctorRating, Review, SiteRating
+
+EMPTY_RATING = {'average': None, 'count': 0, 'histogram': {str(stars): 0 for stars in range(1, 6)}}
+
+
+def rating_data(obj):
+    """``{average, count, histogram}`` for a Doctor or WebsiteSetup"""
+    try:
+        summary = obj.rating
+    except ObjectDoesNotExist:
+        return EMPTY_RATING
+    return {'average': summary.average, 'count': summary.count, 'histogram': summary.histogram}
+
+
+def _apply(model, key, rating, sign):
+    changes = {
+        'count': F('count') + sign,
+        'total': F('total') + sign * rating,
+        f'stars_{rating}': F(f'stars_{rating}') + sign,
+    }
+    if model.objects.filter(**key).update(**changes) or sign < 0:
+        return
+    # First review: create the row, racing other first reviews safely
+    model.objects.get_or_create(**key)
+    model.objects.filter(**key).update(**changes)
+
+
+def _record(review, sign):
+    # Doctor before site everywhere, so concurrent reviews lock in the same order
+    with transaction.atomic():
+        _apply(DoctorRating, {'doctor_id': review.doctor_id}, review.rating, sign)
+        _apply(SiteRating, {'website_setup_id': review.website_setup_id}, review.rating, sign)
+    # Directory and bundle carry the ratings
+    bump_site_version(review.website_setup_id)
+
+
+def review_added(review):
+    _record(review, 1)
+
+
+def review_removed(review):
+    _record(review, -1)
+
+
+def add_review(doctor, website_setup_id, data):
+    """Create a review and update the summaries in one transaction"""
+    with transaction.atomic():
+        # The post_save signal records the rating inside this transaction
+        return Review.objects.create(website_setup_id=website_setup_id, doctor=doctor, **data)
+
+
+def delete_review(review):
+    with transaction.atomic():
+        review.delete()
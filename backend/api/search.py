@@ -0,0 +1,354 @@
+"""
+In-process search index over each site's product catalog.
+
+Every worker keeps, per site, an inverted index from normalized words to the
+products containing them, plus a trigram index over the vocabulary:
+
+* prefix matches ("parac" -> "paracetamol") come from a sorted vocabulary via
+  bisect, so search-as-you-type works on every keystroke;
+* infix matches ("cetamol") come from intersecting the trigram postings of the
+  query term.
+
+Every query term must match (AND). Scores favour matches in the name over the
+category over the description, and whole words over prefixes over infixes.
+Category facet counts are computed from the same matches.
+
+Indexes are keyed by a per-site catalog version in the shared cache. Product
+saves apply incremental updates in the process that made them; other
+processes see a newer version and rebuild in the background, answering from
+the database in the meantime. Nothing here needs Postgres extensions or an
+external search service.
+"""
+import bisect
+import heapq
+import logging
+import re
+import threading
+import unicodedata
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+
+from django.conf import settings
+from django.db import close_old_connections, connections
+from django.db.models import Count, Q
+
+from .cache import LocalCache, bump_version, get_version
+from .models import Product
+
+logger = logging.getLogger(__name__)
+
+WORD_RE = re.compile(r'[^\W_]+')
+
+# Weight of a match by the field it was found in
+FIELD_WEIGHTS = {'name': 3.0, 'category': 2.0, 'description': 1.0}
+SEARCH_FIELDS = tuple(FIELD_WEIGHTS)
+
+# Quality of a match by how the query term matched the word
+PREFIX_QUALITY = 0.5
+INFIX_QUALITY = 0.3
+
+# Terms shorter than this only match as prefixes
+MIN_INFIX_LENGTH = 3
+
+DOC_FIELDS = ['id', 'sku', 'name', 'category', 'description', 'price', 'in_stock']
+
+
+def normalize(text):
+    """Lowercase and strip accents so "Ibuprofène" matches "ibuprofene" """
+    text = unicodedata.normalize('NFKD', text or '')
+    return ''.join(char for char in text if not unicodedata.combining(char)).lower()
+
+
+def tokenize(text):
+    return WORD_RE.findall(normalize(text))
+
+
+def trigrams(word):
+    return {word[i:i + 3] for i in range(len(word) - 2)}
+
+
+def product_doc(product):
+    """Public representation of a product as stored in the index"""
+    return {
+        'id': str(product['id']),
+        'sku': product['sku'],
+        'name': product['name'],
+        'category': product['category'],
+        'description': product['description'],
+        'price': str(product['price']),
+        'in_stock': product['in_stock'],
+    }
+
+
+def instance_doc(instance):
+    return product_doc({field: getattr(instance, field) for field in DOC_FIELDS})
+
+
+class SearchIndex:
+    """Inverted index over the products of one site"""
+
+    def __init__(self, version=None):
+        self.version = version
+        self.docs = {}
+        # word -> {doc_id: field weight}
+        self.postings = {}
+        # sorted list of every indexed word, for prefix lookups
+        self.vocabulary = []
+        # trigram -> words containing it, for infix lookups
+        self.trigram_words = defaultdict(set)
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.docs)
+
+    def _doc_words(self, doc):
+        """``{word: weight}`` keeping the weight of the best field per word"""
+        words = {}
+        for field in SEARCH_FIELDS:
+            weight = FIELD_WEIGHTS[field]
+            for word in tokenize(doc[field]):
+                if words.get(word, 0) < weight:
+                    words[word] = weight
+        return words
+
+    def add(self, doc):
+        with self._lock:
+            self.remove(doc['id'])
+            self.docs[doc['id']] = doc
+            for word, weight in self._doc_words(doc).items():
+                postings = self.postings.get(word)
+                if postings is None:
+                    postings = self.postings[word] = {}
+                    bisect.insort(self.vocabulary, word)
+                    for trigram in trigrams(word):
+                        self.trigram_words[trigram].add(word)
+                postings[doc['id']] = weight
+
+    def remove(self, doc_id):
+        with self._lock:
+            doc = self.docs.pop(doc_id, None)
+            if doc is None:
+                return
+            for word in self._doc_words(doc):
+                postings = self.postings[word]
+                postings.pop(doc_id, None)
+                if postings:
+                    continue
+                del self.postings[word]
+                del self.vocabulary[bisect.bisect_left(self.vocabulary, word)]
+                for trigram in trigrams(word):
+                    words = self.trigram_words[trigram]
+                    words.discard(word)
+                    if not words:
+                        del self.trigram_words[trigram]
+
+    def _match_term(self, term):
+        """``{doc_id: score}`` for every document containing a word matching ``term``"""
+        matches = {}
+
+        def collect(word, quality):
+            for doc_id, weight in self.postings[word].items():
+                score = weight * quality
+                if matches.get(doc_id, 0) < score:
+                    matches[doc_id] = score
+
+        start = bisect.bisect_left(self.vocabulary, term)
+        prefixed = set()
+        for word in self.vocabulary[start:]:
+            if not word.startswith(term):
+                break
+            prefixed.add(word)
+            # Whole word scores 1; longer completions score progressively less
+            collect(word, PREFIX_QUALITY + (1 - PREFIX_QUALITY) * len(term) / len(word))
+
+        if len(term) >= MIN_INFIX_LENGTH:
+            candidates = reduce(
+                lambda words, trigram: words & self.trigram_words.get(trigram, set()),
+                trigrams(term),
+                set(self.trigram_words.get(term[:3], set())),
+            )
+            for word in candidates - prefixed:
+                if term in word:
+                    collect(word, INFIX_QUALITY * len(term) / len(word))
+        return matches
+
+    def search(self, query, category=None, in_stock=None, limit=20, offset=0):
+        """Ranked page of matching documents, total count and category facets"""
+        terms = list(dict.fromkeys(tokenize(query)))
+        with self._lock:
+            if terms:
+                scores = None
+                for term in terms:
+                    matches = self._match_term(term)
+                    if scores is None:
+                        scores = matches
+                    else:
+                        scores = {
+                            doc_id: score + matches[doc_id]
+                            for doc_id, score in scores.items() if doc_id in matches
+                        }
+                    if not scores:
+                        break
+            else:
+                scores = dict.fromkeys(self.docs, 0)
+
+            docs = [(self.docs[doc_id], score) for doc_id, score in scores.items()]
+
+        if in_stock is not None:
+            docs = [(doc, score) for doc, score in docs if doc['in_stock'] == in_stock]
+        # Facets ignore the category filter so the UI can show every option
+        facets = Counter(doc['category'] for doc, score in docs)
+        if category:
+            docs = [(doc, score) for doc, score in docs if doc['category'] == category]
+
+        page = heapq.nsmallest(
+            offset + limit, docs,
+            key=lambda item: (-item[1], item[0]['name'].lower(), item[0]['id'])
+        )[offset:]
+        return {
+            'count': len(docs),
+            'results': [doc for doc, score in page],
+            'facets': {'category': dict(sorted(facets.items()))},
+        }
+
+
+def build_index(site_id, version):
+    index = SearchIndex(version)
+    products = (
+        Product.objects
+        .filter(website_setup_id=site_id)
+        .values(*DOC_FIELDS)
+    )
+    for product in products.iterator(chunk_size=2000):
+        index.add(product_doc(product))
+    return index
+
+
+def database_search(site_id, query, category=None, in_stock=None, limit=20, offset=0):
+    """Same response shape as ``SearchIndex.search``, answered with ``icontains``"""
+    products = Product.objects.filter(website_setup_id=site_id)
+    for term in dict.fromkeys(query.split()):
+        products = products.filter(
+            Q(name__icontains=term) | Q(category__icontains=term) | Q(description__icontains=term)
+        )
+    if in_stock is not None:
+        products = products.filter(in_stock=in_stock)
+
+    facets = (
+        products.order_by()
+        .values_list('category')
+        .annotate(count=Count('id'))
+        .order_by('category')
+    )
+    if category:
+        products = products.filter(category=category)
+
+    results = products.order_by('name', 'id').values(*DOC_FIELDS)[offset:offset + limit]
+    return {
+        'count': products.count(),
+        'results': [product_doc(product) for product in results],
+        'facets': {'category': dict(facets)},
+    }
+
+
+def _catalog_key(site_id):
+    return f'catalog-version:{site_id}'
+
+
+_indexes = LocalCache(maxsize=settings.SEARCH_INDEX_MAX_SITES)
+_building = set()
+_building_lock = threading.Lock()
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.SEARCH_INDEX_WORKERS, thread_name_prefix='search-index'
+                )
+    return _executor
+
+
+def rebuild_index(site_id):
+    """Build the index for a site at its current catalog version and install it"""
+    index = build_index(site_id, get_version(_catalog_key(site_id)))
+    _indexes.set(site_id, index)
+    return index
+
+
+def _build_job(site_id):
+    close_old_connections()
+    try:
+        rebuild_index(site_id)
+    except Exception:
+        logger.exception('Search index build failed for site %s', site_id)
+    finally:
+        with _building_lock:
+            _building.discard(site_id)
+        # Worker threads must not keep database connections open
+        connections.close_all()
+
+
+def schedule_rebuild(site_id):
+    """Rebuild a site's index in the background unless a build is already running"""
+    with _building_lock:
+        if site_id in _building:
+            return
+        _building.add(site_id)
+    get_executor().submit(_build_job, site_id)
+
+
+def get_index(site_id):
+    """The site's up-to-date index, or None while it is being (re)built"""
+    index = _indexes.get(site_id)
+    if index is not None and index.version == get_version(_catalog_key(site_id)):
+        return index
+    if not settings.SEARCH_INDEX_ASYNC:
+        return rebuild_index(site_id)
+    schedule_rebuild(site_id)
+    return None
+
+
+def search_products(site_id, query, **options):
+    """Search a site's catalog, from the index when warm and the database otherwise"""
+    index = get_index(site_id)
+    if index is None:
+        return database_search(site_id, query, **options)
+    return index.search(query, **options)
+
+
+def product_changed(site_id, doc_id, doc=None):
+    """
+    Record a saved (``doc``) or deleted product once the transaction commits,
+    updating this process's index in place when it is otherwise current.
+    """
+    def apply(version):
+        index = _indexes.get(site_id)
+        if index is None:
+            return
+        # Anything else changed in between: let the next search rebuild it
+        if index.version != version - 1:
+            _indexes.delete(site_id)
+            return
+        if doc is None:
+            index.remove(doc_id)
+        else:
+            index.add(doc)
+        index.version = version
+
+    bump_version(_catalog_key(site_id), on_bumped=apply)
+
+
+def catalog_replaced(site_id):
+    """Invalidate a site's indexes after a bulk change and rebuild this process's one"""
+    def rebuild(version):
+        _indexes.delete(site_id)
+        if settings.SEARCH_INDEX_ASYNC:
+            schedule_rebuild(site_id)
+
+    bump_version(_catalog_key(site_id), on_bumped=rebuild)
@@ -1,3 +1,10 @@
 from .user_serializers import *
 from .website_serializers import *
-from .business_serializers import *
\ No newline at end of file
+from .business_serializers import *
+from .product_serializers import *
+from .directory_serializers import *
+from .order_serializers import *
+from .appointment_serializers import *
+from .review_serializers import *
+from .payment_serializers import *
+from .public_serializers import *
\ No newline at end of file
@@ -0,0 +1,25 @@
+from rest_framework import serializers
+from api.models import Appointment
+
+
+class AppointmentSerializer(serializers.ModelSerializer):
+    """Serializer for Appointment model"""
+
+    class Meta:
+        model = Appointment
+        fields = [
+            'id', 'reference', 'department', 'department_name', 'doctor', 'doctor_name',
+            'patient_name', 'patient_email', 'patient_phone', 'date', 'time', 'reason',
+            'status', 'created_at', 'updated_at'
+        ]
+        read_only_fields = fields
+
+
+class BookingSerializer(serializers.Serializer):
+    """Patient details and slot posted to book an appointment"""
+    patient_name = serializers.CharField(max_length=255)
+    patient_email = serializers.EmailField(required=False, allow_blank=True, default='')
+    patient_phone = serializers.CharField(max_length=20, required=False, allow_blank=True, default='')
+    date = serializers.DateField()
+    time = serializers.TimeField()
+    reason = serializers.CharField(required=False, allow_blank=True, default='')
@@ -1,15 +1,19 @@
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from rest_framework import serializers
+from api.hours import validate_working_hours
+from api.images import variant_srcsets
 from api.models import BusinessInfo
 class BusinessInfoSerializer(serializers.ModelSerializer):
     """Serializer for BusinessInfo model"""
     logo_url = serializers.SerializerMethodField()
+    logo_srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = BusinessInfo
         fields = [
-            'id', 'name', 'logo', 'logo_url', 'about', 'address', 'latitude',
+            'id', 'name', 'logo', 'logo_url', 'logo_srcset', 'about', 'address', 'latitude',
             'longitude', 'contact_phone', 'contact_email', 'website',
-            'working_hours', 'is_published', 'created_at', 'updated_at'
+            'working_hours', 'timezone', 'is_published', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
@@ -21,6 +25,16 @@ class BusinessInfoSerializer(serializers.ModelSerializer):
             return obj.logo.url
         return None
 
+    def get_logo_srcset(self, obj):
+        """Resized/WebP variants as ``{format: srcset}``, None until processed"""
+        if not obj.logo:
+            return None
+        request = self.context.get('request')
+        return variant_srcsets(
+            obj.logo_variants, obj.logo.storage, obj.logo.name,
+            request.build_absolute_uri if request else None
+        )
+
 
 class BusinessInfoCreateUpdateSerializer(serializers.ModelSerializer):
     """Serializer for creating/updating BusinessInfo (without logo_url)"""
@@ -29,5 +43,30 @@ class BusinessInfoCreateUpdateSerializer(serializers.ModelSerializer):
         fields = [
             'name', 'logo', 'about', 'address', 'latitude', 'longitude',
             'contact_phone', 'contact_email', 'website', 'working_hours',
-            'is_published'
+            'timezone', 'is_published'
         ]
+
+    def validate_working_hours(self, value):
+        """Reject hours that can't be compiled instead of silently treating them as closed"""
+        try:
+            return validate_working_hours(value)
+        except ValueError as exc:
+            raise serializers.ValidationError(exc.args[0])
+
+    def validate_latitude(self, value):
+        if value is not None and not -90 <= value <= 90:
+            raise serializers.ValidationError('Latitude must be between -90 and 90.')
+        return value
+
+    def validate_longitude(self, value):
+        if value is not None and not -180 <= value <= 180:
+            raise serializers.ValidationError('Longitude must be between -180 and 180.')
+        return value
+
+    def validate_timezone(self, value):
+        if value:
+            try:
+                ZoneInfo(value)
+            except (ZoneInfoNotFoundError, ValueError):
+                raise serializers.ValidationError('Unknown time zone; use an IANA name such as "Africa/Cairo".')
+        return value
@@ -0,0 +1,97 @@
+from rest_framework import serializers
+from api.hours import MINUTES_PER_DAY, parse_clock
+from api.images import variant_srcsets
+from api.models import Department, Doctor
+from api.reviews import rating_data
+
+
+class DepartmentSerializer(serializers.ModelSerializer):
+    """Serializer for Department model"""
+
+    class Meta:
+        model = Department
+        fields = ['id', 'name', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'created_at', 'updated_at']
+
+
+class DoctorSerializer(serializers.ModelSerializer):
+    """Serializer for Doctor model"""
+    photo_url = serializers.SerializerMethodField()
+    photo_srcset = serializers.SerializerMethodField()
+    rating = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Doctor
+        fields = [
+            'id', 'department', 'name', 'title', 'specialization', 'email', 'experience',
+            'photo', 'photo_url', 'photo_srcset', 'certificates', 'slots', 'rating',
+            'created_at', 'updated_at'
+        ]
+        read_only_fields = ['id', 'created_at', 'updated_at']
+        extra_kwargs = {'photo': {'write_only': True}}
+
+    def validate_department(self, value):
+        website_setup = self.context.get('website_setup')
+        if website_setup is not None and value.website_setup_id != website_setup.pk:
+            raise serializers.ValidationError('Unknown department.')
+        return value
+
+    def validate_slots(self, value):
+        if not isinstance(value, list):
+            raise serializers.ValidationError('Expected a list of {dayOfWeek, time} objects.')
+        slots = set()
+        for slot in value:
+            try:
+                day, clock = slot['dayOfWeek'], slot['time']
+                minutes = parse_clock(clock)
+                if not isinstance(day, int) or not 0 <= day <= 6 or minutes >= MINUTES_PER_DAY:
+                    raise ValueError
+            except (KeyError, TypeError, ValueError):
+                raise serializers.ValidationError(
+                    'Each slot needs a dayOfWeek from 0 (Sunday) to 6 and a time as HH:MM.'
+                )
+            slots.add((day, f'{minutes // 60:02d}:{minutes % 60:02d}'))
+        return [{'dayOfWeek': day, 'time': clock} for day, clock in sorted(slots)]
+
+    def get_photo_url(self, obj):
+        if obj.photo:
+            request = self.context.get('request')
+            if request:
+                return request.build_absolute_uri(obj.photo.url)
+            return obj.photo.url
+        return None
+
+    def get_photo_srcset(self, obj):
+        """Resized/WebP variants as ``{format: srcset}``, None until processed"""
+        if not obj.photo:
+            return None
+        request = self.context.get('request')
+        return variant_srcsets(
+            obj.photo_variants, obj.photo.storage, obj.photo.name,
+            request.build_absolute_uri if request else None
+        )
+
+    def get_rating(self, obj):
+        """Rating summary; querysets should ``select_related('rating')``"""
+        return rating_data(obj)
+
+
+class PublicDoctorSerializer(DoctorSerializer):
+    """Doctor as shown in a published hospital's directory"""
+
+    class Meta(DoctorSerializer.Meta):
+        fields = [
+            'id', 'name', 'title', 'specialization', 'email', 'experience',
+            'photo_url', 'photo_srcset', 'certificates', 'slots', 'rating'
+        ]
+        read_only_fields = fields
+
+
+class PublicDepartmentSerializer(serializers.ModelSerializer):
+    """Department with its doctors, for the public directory"""
+    doctors = PublicDoctorSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Department
+        fields = ['id', 'name', 'doctors']
+        read_only_fields = fields
@@ -0,0 +1,42 @@
+from rest_framework import serializers
+from api.models import Order, OrderItem
+
+MAX_CHECKOUT_LINES = 100
+
+
+class CheckoutItemSerializer(serializers.Serializer):
+    product = serializers.UUIDField()
+    quantity = serializers.IntegerField(min_value=1, max_value=1000)
+
+
+class CheckoutSerializer(serializers.Serializer):
+    """Cart and delivery details posted to a site's checkout"""
+    customer_name = serializers.CharField(max_length=255)
+    customer_email = serializers.EmailField(required=False, allow_blank=True, default='')
+    customer_phone = serializers.CharField(max_length=20, required=False, allow_blank=True, default='')
+    delivery_address = serializers.CharField(required=False, allow_blank=True, default='')
+    payment_method = serializers.ChoiceField(choices=Order.PAYMENT_CHOICES, default='cash')
+    items = CheckoutItemSerializer(many=True, allow_empty=False, max_length=MAX_CHECKOUT_LINES)
+
+
+class OrderItemSerializer(serializers.ModelSerializer):
+    """Serializer for OrderItem model"""
+
+    class Meta:
+        model = OrderItem
+        fields = ['id', 'product', 'sku', 'name', 'unit_price', 'quantity']
+        read_only_fields = fields
+
+
+class OrderSerializer(serializers.ModelSerializer):
+    """Serializer for Order model"""
+    items = OrderItemSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Order
+        fields = [
+            'id', 'order_number', 'customer_name', 'customer_email', 'customer_phone',
+            'delivery_address', 'payment_method', 'status', 'total', 'items',
+            'created_at', 'updated_at'
+        ]
+        read_only_fields = fields
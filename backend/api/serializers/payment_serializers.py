@@ -0,0 +1,17 @@
+from rest_framework import serializers
+from api.models import Payment
+from api.models.payment import PAYMENT_METHODS
+
+
+class PaymentSerializer(serializers.ModelSerializer):
+    """Payment of the current user's website"""
+
+    class Meta:
+        model = Payment
+        fields = ['id', 'amount', 'method', 'status', 'transaction_id', 'created_at', 'updated_at']
+        read_only_fields = fields
+
+
+class StartPaymentSerializer(serializers.Serializer):
+    """Gateway chosen to pay the website's total price"""
+    method = serializers.ChoiceField(choices=PAYMENT_METHODS)
@@ -0,0 +1,33 @@
+from rest_framework import serializers
+from api.models import Product
+
+
+class ProductSerializer(serializers.ModelSerializer):
+    """Serializer for Product model"""
+
+    class Meta:
+        model = Product
+        fields = [
+            'id', 'sku', 'name', 'category', 'description', 'price', 'in_stock', 'stock',
+            'created_at', 'updated_at'
+        ]
+        read_only_fields = ['id', 'created_at', 'updated_at']
+
+    def validate_sku(self, value):
+        website_setup = self.context.get('website_setup')
+        if website_setup is None:
+            return value
+        products = Product.objects.filter(website_setup=website_setup, sku=value)
+        if self.instance is not None:
+            products = products.exclude(pk=self.instance.pk)
+        if products.exists():
+            raise serializers.ValidationError('A product with this SKU already exists.')
+        return value
+
+
+class PublicProductSerializer(ProductSerializer):
+    """Product as shown to visitors of a published site"""
+
+    class Meta(ProductSerializer.Meta):
+        fields = ['id', 'sku', 'name', 'category', 'description', 'price', 'in_stock', 'stock']
+        read_only_fields = fields
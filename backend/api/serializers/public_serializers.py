@@ -0,0 +1,35 @@
+from rest_framework import serializers
+from api.models import BusinessInfo, WebsiteSetup
+from api.reviews import rating_data
+from .business_serializers import BusinessInfoSerializer
+
+
+class PublicBusinessInfoSerializer(BusinessInfoSerializer):
+    """Public, read-only view of BusinessInfo for published sites"""
+
+    class Meta(BusinessInfoSerializer.Meta):
+        model = BusinessInfo
+        fields = [
+            'name', 'logo_url', 'logo_srcset', 'about', 'address', 'latitude', 'longitude',
+            'contact_phone', 'contact_email', 'website', 'working_hours',
+            'timezone', 'updated_at'
+        ]
+        read_only_fields = fields
+
+
+class PublicWebsiteSetupSerializer(serializers.ModelSerializer):
+    """Feature flags and template selection exposed to site visitors"""
+    business_type = serializers.CharField(source='user.business_type', read_only=True)
+    rating = serializers.SerializerMethodField()
+
+    class Meta:
+        model = WebsiteSetup
+        fields = [
+            'id', 'business_type', 'template_id', 'review_system', 'ai_chatbot',
+            'ambulance_ordering', 'patient_portal', 'prescription_refill', 'rating'
+        ]
+        read_only_fields = fields
+
+    def get_rating(self, obj):
+        """Site-wide doctor rating summary, None unless reviews are on"""
+        return rating_data(obj) if obj.review_system else None
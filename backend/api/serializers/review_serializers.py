@@ -0,0 +1,22 @@
+from rest_framework import serializers
+from api.models import Review
+
+
+class ReviewSerializer(serializers.ModelSerializer):
+    """Review as listed to the site owner"""
+    doctor_name = serializers.CharField(source='doctor.name', read_only=True)
+
+    class Meta:
+        model = Review
+        fields = ['id', 'doctor', 'doctor_name', 'reviewer_name', 'rating', 'comment', 'created_at']
+        read_only_fields = fields
+
+
+class PublicReviewSerializer(serializers.ModelSerializer):
+    """Review as shown on a doctor's public page, also used to post one"""
+    rating = serializers.IntegerField(min_value=1, max_value=5)
+
+    class Meta:
+        model = Review
+        fields = ['id', 'reviewer_name', 'rating', 'comment', 'created_at']
+        read_only_fields = ['id', 'created_at']
@@ -30,6 +30,17 @@ class SignupSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         validated_data.pop('password_confirm')
+        # Async signup hashes the password off the request thread and passes it in
+        password_hash = validated_data.pop('password_hash', None)
+        if password_hash is not None:
+            return User.objects.create(
+                username=validated_data['email'],  # Use email as username
+                email=User.objects.normalize_email(validated_data['email']),
+                password=password_hash,
+                name=validated_data['name'],
+                business_type=validated_data['business_type'],
+            )
+
         user = User.objects.create_user(
             username=validated_data['email'],  # Use email as username
             email=validated_data['email'],
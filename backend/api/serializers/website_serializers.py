@@ -1,6 +1,10 @@
 from rest_framework import serializers
 from .user_serializers import UserSerializer
 from api.models import WebsiteSetup
+from api.models.website import FEATURE_FIELDS
+from api.pricing import feature_mask, setup_price, validate_template
+
+
 class WebsiteSetupSerializer(serializers.ModelSerializer):
     """Serializer for WebsiteSetup model"""
     user = UserSerializer(read_only=True)
@@ -12,4 +16,42 @@ class WebsiteSetupSerializer(serializers.ModelSerializer):
             'patient_portal', 'prescription_refill', 'template_id', 'is_paid',
             'total_price', 'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'user', 'created_at', 'updated_at']
\ No newline at end of file
+        # The price is derived from the selections (api/pricing.py) and only
+        # the payment processor (api/payments.py) marks a site as paid
+        read_only_fields = ['id', 'user', 'is_paid', 'total_price', 'created_at', 'updated_at']
+
+    def _business_type(self):
+        if self.instance is not None:
+            return self.instance.user.business_type
+        return self.context['request'].user.business_type
+
+    def validate_template_id(self, value):
+        try:
+            validate_template(self._business_type(), value)
+        except ValueError as exc:
+            raise serializers.ValidationError(str(exc))
+        return value
+
+    def validate(self, attrs):
+        mask = feature_mask(
+            name for name in FEATURE_FIELDS
+            if attrs.get(name, getattr(self.instance, name, False))
+        )
+        template_id = attrs.get('template_id', getattr(self.instance, 'template_id', None))
+        try:
+            attrs['total_price'] = setup_price(self._business_type(), mask, template_id)
+        except ValueError as exc:
+            raise serializers.ValidationError({'template_id': str(exc)})
+        return attrs
+
+
+class WebsiteSetupSummarySerializer(WebsiteSetupSerializer):
+    """WebsiteSetup without the nested user, for payloads that already include it"""
+
+    class Meta(WebsiteSetupSerializer.Meta):
+        fields = [
+            'id', 'review_system', 'ai_chatbot', 'ambulance_ordering',
+            'patient_portal', 'prescription_refill', 'template_id', 'is_paid',
+            'total_price', 'created_at', 'updated_at'
+        ]
+        read_only_fields = ['id', 'is_paid', 'total_price', 'created_at', 'updated_at']
\ No newline at end of file
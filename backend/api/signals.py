@@ -0,0 +1,177 @@
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .availability import appointment_changed, minute_key
+from .authentication import CLAIM_SOURCE_FIELDS, forget_user_version
+from .cache import bump_site_version
+from .geo import GEOHASH_LENGTH, encode
+from .images import schedule_variants
+from .opening import opening_hours_changed, store_opening_intervals
+from .models import (
+    Appointment, BusinessInfo, Department, Doctor, Order, Product, Review, User, WebsiteSetup
+)
+from .reviews import review_added, review_removed
+from .search import instance_doc, product_changed
+from .stats import appointment_counted, order_counted
+
+
+@receiver([post_save, post_delete], sender=WebsiteSetup)
+def invalidate_website_setup(sender, instance, **kwargs):
+    """Bump the site version whenever the setup itself changes"""
+    bump_site_version(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=BusinessInfo)
+def invalidate_business_info(sender, instance, **kwargs):
+    """Bump the site version whenever business info is saved or published"""
+    bump_site_version(instance.website_setup_id)
+
+
+@receiver(pre_save, sender=BusinessInfo)
+def locate_business(sender, instance, **kwargs):
+    """Keep the geohash used by nearby searches in step with the coordinates"""
+    if instance.latitude is None or instance.longitude is None:
+        instance.geohash = ''
+    else:
+        instance.geohash = encode(instance.latitude, instance.longitude, GEOHASH_LENGTH)
+
+
+@receiver(post_save, sender=BusinessInfo)
+def compile_opening_hours(sender, instance, **kwargs):
+    """Keep the compiled intervals behind "open now" in step with working hours"""
+    store_opening_intervals(instance)
+
+
+@receiver(post_delete, sender=BusinessInfo)
+def forget_opening_hours(sender, instance, **kwargs):
+    opening_hours_changed()
+
+
+@receiver([post_save, post_delete], sender=Product)
+def invalidate_product(sender, instance, **kwargs):
+    """The bundle carries the catalog's category summary"""
+    bump_site_version(instance.website_setup_id)
+
+
+@receiver(post_save, sender=Product)
+def index_product(sender, instance, **kwargs):
+    product_changed(instance.website_setup_id, str(instance.pk), instance_doc(instance))
+
+
+@receiver(post_delete, sender=Product)
+def unindex_product(sender, instance, **kwargs):
+    product_changed(instance.website_setup_id, str(instance.pk))
+
+
+@receiver([post_save, post_delete], sender=Department)
+def invalidate_department(sender, instance, **kwargs):
+    """The public directory is cached per site version"""
+    bump_site_version(instance.website_setup_id)
+
+
+def doctor_site_id(doctor):
+    try:
+        return doctor.department.website_setup_id
+    except Department.DoesNotExist:
+        return None
+
+
+def bump_doctor_site_version(doctor):
+    # None once the department is deleted, e.g. while photo variants were made
+    site_id = doctor_site_id(doctor)
+    if site_id is not None:
+        bump_site_version(site_id)
+
+
+@receiver([post_save, post_delete], sender=Doctor)
+def invalidate_doctor(sender, instance, **kwargs):
+    bump_doctor_site_version(instance)
+
+
+@receiver(post_save, sender=Doctor)
+def process_doctor_photo(sender, instance, **kwargs):
+    """Generate photo variants in the background after an upload"""
+    schedule_variants(instance, 'photo', 'photo_variants', on_processed=bump_doctor_site_version)
+
+
+@receiver(post_save, sender=Review)
+def count_review(sender, instance, created, **kwargs):
+    """Reviews aren't edited, so only inserts change the rating summaries"""
+    if created:
+        review_added(instance)
+
+
+@receiver(post_delete, sender=Review)
+def uncount_review(sender, instance, **kwargs):
+    review_removed(instance)
+
+
+@receiver(post_save, sender=Order)
+def count_order(sender, instance, created, **kwargs):
+    """Status changes are counted by cancel_order/complete_order, see api/stats.py"""
+    if created:
+        order_counted(instance)
+
+
+@receiver(post_delete, sender=Order)
+def uncount_order(sender, instance, **kwargs):
+    order_counted(instance, -1)
+
+
+@receiver(post_save, sender=Appointment)
+def count_appointment(sender, instance, created, **kwargs):
+    if created:
+        appointment_counted(instance)
+
+
+@receiver(post_delete, sender=Appointment)
+def uncount_appointment(sender, instance, **kwargs):
+    appointment_counted(instance, -1)
+
+
+@receiver(post_save, sender=Appointment)
+def reschedule_appointment(sender, instance, **kwargs):
+    """Keep compiled doctor schedules in step with bookings"""
+    key = None if instance.status == 'cancelled' else minute_key(instance.date, instance.time)
+    appointment_changed(instance.doctor_id, instance.pk, key)
+
+
+@receiver(post_delete, sender=Appointment)
+def unschedule_appointment(sender, instance, **kwargs):
+    appointment_changed(instance.doctor_id, instance.pk)
+
+
+@receiver(post_save, sender=BusinessInfo)
+def process_business_logo(sender, instance, **kwargs):
+    """Generate logo variants in the background after an upload"""
+    schedule_variants(
+        instance, 'logo', 'logo_variants',
+        on_processed=lambda info: bump_site_version(info.website_setup_id)
+    )
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_sites(sender, instance, created, update_fields=None, **kwargs):
+    """Owner fields such as business_type are part of the public bundle"""
+    if created or (update_fields is not None and 'business_type' not in update_fields):
+        return
+    for site_id in WebsiteSetup.objects.filter(user=instance).values_list('pk', flat=True):
+        bump_site_version(site_id)
+
+
+@receiver(post_save, sender=User)
+def bump_user_token_version(sender, instance, created, update_fields=None, **kwargs):
+    """Make claims in previously issued tokens stale after a profile change"""
+    if created or (update_fields is not None and not CLAIM_SOURCE_FIELDS & set(update_fields)):
+        return
+    User.objects.filter(pk=instance.pk).update(token_version=F('token_version') + 1)
+    if 'token_version' not in instance.get_deferred_fields():
+        instance.token_version += 1
+    transaction.on_commit(lambda: forget_user_version(instance.pk))
+
+
+@receiver(post_delete, sender=User)
+def forget_deleted_user(sender, instance, **kwargs):
+    transaction.on_commit(lambda: forget_user_version(instance.pk))
@@ -0,0 +1,166 @@
+"""
+Daily rollups behind the dashboard statistics.
+
+Every order and appointment is counted in one row per site, day (local date
+of ``created_at``) and status, plus department for appointments. Writes
+apply ``F()`` increments to that row in the same transaction, so a stats
+request reads O(days) rollup rows instead of every order.
+
+Checkouts, bookings and deletes are counted by signals; status changes are
+counted where they happen (``cancel_order``, ``complete_order`` and the
+appointment actions) since they go through conditional updates. Bulk syncs
+recompute the days they touched, and ``manage.py rebuild_stats`` recomputes
+everything from scratch.
+"""
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import Appointment, DailyAppointmentStats, DailyOrderStats, Order
+
+
+def _increment(model, key, changes):
+    removing = changes['count'] < 0
+    changes = {field: F(field) + delta for field, delta in changes.items()}
+    # A removal with no row to apply to (e.g. the site is being deleted and
+    # its rollups already went in the cascade) has nothing to undo
+    if model.objects.filter(**key).update(**changes) or removing:
+        return
+    # First write of the day: create the row, racing other first writes safely
+    model.objects.get_or_create(**key)
+    model.objects.filter(**key).update(**changes)
+
+
+def _order_key(order, status=None):
+    return {
+        'website_setup_id': order.website_setup_id,
+        'date': timezone.localdate(order.created_at),
+        'status': status or order.status,
+    }
+
+
+def _appointment_key(appointment, status=None):
+    return {
+        'website_setup_id': appointment.website_setup_id,
+        'date': timezone.localdate(appointment.created_at),
+        'department_name': appointment.department_name,
+        'status': status or appointment.status,
+    }
+
+
+def order_counted(order, sign=1):
+    """Add (``sign=1``) or remove (``-1``) an order from its day's rollup"""
+    _increment(DailyOrderStats, _order_key(order), {'count': sign, 'revenue': sign * order.total})
+
+
+def order_status_changed(order, old_status):
+    """Move an order between status rollups; ``order.status`` is the new status"""
+    with transaction.atomic():
+        _increment(DailyOrderStats, _order_key(order, old_status), {'count': -1, 'revenue': -order.total})
+        _increment(DailyOrderStats, _order_key(order), {'count': 1, 'revenue': order.total})
+
+
+def appointment_counted(appointment, sign=1):
+    _increment(DailyAppointmentStats, _appointment_key(appointment), {'count': sign})
+
+
+def appointment_status_changed(appointment, old_status):
+    with transaction.atomic():
+        _increment(DailyAppointmentStats, _appointment_key(appointment, old_status), {'count': -1})
+        _increment(DailyAppointmentStats, _appointment_key(appointment), {'count': 1})
+
+
+def _day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def _rebuild(model, rows, website_setup_id, days, group_by, aggregates):
+    """Replace the rollups of a site (for ``days``, or all of them) with ``rows`` aggregated"""
+    rollups = model.objects.filter(website_setup_id=website_setup_id)
+    rows = rows.filter(website_setup_id=website_setup_id)
+    if days is not None:
+        days = sorted(set(days))
+        rollups = rollups.filter(date__in=days)
+        # A datetime range keeps the created_at index usable; exact days are picked below
+        rows = rows.filter(
+            created_at__gte=_day_start(days[0]),
+            created_at__lt=_day_start(days[-1] + timedelta(days=1)),
+        )
+    totals = (
+        rows.order_by()
+        .annotate(day=TruncDate('created_at'))
+        .values('day', *group_by)
+        .annotate(**aggregates)
+    )
+    with transaction.atomic():
+        rollups.delete()
+        model.objects.bulk_create([
+            model(
+                website_setup_id=website_setup_id, date=total.pop('day'), **total
+            )
+            for total in totals
+            if days is None or total['day'] in days
+        ], batch_size=1000)
+
+
+def rebuild_order_stats(website_setup_id, days=None):
+    _rebuild(
+        DailyOrderStats, Order.objects, website_setup_id, days,
+        ['status'], {'count': Count('id'), 'revenue': Sum('total')},
+    )
+
+
+def rebuild_appointment_stats(website_setup_id, days=None):
+    _rebuild(
+        DailyAppointmentStats, Appointment.objects, website_setup_id, days,
+        ['department_name', 'status'], {'count': Count('id')},
+    )
+
+
+def _series(start, end):
+    return {start + timedelta(days=offset): None for offset in range((end - start).days + 1)}
+
+
+def dashboard_stats(website_setup_id, start, end):
+    """Order and appointment totals and per-day series from ``start`` to ``end`` inclusive"""
+    order_days = _series(start, end)
+    orders = {'count': 0, 'revenue': Decimal('0.00'), 'by_status': {}}
+    for day, status, count, revenue in (
+        DailyOrderStats.objects
+        .filter(website_setup_id=website_setup_id, date__range=(start, end), count__gt=0)
+        .values_list('date', 'status', 'count', 'revenue')
+    ):
+        # Cancelled orders count towards their status but not revenue
+        revenue = Decimal('0.00') if status == 'cancelled' else revenue
+        totals = order_days[day] = order_days[day] or {'count': 0, 'revenue': Decimal('0.00')}
+        totals['count'] += count
+        totals['revenue'] += revenue
+        orders['count'] += count
+        orders['revenue'] += revenue
+        orders['by_status'][status] = orders['by_status'].get(status, 0) + count
+
+    appointment_days = dict.fromkeys(order_days, 0)
+    appointments = {'count': 0, 'by_status': {}, 'by_department': {}}
+    for day, department, status, count in (
+        DailyAppointmentStats.objects
+        .filter(website_setup_id=website_setup_id, date__range=(start, end), count__gt=0)
+        .values_list('date', 'department_name', 'status', 'count')
+    ):
+        appointment_days[day] += count
+        appointments['count'] += count
+        appointments['by_status'][status] = appointments['by_status'].get(status, 0) + count
+        appointments['by_department'][department] = appointments['by_department'].get(department, 0) + count
+
+    # Decimals as strings, like DecimalFields in the rest of the API
+    orders['revenue'] = str(orders['revenue'])
+    orders['series'] = [
+        {'date': day, 'count': totals['count'], 'revenue': str(totals['revenue'])}
+        if totals else {'date': day, 'count': 0, 'revenue': '0.00'}
+        for day, totals in order_days.items()
+    ]
+    appointments['series'] = [{'date': day, 'count': count} for day, count in appointment_days.items()]
+    return {'from': start, 'to': end, 'orders': orders, 'appointments': appointments}
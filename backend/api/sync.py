@@ -0,0 +1,341 @@
+"""
+Bulk sync of orders and appointments kept in the browser's localStorage.
+
+Records are streamed one NDJSON line at a time (see ``api.imports``), keyed
+by the client's order number / appointment id, and upserted in batches
+inside one transaction: a batch costs one lookup of existing keys, one
+``INSERT ... ON CONFLICT DO UPDATE`` and, for orders, one delete and one
+insert of their lines. Re-running a sync is safe; existing records are
+updated in place. The dashboard rollups (``api.stats``) of every day the
+sync touched are recomputed once at the end.
+
+The response reports an outcome per record: ``created``, ``updated`` or
+``error`` with the field errors. Orders placed through the checkout
+(``api.orders``) are never overwritten: their lines hold reserved stock.
+"""
+from datetime import timezone as dt_timezone
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime, parse_time
+
+from .availability import schedule_changed
+from .imports import batched
+from .models import Appointment, Department, Doctor, Order, OrderItem
+from .search import normalize
+from .stats import rebuild_appointment_stats, rebuild_order_stats
+
+ORDER_STATUSES = {choice for choice, label in Order.STATUS_CHOICES}
+APPOINTMENT_STATUSES = {choice for choice, label in Appointment.STATUS_CHOICES}
+
+ORDER_UPDATE_FIELDS = [
+    'customer_name', 'customer_email', 'customer_phone', 'delivery_address',
+    'payment_method', 'status', 'total', 'created_at', 'updated_at',
+]
+APPOINTMENT_UPDATE_FIELDS = [
+    'department', 'doctor', 'department_name', 'doctor_name', 'patient_name',
+    'patient_email', 'patient_phone', 'date', 'time', 'reason', 'status',
+    'created_at', 'updated_at',
+]
+
+
+def _text(value, max_length=None):
+    value = '' if value is None else str(value).strip()
+    return value[:max_length] if max_length else value
+
+
+def _email(value):
+    value = _text(value, 254)
+    return value if '@' in value else ''
+
+
+def _decimal(value):
+    amount = Decimal(str(value)).quantize(Decimal('0.01'))
+    if amount < 0 or amount >= Decimal('1e8'):
+        raise InvalidOperation
+    return amount
+
+
+def _timestamp(value):
+    """
+    Aware datetime from an ISO string as written by ``Date.toISOString()``;
+    now when missing. Raises ValueError for impossible dates (2024-02-30).
+    """
+    parsed = parse_datetime(_text(value)) if value else None
+    if parsed is None:
+        return timezone.now()
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed, dt_timezone.utc)
+    return parsed
+
+
+def _order_line(item):
+    """OrderItem values from a cart entry or an "Name × 2" summary string"""
+    if isinstance(item, dict):
+        product = item.get('product') if isinstance(item.get('product'), dict) else {}
+        quantity = int(item.get('quantity') or 1)
+        return {
+            'name': _text(product.get('name') or item.get('name') or 'Item', 255),
+            'unit_price': _decimal(product.get('price') or item.get('price') or 0),
+            'quantity': max(quantity, 1),
+        }
+    name, sep, quantity = _text(item).rpartition(' × ')
+    if not sep or not quantity.isdigit():
+        name, quantity = _text(item), '1'
+    return {'name': name[:255] or 'Item', 'unit_price': Decimal('0.00'), 'quantity': int(quantity)}
+
+
+def clean_order_record(record):
+    """
+    Validate an order in either localStorage shape: the ``pharmacyOrders``
+    summary or a full ``pharmacy_order_*`` checkout record.
+    Returns ``(key, values, errors)``.
+    """
+    if not isinstance(record, dict):
+        return None, None, {'non_field_errors': 'Expected an object.'}
+
+    errors = {}
+    key = _text(record.get('orderNumber') or record.get('id'))
+    if not key:
+        errors['id'] = 'This field is required.'
+    elif len(key) > 32:
+        errors['id'] = 'Ensure this field has no more than 32 characters.'
+
+    delivery = record.get('deliveryInfo') if isinstance(record.get('deliveryInfo'), dict) else {}
+    payment = record.get('payment') if isinstance(record.get('payment'), dict) else {}
+    address = ', '.join(
+        part for part in (_text(delivery.get('address')), _text(delivery.get('city'))) if part
+    )
+    values = {
+        'customer_name': _text(record.get('customerName') or delivery.get('fullName'), 255) or 'Customer',
+        'customer_email': _email(record.get('customerEmail') or delivery.get('email')),
+        'customer_phone': _text(delivery.get('phone'), 20),
+        'delivery_address': address,
+        'payment_method': 'card' if (payment.get('method') or delivery.get('paymentMethod')) == 'card' else 'cash',
+        'status': _text(record.get('status')) or 'pending',
+    }
+    try:
+        values['created_at'] = _timestamp(record.get('createdAt') or record.get('placedAt'))
+    except ValueError:
+        values['created_at'] = None
+        errors['createdAt'] = 'Expected an ISO 8601 date and time.'
+    if values['status'] not in ORDER_STATUSES:
+        errors['status'] = f"Must be one of: {', '.join(sorted(ORDER_STATUSES))}."
+
+    try:
+        values['total'] = _decimal(record.get('total') or 0)
+    except (InvalidOperation, ValueError):
+        errors['total'] = 'A valid non-negative number is required.'
+
+    items = record.get('items') or []
+    try:
+        if not isinstance(items, list):
+            raise ValueError
+        values['items'] = [_order_line(item) for item in items]
+    except (InvalidOperation, ValueError, TypeError):
+        errors['items'] = 'Expected a list of cart items or item names.'
+
+    return key, values, errors
+
+
+class DirectoryLookup:
+    """Resolve department/doctor names from the browser to this site's rows"""
+
+    def __init__(self, website_setup):
+        self.departments = {}
+        self.doctors = {}
+        for department in Department.objects.filter(website_setup=website_setup).only('id', 'name'):
+            self.departments.setdefault(normalize(department.name).strip(), department.pk)
+        doctors = Doctor.objects.filter(department__website_setup=website_setup).only('id', 'name', 'department_id')
+        for doctor in doctors:
+            self.doctors.setdefault((doctor.department_id, normalize(doctor.name).strip()), doctor.pk)
+
+    def resolve(self, department_name, doctor_name):
+        department_id = self.departments.get(normalize(department_name).strip())
+        doctor_id = self.doctors.get((department_id, normalize(doctor_name).strip()))
+        return department_id, doctor_id
+
+
+def clean_appointment_record(record, lookup):
+    """Validate a ``hospitalAppointments`` entry; returns ``(key, values, errors)``"""
+    if not isinstance(record, dict):
+        return None, None, {'non_field_errors': 'Expected an object.'}
+
+    errors = {}
+    key = _text(record.get('id'))
+    if not key:
+        errors['id'] = 'This field is required.'
+    elif len(key) > 64:
+        errors['id'] = 'Ensure this field has no more than 64 characters.'
+
+    values = {
+        'department_name': _text(record.get('department'), 255),
+        'doctor_name': _text(record.get('doctorName'), 255),
+        'patient_name': _text(record.get('patientName'), 255),
+        'patient_email': _email(record.get('patientEmail')),
+        'patient_phone': _text(record.get('patientPhone'), 20),
+        'reason': _text(record.get('reason')),
+        'status': _text(record.get('status')) or 'pending',
+    }
+    try:
+        values['created_at'] = _timestamp(record.get('createdAt'))
+    except ValueError:
+        values['created_at'] = None
+        errors['createdAt'] = 'Expected an ISO 8601 date and time.'
+    values['department_id'], values['doctor_id'] = lookup.resolve(
+        values['department_name'], values['doctor_name']
+    )
+    if not values['patient_name']:
+        errors['patientName'] = 'This field is required.'
+    if values['status'] not in APPOINTMENT_STATUSES:
+        errors['status'] = f"Must be one of: {', '.join(sorted(APPOINTMENT_STATUSES))}."
+
+    try:
+        values['date'] = parse_date(_text(record.get('preferredDate')))
+    except ValueError:
+        values['date'] = None
+    if values['date'] is None:
+        errors['preferredDate'] = 'Expected a date as YYYY-MM-DD.'
+    try:
+        values['time'] = parse_time(_text(record.get('preferredTime')))
+    except ValueError:
+        values['time'] = None
+    if values['time'] is None:
+        errors['preferredTime'] = 'Expected a time as HH:MM.'
+
+    return key, values, errors
+
+
+def _sync(website_setup, records, clean, upsert, rebuild_stats, batch_size):
+    result = {'created': 0, 'updated': 0, 'error_count': 0, 'results': []}
+    # Local dates whose rollups changed: old and new created_at of each record
+    touched = set()
+    with transaction.atomic():
+        for batch in batched(records, batch_size):
+            rows = {}
+            outcomes = []
+            for line, record in batch:
+                key, values, errors = clean(record)
+                if errors:
+                    outcomes.append({'line': line, 'id': key, 'status': 'error', 'errors': errors})
+                    continue
+                # Last occurrence of a key wins, as if records were applied in order
+                rows[key] = values
+                outcomes.append({'line': line, 'id': key})
+
+            existing, rejected = upsert(website_setup, rows, touched) if rows else (set(), {})
+            for outcome in outcomes:
+                if outcome['id'] in rejected and 'status' not in outcome:
+                    outcome.update(status='error', errors=rejected[outcome['id']])
+                if 'status' in outcome:
+                    result['error_count'] += 1
+                else:
+                    outcome['status'] = 'updated' if outcome['id'] in existing else 'created'
+                    # A key repeated within one batch counts once
+                    existing.add(outcome['id'])
+                    result[outcome['status']] += 1
+                result['results'].append(outcome)
+
+        # bulk_create sends no signals, so recount the touched days once at the end
+        if touched:
+            rebuild_stats(website_setup.pk, touched)
+    return result
+
+
+def _touch(touched, previous, rows):
+    touched.update(timezone.localdate(created_at) for created_at in previous)
+    touched.update(timezone.localdate(values['created_at']) for values in rows.values())
+
+
+def _upsert_orders(website_setup, rows, touched):
+    previous = {}
+    rejected = {}
+    for order_number, created_at, request_hash in list(
+        Order.objects
+        .filter(website_setup=website_setup, order_number__in=rows)
+        .values_list('order_number', 'created_at', 'request_hash')
+    ):
+        if request_hash:
+            # Placed through checkout: its lines hold reserved stock and the
+            # server's copy is authoritative, so the browser's isn't applied
+            rejected[order_number] = {'id': 'This order was placed through checkout and cannot be synced.'}
+            del rows[order_number]
+        else:
+            previous[order_number] = created_at
+    existing = set(previous)
+    now = timezone.now()
+    Order.objects.bulk_create(
+        [
+            Order(
+                website_setup=website_setup, order_number=key, updated_at=now,
+                **{field: value for field, value in values.items() if field != 'items'}
+            )
+            for key, values in rows.items()
+        ],
+        update_conflicts=True,
+        unique_fields=['website_setup', 'order_number'],
+        update_fields=ORDER_UPDATE_FIELDS,
+    )
+
+    # Primary keys of upserted rows aren't returned, so look them up once
+    order_ids = dict(
+        Order.objects
+        .filter(website_setup=website_setup, order_number__in=rows)
+        .values_list('order_number', 'id')
+    )
+    OrderItem.objects.filter(order_id__in=[order_ids[key] for key in existing]).delete()
+    OrderItem.objects.bulk_create([
+        OrderItem(order_id=order_ids[key], **line)
+        for key, values in rows.items()
+        for line in values['items']
+    ])
+    _touch(touched, previous.values(), rows)
+    return existing, rejected
+
+
+def _upsert_appointments(website_setup, rows, touched):
+    previous = {
+        reference: (doctor_id, created_at)
+        for reference, doctor_id, created_at in (
+            Appointment.objects
+            .filter(website_setup=website_setup, reference__in=rows)
+            .values_list('reference', 'doctor_id', 'created_at')
+        )
+    }
+    now = timezone.now()
+    Appointment.objects.bulk_create(
+        [
+            Appointment(website_setup=website_setup, reference=key, updated_at=now, **values)
+            for key, values in rows.items()
+        ],
+        update_conflicts=True,
+        unique_fields=['website_setup', 'reference'],
+        update_fields=APPOINTMENT_UPDATE_FIELDS,
+    )
+
+    # bulk_create sends no signals, so invalidate the affected schedules here
+    doctors = {doctor_id for doctor_id, created_at in previous.values()}
+    doctors |= {values['doctor_id'] for values in rows.values()}
+    for doctor_id in doctors - {None}:
+        schedule_changed(doctor_id)
+    _touch(touched, [created_at for doctor_id, created_at in previous.values()], rows)
+    return set(previous), {}
+
+
+def sync_orders(website_setup, records, batch_size=None):
+    """Upsert browser orders from ``(line, record)`` pairs"""
+    return _sync(
+        website_setup, records, clean_order_record, _upsert_orders, rebuild_order_stats,
+        batch_size or settings.SYNC_BATCH_SIZE
+    )
+
+
+def sync_appointments(website_setup, records, batch_size=None):
+    """Upsert browser appointments from ``(line, record)`` pairs"""
+    lookup = DirectoryLookup(website_setup)
+    return _sync(
+        website_setup, records, lambda record: clean_appointment_record(record, lookup),
+        _upsert_appointments, rebuild_appointment_stats, batch_size or settings.SYNC_BATCH_SIZE
+    )
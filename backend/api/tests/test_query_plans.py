@@ -0,0 +1,14 @@
+from django.test import TestCase
+
+from api.query_plans import run_checks
+
+
+class QueryPlanTests(TestCase):
+    """The querysets of ``api.query_plans`` use indexes on the test database's backend"""
+
+    def test_no_full_table_scans(self):
+        checks = run_checks()
+        self.assertTrue(checks)
+        for check in checks:
+            with self.subTest(check.name):
+                self.assertTrue(check.ok, f'{", ".join(check.full_scans)}\n{check.queryset.query}\n{check.plan}')
@@ -0,0 +1,47 @@
+from datetime import date, time
+from decimal import Decimal
+
+from django.test import TestCase
+
+from api.models import (
+    Appointment, DailyAppointmentStats, DailyOrderStats, Department, Doctor, Order, User, WebsiteSetup
+)
+
+
+class TenantDeletionTests(TestCase):
+    """Deleting a tenant cascades through its orders and appointments without recreating rollups"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='owner@example.com', username='owner', name='Owner',
+            business_type='hospital', password='password',
+        )
+        self.setup = WebsiteSetup.objects.create(user=self.user)
+        department = Department.objects.create(website_setup=self.setup, name='Cardiology')
+        doctor = Doctor.objects.create(
+            department=department, name='Hany', title='Dr.', specialization='Cardiology',
+            email='hany@example.com', experience='10 years',
+        )
+        Order.objects.create(
+            website_setup=self.setup, order_number='ORD-1', customer_name='Mona', total=Decimal('25.00'),
+        )
+        Appointment.objects.create(
+            website_setup=self.setup, reference='APT-1', department=department, doctor=doctor,
+            department_name=department.name, doctor_name=doctor.name, patient_name='Omar',
+            date=date(2030, 1, 6), time=time(10),
+        )
+        self.assertEqual(DailyOrderStats.objects.filter(website_setup=self.setup).count(), 1)
+        self.assertEqual(DailyAppointmentStats.objects.filter(website_setup=self.setup).count(), 1)
+
+    def assertNoRollups(self):
+        self.assertFalse(DailyOrderStats.objects.filter(website_setup_id=self.setup.pk).exists())
+        self.assertFalse(DailyAppointmentStats.objects.filter(website_setup_id=self.setup.pk).exists())
+
+    def test_delete_user(self):
+        self.user.delete()
+        self.assertFalse(WebsiteSetup.objects.filter(pk=self.setup.pk).exists())
+        self.assertNoRollups()
+
+    def test_delete_website_setup(self):
+        self.setup.delete()
+        self.assertNoRollups()
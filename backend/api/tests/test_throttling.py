@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from api.throttling import ReviewIPThrottle, get_store
+
+# One review a minute
+REST_FRAMEWORK = {
+    **settings.REST_FRAMEWORK,
+    'DEFAULT_THROTTLE_RATES': {**settings.REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'], 'review_ip': '1/min'},
+}
+
+
+@override_settings(REST_FRAMEWORK=REST_FRAMEWORK, THROTTLE_STORE_PATH='')
+class ClientIPTests(SimpleTestCase):
+    """Per-IP throttles can't be reset by sending a different X-Forwarded-For"""
+
+    def setUp(self):
+        get_store().clear()
+        self.addCleanup(get_store().clear)
+
+    def allowed(self, forwarded_for):
+        # The proxy appends the address it saw to whatever the client sent
+        request = APIRequestFactory().post(
+            '/', REMOTE_ADDR='10.0.0.2', HTTP_X_FORWARDED_FOR=f'{forwarded_for}, 203.0.113.7'
+        )
+        return ReviewIPThrottle().allow_request(Request(request), None)
+
+    def assertSpoofingIgnored(self):
+        self.assertTrue(self.allowed('198.51.100.1'))
+        self.assertFalse(self.allowed('198.51.100.2'))
+        self.assertFalse(self.allowed('198.51.100.3, 198.51.100.4'))
+
+    def test_without_proxy(self):
+        self.assertSpoofingIgnored()
+
+    def test_behind_proxy(self):
+        with self.settings(REST_FRAMEWORK={**REST_FRAMEWORK, 'NUM_PROXIES': 1}):
+            self.assertSpoofingIgnored()
@@ -0,0 +1,265 @@
+"""
+DRF throttles backed by a store shared between worker processes.
+
+DRF's built-in throttles keep their history in the Django cache, whose
+default file backend does a read and a write per hit with no locking between
+workers. These throttles keep their state in a small SQLite file
+(``THROTTLE_STORE_PATH``) updated in one transaction per hit, so every worker
+on the host sees the same counters without an external service. With an empty
+path they fall back to an in-process store, which is what tests use.
+
+Per-IP throttles key on DRF's ``get_ident()``, which only trusts the
+``X-Forwarded-For`` entries added by ``REST_FRAMEWORK['NUM_PROXIES']`` proxies.
+
+Two algorithms are provided:
+
+* ``TokenBucketThrottle`` allows bursts up to the rate's request count and
+  refills continuously, e.g. ``'5/min'`` is a bucket of 5 refilling one token
+  every 12 seconds.
+* ``SlidingWindowThrottle`` approximates a sliding window from the current
+  and previous fixed-window counters, for longer budgets such as ``'200/hour'``.
+
+Rates are read from ``REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']`` by scope,
+like DRF's ``SimpleRateThrottle``.
+"""
+import hashlib
+import math
+import os
+import random
+import sqlite3
+import threading
+import time
+
+from django.conf import settings
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+DURATIONS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+# Rows idle for longer than this are pruned from the store
+IDLE_EXPIRY = 86400
+
+
+def parse_rate(rate):
+    """``'5/min'`` -> ``(5, 60)``"""
+    num, period = rate.split('/')
+    return int(num), DURATIONS[period[0]]
+
+
+def _bucket(state, now, capacity, refill_rate):
+    """Token bucket step: returns (new_state, wait)"""
+    tokens, updated = state if state else (capacity, now)
+    tokens = min(capacity, tokens + (now - updated) * refill_rate)
+    if tokens >= 1:
+        return (tokens - 1, now), 0
+    return (tokens, now), (1 - tokens) / refill_rate
+
+
+def _window(state, now, limit, window):
+    """Sliding window counter step: returns (new_state, wait)"""
+    current_window = int(now // window)
+    stored_window, current, previous = state if state else (current_window, 0, 0)
+    if stored_window == current_window - 1:
+        current, previous = 0, current
+    elif stored_window != current_window:
+        current, previous = 0, 0
+
+    elapsed = now - current_window * window
+    weight = 1 - elapsed / window
+    if previous * weight + current + 1 <= limit:
+        return (current_window, current + 1, previous), 0
+
+    if current + 1 > limit or previous == 0:
+        wait = window - elapsed
+    else:
+        # Time until the previous window's share decays enough to fit one more
+        wait = (1 - (limit - 1 - current) / previous) * window - elapsed
+    return (current_window, current, previous), max(wait, 0.001)
+
+
+class LocalStore:
+    """Throttle state kept in this process only"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state = {}
+
+    def _step(self, key, step, *args):
+        now = time.time()
+        with self._lock:
+            self._state[key], wait = step(self._state.get(key), now, *args)
+        return wait
+
+    def consume(self, key, capacity, refill_rate):
+        return self._step(key, _bucket, capacity, refill_rate)
+
+    def hit(self, key, limit, window):
+        return self._step(key, _window, limit, window)
+
+    def clear(self):
+        with self._lock:
+            self._state.clear()
+
+
+class SQLiteStore:
+    """Throttle state in a SQLite file shared by every process on the host"""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        # Connections must not cross a fork
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=OFF')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS throttle '
+                '(key TEXT PRIMARY KEY, a REAL, b REAL, c REAL, updated REAL)'
+            )
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _step(self, key, step, *args):
+        now = time.time()
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute(
+                'SELECT a, b, c FROM throttle WHERE key = ?', (key,)
+            ).fetchone()
+            state, wait = step(row and tuple(v for v in row if v is not None), now, *args)
+            state = tuple(state) + (None,) * (3 - len(state))
+            conn.execute(
+                'INSERT INTO throttle (key, a, b, c, updated) VALUES (?, ?, ?, ?, ?) '
+                'ON CONFLICT(key) DO UPDATE SET a = excluded.a, b = excluded.b, '
+                'c = excluded.c, updated = excluded.updated',
+                (key, *state, now)
+            )
+            if random.random() < 0.001:
+                conn.execute('DELETE FROM throttle WHERE updated < ?', (now - IDLE_EXPIRY,))
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        return wait
+
+    def consume(self, key, capacity, refill_rate):
+        return self._step(key, _bucket, capacity, refill_rate)
+
+    def hit(self, key, limit, window):
+        return self._step(key, _window, limit, window)
+
+    def clear(self):
+        self._connection().execute('DELETE FROM throttle')
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                path = settings.THROTTLE_STORE_PATH
+                _store = SQLiteStore(path) if path else LocalStore()
+    return _store
+
+
+class StoreThrottle(BaseThrottle):
+    """Base class for throttles keeping their state in the shared store"""
+    scope = None
+
+    def __init__(self):
+        self.num_requests, self.duration = parse_rate(
+            api_settings.DEFAULT_THROTTLE_RATES[self.scope]
+        )
+        self._wait = None
+
+    def get_cache_key(self, request, view):
+        raise NotImplementedError('.get_cache_key() must be overridden')
+
+    def check(self, store, key):
+        raise NotImplementedError('.check() must be overridden')
+
+    def allow_request(self, request, view):
+        key = self.get_cache_key(request, view)
+        if key is None:
+            return True
+        self._wait = self.check(get_store(), f'{self.scope}:{key}')
+        return self._wait == 0
+
+    def wait(self):
+        return self._wait
+
+
+class TokenBucketThrottle(StoreThrottle):
+    def check(self, store, key):
+        return store.consume(key, self.num_requests, self.num_requests / self.duration)
+
+
+class SlidingWindowThrottle(StoreThrottle):
+    def check(self, store, key):
+        return store.hit(key, self.num_requests, self.duration)
+
+
+class AuthIPThrottle(TokenBucketThrottle):
+    """Short-term burst limit on signup/login per client IP"""
+    scope = 'auth_ip'
+
+    def get_cache_key(self, request, view):
+        return self.get_ident(request)
+
+
+class AuthIPWindowThrottle(SlidingWindowThrottle):
+    """Longer-term budget on signup/login per client IP"""
+    scope = 'auth_ip_window'
+
+    def get_cache_key(self, request, view):
+        return self.get_ident(request)
+
+
+class AuthEmailThrottle(TokenBucketThrottle):
+    """Limit attempts against a single account, whichever IPs they come from"""
+    scope = 'auth_email'
+
+    def get_cache_key(self, request, view):
+        email = request.data.get('email') if hasattr(request.data, 'get') else None
+        if not email or not isinstance(email, str):
+            return None
+        return hashlib.sha1(email.strip().lower().encode()).hexdigest()
+
+
+class CheckoutIPThrottle(TokenBucketThrottle):
+    """Limit anonymous checkouts per client IP"""
+    scope = 'checkout_ip'
+
+    def get_cache_key(self, request, view):
+        return self.get_ident(request)
+
+
+class BookingIPThrottle(TokenBucketThrottle):
+    """Limit anonymous appointment bookings per client IP"""
+    scope = 'booking_ip'
+
+    def get_cache_key(self, request, view):
+        return self.get_ident(request)
+
+
+class ReviewIPThrottle(TokenBucketThrottle):
+    """Limit anonymous doctor reviews per client IP"""
+    scope = 'review_ip'
+
+    def get_cache_key(self, request, view):
+        return self.get_ident(request)
+
+
+def retry_after(waits):
+    """Seconds for a Retry-After header from throttle wait() values"""
+    waits = [wait for wait in waits if wait is not None]
+    return max(1, math.ceil(max(waits))) if waits else None
@@ -6,17 +6,44 @@ from . import views
 router = DefaultRouter()
 router.register(r'website-setups', views.WebsiteSetupViewSet, basename='websitesetup')
 router.register(r'business-info', views.BusinessInfoViewSet, basename='businessinfo')
+router.register(r'products', views.ProductViewSet, basename='product')
+router.register(r'departments', views.DepartmentViewSet, basename='department')
+router.register(r'doctors', views.DoctorViewSet, basename='doctor')
+router.register(r'orders', views.OrderViewSet, basename='order')
+router.register(r'appointments', views.AppointmentViewSet, basename='appointment')
+router.register(r'reviews', views.ReviewViewSet, basename='review')
+router.register(r'payments', views.PaymentViewSet, basename='payment')
 
 urlpatterns = [
     # Root endpoint
     path('', views.api_root, name='api_root'),
     
     # Authentication
-    path('auth/signup/', views.signup, name='signup'),
-    path('auth/login/', views.login, name='login'),
+    path('auth/signup/', views.SignupView.as_view(), name='signup'),
+    path('auth/login/', views.LoginView.as_view(), name='login'),
     path('auth/me/', views.get_current_user, name='get_current_user'),
     path('auth/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     
+    # Dashboard state (user, website setup, business info) in one call
+    path('dashboard/', views.dashboard, name='dashboard'),
+    path('dashboard/stats/', views.stats, name='dashboard_stats'),
+    path('pricing/quote/', views.pricing_quote, name='pricing_quote'),
+    
+    # Payment gateway notifications
+    path('payments/webhooks/<str:provider>/', views.payment_webhook, name='payment_webhook'),
+    
+    # Public (unauthenticated) site data
+    path('public/businesses/open/', views.open_now, name='open_now'),
+    path('public/businesses/nearby/', views.nearby, name='nearby_businesses'),
+    path('public/sites/<uuid:site_id>/', views.site_bundle, name='site_bundle'),
+    path('public/sites/<uuid:site_id>/products/', views.PublicProductList.as_view(), name='public_products'),
+    path('public/sites/<uuid:site_id>/products/search/', views.search_public_products, name='public_product_search'),
+    path('public/sites/<uuid:site_id>/directory/', views.site_directory, name='site_directory'),
+    path('public/sites/<uuid:site_id>/checkout/', views.checkout, name='checkout'),
+    path('public/sites/<uuid:site_id>/doctors/<uuid:doctor_id>/availability/', views.doctor_availability, name='doctor_availability'),
+    path('public/sites/<uuid:site_id>/doctors/<uuid:doctor_id>/appointments/', views.book_doctor_appointment, name='book_appointment'),
+    path('public/sites/<uuid:site_id>/doctors/<uuid:doctor_id>/reviews/', views.PublicDoctorReviews.as_view(), name='doctor_reviews'),
+    
     # Include router URLs
     path('', include(router.urls)),
 ]
@@ -0,0 +1,12 @@
+from .root_views import *
+from .auth_views import *
+from .dashboard_views import *
+from .website_views import *
+from .business_views import *
+from .product_views import *
+from .directory_views import *
+from .order_views import *
+from .appointment_views import *
+from .review_views import *
+from .payment_views import *
+from .public_views import *
\ No newline at end of file
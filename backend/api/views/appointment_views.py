@@ -0,0 +1,127 @@
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import permissions, status, viewsets
+from rest_framework.decorators import (
+    action, api_view, authentication_classes, permission_classes, throttle_classes
+)
+from rest_framework.response import Response
+from api.availability import (
+    SlotUnavailable, appointment_changed, available_slots, book_appointment, get_schedule
+)
+from api.bundles import get_site_bundle
+from api.cache import MISSING
+from api.models import Appointment
+from api.serializers import AppointmentSerializer, BookingSerializer
+from api.stats import appointment_status_changed
+from api.sync import sync_appointments
+from api.throttling import BookingIPThrottle
+from .utils import SiteScopedMixin, ndjson_sync_response
+
+
+class AppointmentViewSet(SiteScopedMixin, viewsets.ReadOnlyModelViewSet):
+    """Appointments booked on the current user's hospital"""
+    serializer_class = AppointmentSerializer
+    filterset_fields = ['status', 'department', 'doctor', 'date']
+    search_fields = ['reference', 'patient_name', 'patient_email', 'doctor_name']
+
+    def get_queryset(self):
+        return Appointment.objects.filter(website_setup__user=self.request.user)
+
+    @action(detail=False, methods=['post'])
+    def sync(self, request):
+        """
+        Upsert ``hospitalAppointments`` entries saved in the browser, streamed
+        as NDJSON and keyed by their ``id``.
+        """
+        return ndjson_sync_response(request, self.website_setup, sync_appointments)
+
+    def _set_status(self, request, new_status):
+        appointment = self.get_object()
+        now = timezone.now()
+        with transaction.atomic():
+            # Conditional, so a concurrent cancel and complete can't both be counted
+            changed = Appointment.objects.filter(pk=appointment.pk, status='pending').update(
+                status=new_status, updated_at=now
+            )
+            if changed:
+                appointment.status, appointment.updated_at = new_status, now
+                appointment_status_changed(appointment, 'pending')
+                if new_status == 'cancelled':
+                    # update() skips the signal that frees the slot in the doctor's schedule
+                    appointment_changed(appointment.doctor_id, appointment.pk)
+        if not changed:
+            return Response(
+                {'error': f'Only pending appointments can be {new_status}.'},
+                status=status.HTTP_409_CONFLICT
+            )
+        return Response(self.get_serializer(appointment).data)
+
+    @action(detail=True, methods=['post'])
+    def cancel(self, request, pk=None):
+        """Cancel a pending appointment and free its slot"""
+        return self._set_status(request, 'cancelled')
+
+    @action(detail=True, methods=['post'])
+    def complete(self, request, pk=None):
+        """Mark a pending appointment as completed"""
+        return self._set_status(request, 'completed')
+
+
+def _doctor_schedule(request, site_id, doctor_id):
+    bundle, version = get_site_bundle(site_id, request)
+    if bundle == MISSING:
+        return None
+    return get_schedule(site_id, doctor_id)
+
+
+@api_view(['GET'])
+@authentication_classes([])
+@permission_classes([permissions.AllowAny])
+def doctor_availability(request, site_id, doctor_id):
+    """Free slots of a doctor over the next ``?days=`` days (default 14)"""
+    schedule = _doctor_schedule(request, site_id, doctor_id)
+    if schedule is None:
+        return Response(
+            {'error': 'Doctor not found'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    try:
+        days = int(request.query_params.get('days', 14))
+    except ValueError:
+        days = 14
+    days = min(max(days, 1), settings.APPOINTMENT_MAX_DAYS_AHEAD)
+
+    slots = available_slots(schedule, days, limit=settings.APPOINTMENT_MAX_SLOTS)
+    return Response({
+        'doctor': str(doctor_id),
+        'duration': schedule.duration,
+        'timezone': str(schedule.tz),
+        'slots': [
+            {'date': day.isoformat(), 'time': clock.strftime('%H:%M')}
+            for day, clock in slots
+        ],
+    })
+
+
+@api_view(['POST'])
+@authentication_classes([])
+@permission_classes([permissions.AllowAny])
+@throttle_classes([BookingIPThrottle])
+def book_doctor_appointment(request, site_id, doctor_id):
+    """Book one of a doctor's free slots; 409 when it is no longer free"""
+    schedule = _doctor_schedule(request, site_id, doctor_id)
+    if schedule is None:
+        return Response(
+            {'error': 'Doctor not found'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    serializer = BookingSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    try:
+        appointment = book_appointment(schedule, serializer.validated_data)
+    except SlotUnavailable as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_409_CONFLICT)
+    return Response(AppointmentSerializer(appointment).data, status=status.HTTP_201_CREATED)
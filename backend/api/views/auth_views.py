@@ -0,0 +1,154 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.http import JsonResponse
+from django.views import View
+from rest_framework import permissions, status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from api.authentication import ClaimsRefreshToken
+from api.hashing import HashQueueFull, hash_password, verify_password
+from api.models import User, WebsiteSetup
+from api.serializers import SignupSerializer, UserSerializer
+from api.throttling import (
+    AuthEmailThrottle, AuthIPThrottle, AuthIPWindowThrottle, retry_after
+)
+
+
+def hash_queue_full_response():
+    """503 returned when the password hashing queue is saturated"""
+    response = JsonResponse(
+        {'error': 'Too many authentication requests. Please retry shortly.'},
+        status=status.HTTP_503_SERVICE_UNAVAILABLE
+    )
+    response['Retry-After'] = str(settings.PASSWORD_HASH_RETRY_AFTER)
+    return response
+
+
+def create_account(serializer, password_hash):
+    """Create the user and their website setup in one transaction"""
+    # Signup is the one place a website setup is created implicitly
+    with transaction.atomic():
+        user = serializer.save(password_hash=password_hash)
+        website_setup = WebsiteSetup.objects.create(user=user)
+    return user, website_setup
+
+
+def token_payload(user):
+    refresh = ClaimsRefreshToken.for_user(user)
+    return {
+        'refresh': str(refresh),
+        'access': str(refresh.access_token),
+    }
+
+
+class AsyncAuthView(View):
+    """
+    Base for the async signup/login views. Throttles run before anything
+    else so over-limit requests never reach password hashing, which is then
+    awaited in a bounded pool so it never blocks other requests.
+    """
+    throttle_classes = [AuthIPThrottle, AuthIPWindowThrottle, AuthEmailThrottle]
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        # Token based API, same as DRF's api_view
+        view.csrf_exempt = True
+        return view
+
+    async def dispatch(self, request, *args, **kwargs):
+        # Handlers get a DRF Request so request.data parses like in DRF views
+        request = Request(request, parsers=[JSONParser(), FormParser(), MultiPartParser()])
+        try:
+            request.data
+        except ParseError as exc:
+            return JsonResponse({'error': str(exc.detail)}, status=status.HTTP_400_BAD_REQUEST)
+
+        waits = await sync_to_async(self.check_throttles)(request)
+        if waits:
+            response = JsonResponse(
+                {'error': 'Too many attempts. Please try again later.'},
+                status=status.HTTP_429_TOO_MANY_REQUESTS
+            )
+            response['Retry-After'] = str(retry_after(waits))
+            return response
+
+        return await super().dispatch(request, *args, **kwargs)
+
+    def check_throttles(self, request):
+        """Return the wait() of every throttle that rejected the request"""
+        waits = []
+        for throttle in (throttle_class() for throttle_class in self.throttle_classes):
+            if not throttle.allow_request(request, self):
+                waits.append(throttle.wait())
+        return waits
+
+
+class SignupView(AsyncAuthView):
+    """User registration endpoint"""
+
+    async def post(self, request):
+        serializer = SignupSerializer(data=request.data)
+        if not await sync_to_async(serializer.is_valid)():
+            return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            password_hash = await hash_password(serializer.validated_data['password'])
+        except HashQueueFull:
+            return hash_queue_full_response()
+
+        user, website_setup = await sync_to_async(create_account)(serializer, password_hash)
+
+        return JsonResponse({
+            'user': UserSerializer(user).data,
+            'tokens': token_payload(user),
+            'website_setup_id': str(website_setup.id),
+        }, status=status.HTTP_201_CREATED)
+
+
+class LoginView(AsyncAuthView):
+    """User login endpoint"""
+
+    async def post(self, request):
+        email = request.data.get('email')
+        password = request.data.get('password')
+        
+        if not email or not password:
+            return JsonResponse(
+                {'error': 'Email and password are required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        user = await User.objects.filter(email=email).afirst()
+        try:
+            if user is None:
+                # Hash anyway so unknown emails take as long as wrong passwords
+                await hash_password(password)
+                valid = False
+            else:
+                valid = await verify_password(user, password)
+        except HashQueueFull:
+            return hash_queue_full_response()
+        
+        if not valid or not user.is_active:
+            return JsonResponse(
+                {'error': 'Invalid email or password'},
+                status=status.HTTP_401_UNAUTHORIZED
+            )
+        
+        return JsonResponse({
+            'user': UserSerializer(user).data,
+            'tokens': token_payload(user),
+        }, status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def get_current_user(request):
+    """Get current authenticated user"""
+    serializer = UserSerializer(request.user)
+    return Response(serializer.data, status=status.HTTP_200_OK)
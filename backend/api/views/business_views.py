@@ -0,0 +1,90 @@
+from rest_framework import permissions, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
+from api.models import BusinessInfo, WebsiteSetup
+from api.serializers import BusinessInfoCreateUpdateSerializer, BusinessInfoSerializer
+
+
+class BusinessInfoViewSet(viewsets.ModelViewSet):
+    """ViewSet for BusinessInfo"""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        """Return business info for the current user's website setup"""
+        return (
+            BusinessInfo.objects
+            .select_related('website_setup')
+            .filter(website_setup__user=self.request.user)
+        )
+
+    def get_serializer_class(self):
+        """Use different serializer for create/update"""
+        if self.action in ['create', 'update', 'partial_update']:
+            return BusinessInfoCreateUpdateSerializer
+        return BusinessInfoSerializer
+
+    def get_object(self):
+        """Get business info for current user's website setup (read-only, never creates)"""
+        return get_object_or_404(self.get_queryset())
+
+    def list(self, request, *args, **kwargs):
+        """Get user's business info"""
+        business_info = self.get_object()
+        serializer = self.get_serializer(business_info, context={'request': request})
+        return Response(serializer.data)
+
+    def retrieve(self, request, *args, **kwargs):
+        """Get user's business info"""
+        business_info = self.get_object()
+        serializer = self.get_serializer(business_info, context={'request': request})
+        return Response(serializer.data)
+
+    def create(self, request, *args, **kwargs):
+        """Create business info for user's website setup"""
+        website_setup = get_object_or_404(
+            WebsiteSetup.objects.select_related('business_info'),
+            user=request.user
+        )
+        
+        # Check if business info already exists
+        if hasattr(website_setup, 'business_info'):
+            return Response(
+                {'error': 'Business info already exists. Use update endpoint.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        business_info = serializer.save(website_setup=website_setup)
+        
+        # Return with full serializer
+        response_serializer = BusinessInfoSerializer(
+            business_info,
+            context={'request': request}
+        )
+        return Response(response_serializer.data, status=status.HTTP_201_CREATED)
+
+    def update(self, request, *args, **kwargs):
+        """Update user's business info"""
+        business_info = self.get_object()
+        serializer = self.get_serializer(business_info, data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        
+        # Return with full serializer
+        response_serializer = BusinessInfoSerializer(
+            business_info,
+            context={'request': request}
+        )
+        return Response(response_serializer.data)
+
+    @action(detail=False, methods=['post'])
+    def publish(self, request):
+        """Publish the website"""
+        business_info = self.get_object()
+        business_info.is_published = True
+        business_info.save()
+        
+        serializer = self.get_serializer(business_info, context={'request': request})
+        return Response(serializer.data, status=status.HTTP_200_OK)
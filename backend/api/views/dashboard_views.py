@@ -0,0 +1,97 @@
+import hashlib
+from datetime import timedelta
+
+from django.conf import settings
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.dateparse import parse_date
+from rest_framework import permissions, status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from api.models import User, WebsiteSetup
+from api.stats import dashboard_stats
+from api.serializers import (
+    BusinessInfoSerializer, UserSerializer, WebsiteSetupSummarySerializer
+)
+from .utils import conditional_response
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def dashboard(request):
+    """User, website setup and business info for the dashboard in one request"""
+    user = (
+        User.objects
+        .select_related('website_setup', 'website_setup__business_info')
+        .get(pk=request.user.pk)
+    )
+    website_setup = getattr(user, 'website_setup', None)
+    business_info = getattr(website_setup, 'business_info', None)
+
+    # Absolute logo URLs depend on the host, so it is part of the validator
+    etag_source = ':'.join(
+        f'{obj.pk}@{obj.updated_at.timestamp()}' if obj is not None else '-'
+        for obj in (user, website_setup, business_info)
+    ) + request.build_absolute_uri('/')
+    etag = '"%s"' % hashlib.md5(etag_source.encode()).hexdigest()
+
+    def payload():
+        return {
+            'user': UserSerializer(user).data,
+            'website_setup': (
+                WebsiteSetupSummarySerializer(website_setup).data
+                if website_setup is not None else None
+            ),
+            'business_info': (
+                BusinessInfoSerializer(business_info, context={'request': request}).data
+                if business_info is not None else None
+            ),
+            'enabled_features': (
+                website_setup.enabled_features if website_setup is not None else []
+            ),
+        }
+
+    response = conditional_response(request, etag, payload)
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ['Authorization'])
+    return response
+
+
+def _date_param(request, name, default):
+    value = request.query_params.get(name)
+    if not value:
+        return default
+    try:
+        parsed = parse_date(value)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValueError(f'{name} must be a date as YYYY-MM-DD.')
+    return parsed
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def stats(request):
+    """
+    Order and appointment statistics of the current user's site between
+    ``?from=`` and ``?to=`` (inclusive, default the last 30 days), read
+    from the daily rollups.
+    """
+    website_setup = get_object_or_404(WebsiteSetup.objects.only('id'), user=request.user)
+    today = timezone.localdate()
+    try:
+        end = _date_param(request, 'to', today)
+        start = _date_param(request, 'from', end - timedelta(days=29))
+    except ValueError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    if start > end:
+        return Response({'error': 'from must not be after to.'}, status=status.HTTP_400_BAD_REQUEST)
+    if (end - start).days >= settings.STATS_MAX_DAYS:
+        return Response(
+            {'error': f'At most {settings.STATS_MAX_DAYS} days can be requested at once.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    return Response(dashboard_stats(website_setup.pk, start, end))
@@ -0,0 +1,69 @@
+from django.conf import settings
+from django.utils.cache import patch_cache_control
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import permissions, status
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
+from rest_framework.response import Response
+from api.bundles import get_site_bundle
+from api.cache import MISSING
+from api.directory import filter_directory, get_directory
+from api.models import Department, Doctor
+from api.serializers import DepartmentSerializer, DoctorSerializer
+from .utils import SiteScopedViewSet, conditional_response
+
+
+class DepartmentViewSet(SiteScopedViewSet):
+    """Departments of the current user's hospital"""
+    serializer_class = DepartmentSerializer
+
+    def get_queryset(self):
+        return Department.objects.filter(website_setup__user=self.request.user)
+
+    def perform_create(self, serializer):
+        serializer.save(website_setup=self.website_setup)
+
+
+class DoctorViewSet(SiteScopedViewSet):
+    """Doctors of the current user's hospital, filterable by department and specialization"""
+    serializer_class = DoctorSerializer
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['department', 'specialization']
+
+    def get_queryset(self):
+        return (
+            Doctor.objects
+            .filter(department__website_setup__user=self.request.user)
+            .select_related('rating')
+        )
+
+
+@api_view(['GET'])
+@authentication_classes([])
+@permission_classes([permissions.AllowAny])
+def site_directory(request, site_id):
+    """
+    Departments of a published site with their doctors nested, plus every
+    specialization on offer. ``?specialization=``, ``?department=<id>`` and
+    ``?q=`` narrow the doctors listed.
+    """
+    bundle, version = get_site_bundle(site_id, request)
+    if bundle == MISSING:
+        return Response(
+            {'error': 'Site not found'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    directory, version = get_directory(site_id, request)
+    params = request.query_params
+    response = conditional_response(
+        request,
+        f'"directory-{site_id}-{version}"',
+        lambda: filter_directory(
+            directory,
+            specialization=params.get('specialization'),
+            department=params.get('department'),
+            query=params.get('q'),
+        ),
+    )
+    patch_cache_control(response, public=True, max_age=settings.SITE_BUNDLE_MAX_AGE)
+    return response
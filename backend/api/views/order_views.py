@@ -0,0 +1,104 @@
+from rest_framework import permissions, status, viewsets
+from rest_framework.decorators import (
+    action, api_view, authentication_classes, permission_classes, throttle_classes
+)
+from rest_framework.response import Response
+from api.bundles import get_site_bundle
+from api.cache import MISSING
+from api.models import Order
+from api.orders import (
+    CheckoutError, IdempotencyConflict, OutOfStock, cancel_order, complete_order, place_order
+)
+from api.serializers import CheckoutSerializer, OrderSerializer
+from api.sync import sync_orders
+from api.throttling import CheckoutIPThrottle
+from .utils import SiteScopedMixin, ndjson_sync_response
+
+
+class OrderViewSet(SiteScopedMixin, viewsets.ReadOnlyModelViewSet):
+    """Orders placed on the current user's pharmacy"""
+    serializer_class = OrderSerializer
+    filterset_fields = ['status', 'payment_method']
+    search_fields = ['order_number', 'customer_name', 'customer_email']
+
+    def get_queryset(self):
+        return (
+            Order.objects
+            .filter(website_setup__user=self.request.user)
+            .prefetch_related('items')
+        )
+
+    @action(detail=False, methods=['post'])
+    def sync(self, request):
+        """
+        Upsert orders saved in the browser (``pharmacyOrders`` entries or
+        ``pharmacy_order_*`` records), streamed as NDJSON and keyed by order number.
+        """
+        return ndjson_sync_response(request, self.website_setup, sync_orders)
+
+    @action(detail=True, methods=['post'])
+    def cancel(self, request, pk=None):
+        """Cancel a pending order and return its units to stock"""
+        order = self.get_object()
+        if not cancel_order(order):
+            return Response(
+                {'error': 'Only pending orders can be cancelled.'},
+                status=status.HTTP_409_CONFLICT
+            )
+        return Response(self.get_serializer(order).data)
+
+    @action(detail=True, methods=['post'])
+    def complete(self, request, pk=None):
+        """Mark a pending order as completed"""
+        order = self.get_object()
+        if not complete_order(order):
+            return Response(
+                {'error': 'Only pending orders can be completed.'},
+                status=status.HTTP_409_CONFLICT
+            )
+        return Response(self.get_serializer(order).data)
+
+
+CHECKOUT_ERROR_STATUS = {
+    OutOfStock: status.HTTP_409_CONFLICT,
+    IdempotencyConflict: status.HTTP_422_UNPROCESSABLE_ENTITY,
+}
+
+
+@api_view(['POST'])
+@authentication_classes([])
+@permission_classes([permissions.AllowAny])
+@throttle_classes([CheckoutIPThrottle])
+def checkout(request, site_id):
+    """
+    Place an order on a published pharmacy site. Send an ``Idempotency-Key``
+    header so that retries return the original order instead of a new one.
+    """
+    bundle, version = get_site_bundle(site_id, request)
+    if bundle == MISSING:
+        return Response(
+            {'error': 'Site not found'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    idempotency_key = request.headers.get('Idempotency-Key', '').strip() or None
+    if idempotency_key and len(idempotency_key) > 64:
+        return Response(
+            {'error': 'Idempotency-Key must be at most 64 characters.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    serializer = CheckoutSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    try:
+        order, created = place_order(site_id, serializer.validated_data, idempotency_key)
+    except CheckoutError as exc:
+        return Response(exc.detail, status=CHECKOUT_ERROR_STATUS[type(exc)])
+
+    response = Response(
+        OrderSerializer(order).data,
+        status=status.HTTP_201_CREATED if created else status.HTTP_200_OK
+    )
+    if not created:
+        response['Idempotent-Replayed'] = 'true'
+    return response
@@ -0,0 +1,44 @@
+from rest_framework import mixins, permissions, status, viewsets
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
+from rest_framework.response import Response
+from api.models import Payment, WebsiteSetup
+from api.payments import InvalidWebhook, receive_event, start_payment
+from api.serializers import PaymentSerializer, StartPaymentSerializer
+from .utils import SiteScopedMixin
+
+
+class PaymentViewSet(SiteScopedMixin, mixins.ListModelMixin, mixins.RetrieveModelMixin,
+                     viewsets.GenericViewSet):
+    """Payments of the current user's website; POST starts a new one"""
+    serializer_class = PaymentSerializer
+
+    def get_queryset(self):
+        return Payment.objects.filter(website_setup__user=self.request.user)
+
+    def create(self, request, *args, **kwargs):
+        serializer = StartPaymentSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        website_setup = WebsiteSetup.objects.only('id', 'total_price', 'is_paid').get(pk=self.website_setup.pk)
+        if website_setup.is_paid:
+            return Response({'error': 'This website is already paid for.'}, status=status.HTTP_409_CONFLICT)
+        if website_setup.total_price <= 0:
+            return Response({'error': 'Nothing to pay for yet.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        payment = start_payment(website_setup, serializer.validated_data['method'])
+        return Response(PaymentSerializer(payment).data, status=status.HTTP_201_CREATED)
+
+
+@api_view(['POST'])
+@authentication_classes([])
+@permission_classes([permissions.AllowAny])
+def payment_webhook(request, provider):
+    """
+    Gateway notification signed with ``X-Signature`` (hex HMAC-SHA256 of the
+    body). Acknowledged as soon as the event is in the inbox; the payment is
+    updated by the worker shortly after.
+    """
+    try:
+        receive_event(provider, request.body, request.headers.get('X-Signature', ''))
+    except InvalidWebhook as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    return Response({'received': True}, status=status.HTTP_202_ACCEPTED)
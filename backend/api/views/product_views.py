@@ -0,0 +1,107 @@
+from django.conf import settings
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import generics, permissions, status
+from rest_framework.decorators import action, api_view, authentication_classes, permission_classes
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from api.bundles import get_site_bundle
+from api.cache import MISSING
+from api.imports import import_products, iter_records, parse_bool
+from api.models import Product
+from api.pagination import ProductCursorPagination
+from api.search import search_products
+from api.serializers import ProductSerializer, PublicProductSerializer
+from .utils import SiteScopedViewSet, upload_stream
+
+
+class ProductViewSet(SiteScopedViewSet):
+    """Catalog management for the current user's pharmacy"""
+    serializer_class = ProductSerializer
+    pagination_class = ProductCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['category', 'in_stock']
+
+    def get_queryset(self):
+        """Return products of the current user's website"""
+        return Product.objects.filter(website_setup__user=self.request.user)
+
+    def perform_create(self, serializer):
+        serializer.save(website_setup=self.website_setup)
+
+    @action(detail=False, methods=['post'], url_path='import')
+    def bulk_import(self, request):
+        """
+        Upsert products by SKU from a CSV (text/csv) or NDJSON
+        (application/x-ndjson) body, or a multipart ``file`` upload.
+        """
+        stream, fmt = upload_stream(request)
+        if fmt is None:
+            return Response(
+                {'error': 'Upload a CSV or NDJSON file.'},
+                status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+            )
+        if stream is None:
+            return Response({'error': 'Empty upload.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        result = import_products(self.website_setup, iter_records(stream, fmt))
+        return Response(result, status=status.HTTP_200_OK)
+
+
+class PublicProductList(generics.ListAPIView):
+    """Catalog of a published site, filterable by category and in_stock"""
+    serializer_class = PublicProductSerializer
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+    pagination_class = ProductCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['category', 'in_stock']
+
+    def get_queryset(self):
+        site_id = self.kwargs['site_id']
+        # Published state comes from the cached site bundle, not a join per page
+        bundle, version = get_site_bundle(site_id, self.request)
+        if bundle == MISSING:
+            raise NotFound('Site not found')
+        return Product.objects.filter(website_setup_id=site_id)
+
+
+def _int_param(request, name, default, maximum):
+    try:
+        return min(max(int(request.query_params.get(name, default)), 0), maximum)
+    except ValueError:
+        return default
+
+
+@api_view(['GET'])
+@authentication_classes([])
+@permission_classes([permissions.AllowAny])
+def search_public_products(request, site_id):
+    """
+    Search-as-you-type over a published site's catalog.
+
+    ``?q=`` matches product name, category and description by word prefix or
+    infix; ``category`` and ``in_stock`` filter the results. Responses carry
+    the total ``count``, a ranked page (``limit``/``offset``) and category
+    facet counts.
+    """
+    bundle, version = get_site_bundle(site_id, request)
+    if bundle == MISSING:
+        return Response(
+            {'error': 'Site not found'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    try:
+        in_stock = parse_bool(request.query_params.get('in_stock'), default=None)
+    except ValueError:
+        return Response({'in_stock': ['Must be a boolean.']}, status=status.HTTP_400_BAD_REQUEST)
+
+    result = search_products(
+        site_id,
+        request.query_params.get('q', ''),
+        category=request.query_params.get('category') or None,
+        in_stock=in_stock,
+        limit=_int_param(request, 'limit', 20, settings.SEARCH_MAX_RESULTS),
+        offset=_int_param(request, 'offset', 0, 10000),
+    )
+    return Response(result)
@@ -0,0 +1,110 @@
+from django.conf import settings
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.utils.dateparse import parse_datetime
+from rest_framework import permissions, status
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
+from rest_framework.response import Response
+from api.bundles import get_site_bundle
+from api.cache import MISSING
+from api.geo import nearby_businesses
+from api.models import User
+from api.opening import open_businesses
+from .utils import conditional_response
+
+
+@api_view(['GET'])
+@authentication_classes([])
+@permission_classes([permissions.AllowAny])
+def site_bundle(request, site_id):
+    """Public, cached bundle of everything a published site needs to render"""
+    bundle, version = get_site_bundle(site_id, request)
+    if bundle == MISSING:
+        return Response(
+            {'error': 'Site not found'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    response = conditional_response(request, f'"{site_id}-{version}"', lambda: bundle)
+    patch_cache_control(response, public=True, max_age=settings.SITE_BUNDLE_MAX_AGE)
+    return response
+
+
+def _business_type(request):
+    """``?business_type=`` if valid, None when absent; raises ValueError otherwise"""
+    business_type = request.query_params.get('business_type') or None
+    if business_type and business_type not in dict(User._meta.get_field('business_type').choices):
+        raise ValueError('business_type must be "hospital" or "pharmacy".')
+    return business_type
+
+
+@api_view(['GET'])
+@authentication_classes([])
+@permission_classes([permissions.AllowAny])
+def open_now(request):
+    """
+    Published businesses open now, or at ``?at=<ISO datetime>``, optionally
+    filtered by ``?business_type=pharmacy|hospital``.
+    """
+    try:
+        business_type = _business_type(request)
+    except ValueError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+    moment = None
+    if request.query_params.get('at'):
+        try:
+            moment = parse_datetime(request.query_params['at'])
+        except ValueError:
+            moment = None
+        if moment is None:
+            return Response(
+                {'error': 'at must be an ISO 8601 datetime.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if timezone.is_naive(moment):
+            moment = timezone.make_aware(moment)
+
+    results = open_businesses(moment, business_type)
+    response = Response({'count': len(results), 'results': results})
+    if moment is None:
+        patch_cache_control(response, public=True, max_age=settings.OPEN_NOW_MAX_AGE)
+    return response
+
+
+@api_view(['GET'])
+@authentication_classes([])
+@permission_classes([permissions.AllowAny])
+def nearby(request):
+    """
+    Published businesses nearest to ``?lat=&lng=``, within ``?radius=`` km,
+    optionally only ``?business_type=`` and those ``?open_now=true``.
+    """
+    params = request.query_params
+    try:
+        business_type = _business_type(request)
+    except ValueError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        latitude, longitude = float(params['lat']), float(params['lng'])
+        radius = float(params.get('radius', settings.NEARBY_DEFAULT_RADIUS_KM))
+        limit = int(params.get('limit', 20))
+    except (KeyError, ValueError):
+        return Response(
+            {'error': 'lat and lng are required; lat, lng, radius and limit must be numbers.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        return Response(
+            {'error': 'lat must be within -90..90 and lng within -180..180.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    radius = min(max(radius, 0.0), settings.NEARBY_MAX_RADIUS_KM)
+    limit = min(max(limit, 1), settings.NEARBY_MAX_RESULTS)
+
+    site_ids = None
+    if params.get('open_now') in ('1', 'true', 'True'):
+        site_ids = {business['site_id'] for business in open_businesses(business_type=business_type)}
+
+    results = nearby_businesses(latitude, longitude, radius, limit, business_type, site_ids)
+    return Response({'count': len(results), 'results': results})
@@ -0,0 +1,76 @@
+from django.utils.functional import cached_property
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import generics, mixins, permissions, viewsets
+from rest_framework.exceptions import NotFound
+from api.features import site_features
+from api.models import Doctor, Review
+from api.pagination import ReviewCursorPagination
+from api.reviews import add_review, delete_review, rating_data
+from api.serializers import PublicReviewSerializer, ReviewSerializer
+from api.throttling import ReviewIPThrottle
+from .utils import SiteScopedMixin
+
+
+class ReviewViewSet(SiteScopedMixin, mixins.ListModelMixin, mixins.RetrieveModelMixin,
+                    mixins.DestroyModelMixin, viewsets.GenericViewSet):
+    """Reviews of the current user's doctors; owners can remove them"""
+    serializer_class = ReviewSerializer
+    pagination_class = ReviewCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['doctor', 'rating']
+
+    def get_queryset(self):
+        return (
+            Review.objects
+            .filter(website_setup__user=self.request.user)
+            .select_related('doctor')
+        )
+
+    def perform_destroy(self, instance):
+        delete_review(instance)
+
+
+class PublicDoctorReviews(generics.ListCreateAPIView):
+    """
+    Reviews of a doctor on a published site with the review system on,
+    newest first, with the doctor's rating summary. POST adds a review.
+    """
+    serializer_class = PublicReviewSerializer
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+    pagination_class = ReviewCursorPagination
+    filter_backends = []
+
+    def get_throttles(self):
+        if self.request.method == 'POST':
+            return [ReviewIPThrottle()]
+        return []
+
+    @cached_property
+    def doctor(self):
+        site_id = self.kwargs['site_id']
+        features = site_features(site_id)
+        if features is None:
+            raise NotFound('Site not found')
+        if not features.has('review_system'):
+            raise NotFound('Reviews are not enabled for this site')
+        doctor = (
+            Doctor.objects
+            .filter(pk=self.kwargs['doctor_id'], department__website_setup_id=site_id)
+            .select_related('rating')
+            .first()
+        )
+        if doctor is None:
+            raise NotFound('Doctor not found')
+        return doctor
+
+    def get_queryset(self):
+        return Review.objects.filter(doctor=self.doctor)
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        response.data['rating'] = rating_data(self.doctor)
+        return response
+
+    def perform_create(self, serializer):
+        serializer.instance = add_review(self.doctor, self.kwargs['site_id'], serializer.validated_data)
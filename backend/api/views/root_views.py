@@ -0,0 +1,71 @@
+from rest_framework import permissions
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+
+
+@api_view(['GET'])
+@permission_classes([permissions.AllowAny])
+def api_root(request):
+    """Root endpoint showing API information"""
+    return Response({
+        'message': 'Medify Backend API',
+        'version': '1.0.0',
+        'endpoints': {
+            'authentication': {
+                'signup': '/api/auth/signup/',
+                'login': '/api/auth/login/',
+                'me': '/api/auth/me/',
+                'refresh': '/api/auth/refresh/',
+            },
+            'dashboard': '/api/dashboard/',
+            'dashboard_stats': '/api/dashboard/stats/?from=<YYYY-MM-DD>&to=<YYYY-MM-DD>',
+            'pricing_quote': '/api/pricing/quote/?features=<name,...>&template_id=<id>',
+            'website_setup': {
+                'get': '/api/website-setups/',
+                'create': '/api/website-setups/',
+                'update': '/api/website-setups/',
+            },
+            'business_info': {
+                'get': '/api/business-info/',
+                'create': '/api/business-info/',
+                'update': '/api/business-info/',
+                'publish': '/api/business-info/publish/',
+            },
+            'products': {
+                'list': '/api/products/',
+                'create': '/api/products/',
+                'import': '/api/products/import/',
+            },
+            'departments': '/api/departments/',
+            'doctors': '/api/doctors/',
+            'orders': {
+                'list': '/api/orders/',
+                'sync': '/api/orders/sync/',
+            },
+            'appointments': {
+                'list': '/api/appointments/',
+                'sync': '/api/appointments/sync/',
+            },
+            'reviews': {
+                'list': '/api/reviews/',
+            },
+            'payments': {
+                'list': '/api/payments/',
+                'webhook': '/api/payments/webhooks/<provider>/',
+            },
+            'public': {
+                'open_now': '/api/public/businesses/open/',
+                'nearby': '/api/public/businesses/nearby/?lat=<lat>&lng=<lng>',
+                'site_bundle': '/api/public/sites/<site_id>/',
+                'products': '/api/public/sites/<site_id>/products/',
+                'product_search': '/api/public/sites/<site_id>/products/search/?q=<query>',
+                'directory': '/api/public/sites/<site_id>/directory/',
+                'checkout': '/api/public/sites/<site_id>/checkout/',
+                'doctor_availability': '/api/public/sites/<site_id>/doctors/<doctor_id>/availability/',
+                'book_appointment': '/api/public/sites/<site_id>/doctors/<doctor_id>/appointments/',
+                'doctor_reviews': '/api/public/sites/<site_id>/doctors/<doctor_id>/reviews/',
+            },
+            'admin': '/admin/',
+        },
+        'documentation': 'See README.md for detailed API documentation',
+    })
@@ -0,0 +1,59 @@
+from django.utils.functional import cached_property
+from rest_framework import permissions, status, viewsets
+from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
+from api.imports import detect_format, iter_ndjson
+from api.models import WebsiteSetup
+
+
+def upload_stream(request):
+    """
+    ``(stream, format)`` for a raw CSV/NDJSON request body or a multipart
+    ``file`` upload. ``format`` is None when the type is not supported.
+    """
+    upload = request.FILES.get('file') if request.content_type.startswith('multipart/') else None
+    if upload is not None:
+        return upload, detect_format(upload.content_type, upload.name.lower())
+    return request.stream, detect_format(request.content_type)
+
+
+def ndjson_sync_response(request, website_setup, sync):
+    """Run ``sync(website_setup, records)`` over an NDJSON upload"""
+    stream, fmt = upload_stream(request)
+    if fmt != 'ndjson':
+        return Response(
+            {'error': 'Upload newline-delimited JSON (application/x-ndjson).'},
+            status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+        )
+    if stream is None:
+        return Response({'error': 'Empty upload.'}, status=status.HTTP_400_BAD_REQUEST)
+    return Response(sync(website_setup, iter_ndjson(stream)), status=status.HTTP_200_OK)
+
+
+def conditional_response(request, etag, payload):
+    """Return 304 when the client already has ``etag``, else ``payload()``"""
+    if etag in request.META.get('HTTP_IF_NONE_MATCH', ''):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(payload(), status=status.HTTP_200_OK)
+    response['ETag'] = etag
+    return response
+
+
+class SiteScopedMixin:
+    """Gives viewsets the current user's website as ``self.website_setup``"""
+    permission_classes = [permissions.IsAuthenticated]
+
+    @cached_property
+    def website_setup(self):
+        return get_object_or_404(WebsiteSetup.objects.only('id'), user=self.request.user)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action in ['create', 'update', 'partial_update']:
+            context['website_setup'] = self.website_setup
+        return context
+
+
+class SiteScopedViewSet(SiteScopedMixin, viewsets.ModelViewSet):
+    """Base for CRUD on rows belonging to the current user's website"""
@@ -0,0 +1,77 @@
+from rest_framework import permissions, status, viewsets
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
+from api.models import WebsiteSetup
+from api.pricing import feature_mask, quote
+from api.serializers import WebsiteSetupSerializer
+
+
+class WebsiteSetupViewSet(viewsets.ModelViewSet):
+    """ViewSet for WebsiteSetup"""
+    serializer_class = WebsiteSetupSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        """Return website setup for the current user"""
+        return WebsiteSetup.objects.select_related('user').filter(user=self.request.user)
+
+    def get_object(self):
+        """Get website setup for current user (read-only, never creates)"""
+        return get_object_or_404(self.get_queryset())
+
+    def list(self, request, *args, **kwargs):
+        """Get user's website setup"""
+        setup = self.get_object()
+        serializer = self.get_serializer(setup)
+        return Response(serializer.data)
+
+    def retrieve(self, request, *args, **kwargs):
+        """Get user's website setup"""
+        setup = self.get_object()
+        serializer = self.get_serializer(setup)
+        return Response(serializer.data)
+
+    def create(self, request, *args, **kwargs):
+        """Create website setup for users that did not get one at signup"""
+        if WebsiteSetup.objects.filter(user=request.user).exists():
+            return Response(
+                {'error': 'Website setup already exists. Use update endpoint.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save(user=request.user)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def update(self, request, *args, **kwargs):
+        """Update user's website setup"""
+        setup = self.get_object()
+        serializer = self.get_serializer(setup, data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data)
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def pricing_quote(request):
+    """
+    Itemized price of ``?features=review_system,ai_chatbot`` and optional
+    ``?template_id=`` for the current user's business type. Answered from
+    memory, so the setup wizards can ask on every toggle.
+    """
+    template_id = request.query_params.get('template_id') or None
+    if template_id is not None and not template_id.isdigit():
+        return Response(
+            {'error': 'template_id must be an integer.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    names = request.query_params.get('features', '').split(',')
+    try:
+        mask = feature_mask(name.strip() for name in names if name.strip())
+        payload = quote(request.user.business_type, mask, template_id and int(template_id))
+    except ValueError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    return Response(payload)
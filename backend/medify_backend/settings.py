@@ -6,6 +6,8 @@ from pathlib import Path
 from datetime import timedelta
 from decouple import config
 import os
+import tempfile
+from django.core.exceptions import ImproperlyConfigured
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -22,8 +24,10 @@ DEBUG = config('DEBUG', default=True, cast=bool)
 
 ALLOWED_HOSTS = config('ALLOWED_HOSTS', default='localhost,127.0.0.1').split(',')
 
+HOSTED = bool(config('RAILWAY_ENVIRONMENT', default='') or config('RENDER', default=''))
+
 # Allow Railway and Render hosts
-if config('RAILWAY_ENVIRONMENT', default='') or config('RENDER', default=''):
+if HOSTED:
     ALLOWED_HOSTS.append('.railway.app')
     ALLOWED_HOSTS.append('.onrender.com')
     ALLOWED_HOSTS.append('*')  # For initial deployment testing
@@ -107,6 +111,44 @@ else:
     }
 
 
+# Cache
+# The shared cache must be visible to every worker for site version bumps
+# (api/cache.py) and token versions (api/authentication.py) to take effect
+# everywhere. The default file cache is shared by the workers on this host; use
+# django.core.cache.backends.redis.RedisCache when running on several hosts.
+# Redis also has an atomic incr, which lets workers update their search indexes
+# and doctor schedules in place instead of rebuilding them after each change.
+CACHE_BACKEND = config('CACHE_BACKEND', default='django.core.cache.backends.filebased.FileBasedCache')
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKEND,
+        'LOCATION': config('CACHE_LOCATION', default=os.path.join(tempfile.gettempdir(), 'medify-cache')),
+    }
+}
+if CACHE_BACKEND.endswith('.LocMemCache') and not DEBUG:
+    raise ImproperlyConfigured(
+        'LocMemCache is per process; set CACHE_BACKEND to a cache shared by all workers.'
+    )
+
+# Public site bundles (api/bundles.py)
+SITE_BUNDLE_LOCAL_CACHE_SIZE = config('SITE_BUNDLE_LOCAL_CACHE_SIZE', default=1024, cast=int)
+SITE_BUNDLE_CACHE_TIMEOUT = config('SITE_BUNDLE_CACHE_TIMEOUT', default=86400, cast=int)
+SITE_BUNDLE_MAX_AGE = config('SITE_BUNDLE_MAX_AGE', default=0, cast=int)
+# Origin of the absolute media URLs in cached bundles and directories, e.g.
+# https://api.example.com. Railway and Render provide it; when empty the
+# requested host is used, which is only safe with an explicit ALLOWED_HOSTS.
+PUBLIC_ORIGIN = config('PUBLIC_ORIGIN', default=(
+    f"https://{config('RAILWAY_PUBLIC_DOMAIN')}" if config('RAILWAY_PUBLIC_DOMAIN', default='')
+    else config('RENDER_EXTERNAL_URL', default='')
+))
+# Browser/CDN caching of the "open now" listing, which changes at most once a minute
+OPEN_NOW_MAX_AGE = config('OPEN_NOW_MAX_AGE', default=30, cast=int)
+# Nearby business search (km)
+NEARBY_DEFAULT_RADIUS_KM = 10
+NEARBY_MAX_RADIUS_KM = 100
+NEARBY_MAX_RESULTS = 100
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -126,6 +168,13 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing for signup/login runs in a bounded thread pool (api/hashing.py).
+# Requests beyond workers + queue depth get a 503 with Retry-After.
+PASSWORD_HASH_WORKERS = config('PASSWORD_HASH_WORKERS', default=0, cast=int)  # 0 = CPU count
+PASSWORD_HASH_QUEUE_DEPTH = config('PASSWORD_HASH_QUEUE_DEPTH', default=32, cast=int)
+PASSWORD_HASH_RETRY_AFTER = config('PASSWORD_HASH_RETRY_AFTER', default=2, cast=int)
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
 
@@ -151,6 +200,53 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Media serving (api/media.py). With a front proxy set MEDIA_ACCEL_REDIRECT_PREFIX
+# to an nginx `internal` location aliased to MEDIA_ROOT, or MEDIA_SENDFILE_HEADER
+# to X-Sendfile for Apache/lighttpd, so the proxy sends the bytes.
+SERVE_MEDIA = config('SERVE_MEDIA', default=True, cast=bool)
+MEDIA_MAX_AGE = config('MEDIA_MAX_AGE', default=3600, cast=int)
+MEDIA_ACCEL_REDIRECT_PREFIX = config('MEDIA_ACCEL_REDIRECT_PREFIX', default='')
+MEDIA_SENDFILE_HEADER = config('MEDIA_SENDFILE_HEADER', default='')
+
+# Rows written per INSERT ... ON CONFLICT statement by the product import
+PRODUCT_IMPORT_BATCH_SIZE = config('PRODUCT_IMPORT_BATCH_SIZE', default=1000, cast=int)
+
+# Orders/appointments synced from localStorage are upserted this many at a time
+SYNC_BATCH_SIZE = config('SYNC_BATCH_SIZE', default=1000, cast=int)
+# Longest range /api/dashboard/stats/ answers, in days
+STATS_MAX_DAYS = 366
+
+# Appointment availability (api/availability.py)
+APPOINTMENT_SLOT_MINUTES = config('APPOINTMENT_SLOT_MINUTES', default=30, cast=int)
+APPOINTMENT_MAX_DAYS_AHEAD = config('APPOINTMENT_MAX_DAYS_AHEAD', default=90, cast=int)
+APPOINTMENT_MAX_SLOTS = 200
+SCHEDULE_CACHE_SIZE = config('SCHEDULE_CACHE_SIZE', default=2048, cast=int)
+
+# Product search (api/search.py): per-process indexes kept for the most
+# recently searched sites, built in the background when cold
+SEARCH_INDEX_MAX_SITES = config('SEARCH_INDEX_MAX_SITES', default=64, cast=int)
+SEARCH_INDEX_WORKERS = config('SEARCH_INDEX_WORKERS', default=1, cast=int)
+SEARCH_INDEX_ASYNC = config('SEARCH_INDEX_ASYNC', default=True, cast=bool)
+SEARCH_MAX_RESULTS = 100
+
+# Payment webhooks (api/payments.py): HMAC secrets shared with each gateway.
+# Webhooks of a provider without a secret are rejected; for local development
+# set any value and api.payments.FakeGateway signs with it.
+PAYMENT_WEBHOOK_SECRETS = {
+    'visa': config('PAYMENT_WEBHOOK_SECRET_VISA', default=''),
+    'fawry': config('PAYMENT_WEBHOOK_SECRET_FAWRY', default=''),
+}
+PAYMENT_EVENT_BATCH_SIZE = config('PAYMENT_EVENT_BATCH_SIZE', default=200, cast=int)
+# Apply events in a background thread of the web process; turn off when
+# running `manage.py process_payment_events --loop` as a separate worker
+PAYMENT_EVENTS_IN_PROCESS = config('PAYMENT_EVENTS_IN_PROCESS', default=True, cast=bool)
+
+# Image variants (api/images.py): widths generated for logos and photos, and
+# the size of the background pool producing them
+IMAGE_VARIANT_WIDTHS = [64, 128, 256, 512]
+IMAGE_WORKERS = config('IMAGE_WORKERS', default=2, cast=int)
+IMAGE_PIPELINE_ASYNC = config('IMAGE_PIPELINE_ASYNC', default=True, cast=bool)
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
@@ -162,7 +258,7 @@ AUTH_USER_MODEL = 'api.User'
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.ClaimsJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -174,8 +270,28 @@ REST_FRAMEWORK = {
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
+    # Proxies in front of the app that append to X-Forwarded-For (Railway and
+    # Render have one). Per-IP throttles trust only the entries they added;
+    # with 0 they use REMOTE_ADDR.
+    'NUM_PROXIES': config('NUM_PROXIES', default=1 if HOSTED else 0, cast=int),
+    # Scopes used by the throttles in api/throttling.py
+    'DEFAULT_THROTTLE_RATES': {
+        'auth_ip': config('THROTTLE_AUTH_IP', default='20/min'),
+        'auth_ip_window': config('THROTTLE_AUTH_IP_WINDOW', default='200/hour'),
+        'auth_email': config('THROTTLE_AUTH_EMAIL', default='5/min'),
+        'checkout_ip': config('THROTTLE_CHECKOUT_IP', default='30/min'),
+        'booking_ip': config('THROTTLE_BOOKING_IP', default='30/min'),
+        'review_ip': config('THROTTLE_REVIEW_IP', default='10/min'),
+    },
 }
 
+# SQLite file holding throttle counters, shared by all workers on the host.
+# Leave empty to keep counters per-process (e.g. in tests).
+THROTTLE_STORE_PATH = config(
+    'THROTTLE_STORE_PATH',
+    default=os.path.join(tempfile.gettempdir(), 'medify-throttle.sqlite3')
+)
+
 # JWT Settings
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(days=7),
@@ -183,8 +299,13 @@ SIMPLE_JWT = {
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
     'AUTH_HEADER_TYPES': ('Bearer',),
+    'TOKEN_REFRESH_SERIALIZER': 'api.authentication.ClaimsTokenRefreshSerializer',
 }
 
+# How long a user's token version stays cached; bounds how long claims may be
+# trusted if an invalidation is missed (e.g. with a per-process cache)
+USER_TOKEN_VERSION_CACHE_TIMEOUT = config('USER_TOKEN_VERSION_CACHE_TIMEOUT', default=300, cast=int)
+
 # CORS Settings (for Next.js frontend)
 FRONTEND_URL = config('FRONTEND_URL', default='http://localhost:3000')
 CORS_ALLOWED_ORIGINS = [
@@ -2,11 +2,11 @@
 URL configuration for medify_backend project.
 """
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
-from django.conf.urls.static import static
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
+from api.media import serve_media
 
 @require_http_methods(["GET"])
 def root_view(request):
@@ -24,7 +24,10 @@ urlpatterns = [
     path('api/', include('api.urls')),
 ]
 
-# Serve media files in development
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+# Serve media files (conditional GET, ranges, X-Accel-Redirect/X-Sendfile offload).
+# Disable with SERVE_MEDIA=False when the front proxy serves MEDIA_ROOT itself.
+if settings.SERVE_MEDIA:
+    urlpatterns += [
+        re_path(r'^%s(?P<path>.+)$' % settings.MEDIA_URL.lstrip('/'), serve_media, name='media'),
+    ]
 
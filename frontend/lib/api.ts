@@ -113,6 +113,23 @@ export const authApi = {
   },
 }
 
+// Dashboard bootstrap: user, website setup and business info in one request
+export const dashboardApi = {
+  get: async () => {
+    return apiRequest<{
+      user: {
+        id: string
+        email: string
+        name: string
+        business_type: string
+      }
+      website_setup: any | null
+      business_info: any | null
+      enabled_features: string[]
+    }>('/dashboard/')
+  },
+}
+
 // Website Setup API functions
 export const websiteSetupApi = {
   get: async () => {
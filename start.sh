@@ -13,4 +13,4 @@ python manage.py migrate
 python manage.py collectstatic --no-input
 
 # Start gunicorn
-gunicorn medify_backend.wsgi:application --bind 0.0.0.0:$PORT
+gunicorn medify_backend.asgi:application -k uvicorn.workers.UvicornWorker --bind 0.0.0.0:$PORT